@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.0/ref/settings/
 """
 
+import copy
 import os
 from pathlib import Path
 
@@ -46,12 +47,21 @@ INSTALLED_APPS = [
     'recipe',
 ]
 
+# Swagger UI and the drf-spectacular app are for development; production
+# workers turn them off so startup skips the schema machinery. /api/schema/
+# keeps serving the document, ideally pre-built (see API_SCHEMA_FILE).
+API_DOCS_ENABLED = os.environ.get('API_DOCS_ENABLED', 'true').lower() == 'true'
+if not API_DOCS_ENABLED:
+    INSTALLED_APPS.remove('drf_spectacular')
+
 MIDDLEWARE = [
+    'core.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -88,9 +98,89 @@ DATABASES = {
         'PASSWORD': os.environ.get('DB_PASSWORD'),
         'HOST': os.environ.get('DB_HOST'),
         'PORT': os.environ.get('DB_PORT'),
+        'CONN_HEALTH_CHECKS': os.environ.get('DB_CONN_HEALTH_CHECKS', 'true').lower() == 'true',
+        'OPTIONS': {},
     }
 }
 
+# Connection reuse. By default every worker keeps a psycopg pool of
+# DB_POOL_MIN_SIZE..DB_POOL_MAX_SIZE connections; requests wait up to
+# DB_POOL_TIMEOUT seconds for a free one. Connections are recycled after
+# DB_POOL_MAX_LIFETIME seconds and idle ones above the minimum are closed after
+# DB_POOL_MAX_IDLE seconds. Django checks pooled connections before handing
+# them out when CONN_HEALTH_CHECKS is on. With DB_POOL=false each thread
+# instead keeps one persistent connection for DB_CONN_MAX_AGE seconds; Django
+# does not allow both at once.
+
+DB_POOL = os.environ.get('DB_POOL', 'true').lower() == 'true'
+
+if DB_POOL:
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+        'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+        'timeout': float(os.environ.get('DB_POOL_TIMEOUT', 10)),
+        'max_lifetime': float(os.environ.get('DB_POOL_MAX_LIFETIME', 1800)),
+        'max_idle': float(os.environ.get('DB_POOL_MAX_IDLE', 300)),
+    }
+else:
+    DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('DB_CONN_MAX_AGE', 60))
+
+# Read replicas. DB_REPLICA_HOSTS is a comma-separated list of host[:port]
+# entries that share the primary's database name and credentials unless
+# DB_REPLICA_NAME/DB_REPLICA_USER/DB_REPLICA_PASSWORD say otherwise. Safe
+# requests read from a random replica, except that a user who wrote in the
+# last DB_REPLICA_STICKY_SECONDS keeps reading from the primary so they see
+# their own changes. Under tests the replicas mirror `default`.
+
+DATABASE_REPLICAS: list[str] = []
+
+for index, replica in enumerate(filter(None, os.environ.get('DB_REPLICA_HOSTS', '').split(','))):
+    host, _, port = replica.strip().partition(':')
+    DATABASES[f'replica_{index}'] = {
+        **DATABASES['default'],
+        'NAME': os.environ.get('DB_REPLICA_NAME', DATABASES['default']['NAME']),
+        'USER': os.environ.get('DB_REPLICA_USER', DATABASES['default']['USER']),
+        'PASSWORD': os.environ.get('DB_REPLICA_PASSWORD', DATABASES['default']['PASSWORD']),
+        'HOST': host,
+        'PORT': port or DATABASES['default']['PORT'],
+        'OPTIONS': copy.deepcopy(DATABASES['default']['OPTIONS']),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(f'replica_{index}')
+
+DATABASE_ROUTERS = ['core.routers.PrimaryReplicaRouter']
+
+DB_REPLICA_STICKY_SECONDS = int(os.environ.get('DB_REPLICA_STICKY_SECONDS', 10))
+DB_REPLICA_STICKY_CACHE_ALIAS = 'default'
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+#
+# The local-memory default is per process. Deployments running several
+# workers must point CACHE_BACKEND/CACHE_LOCATION at a shared backend so
+# invalidations reach every worker.
+
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache')
+
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKEND,
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'recipe-api'),
+    }
+}
+
+if CACHE_BACKEND.endswith('LocMemCache'):
+    CACHES['default']['OPTIONS'] = {
+        'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', 10000)),
+    }
+
+AUTH_TOKEN_CACHE_ALIAS = 'default'
+AUTH_TOKEN_CACHE_TIMEOUT = int(os.environ.get('AUTH_TOKEN_CACHE_TIMEOUT', 300))
+
+RESPONSE_CACHE_ALIAS = 'default'
+RESPONSE_CACHE_TIMEOUT = int(os.environ.get('RESPONSE_CACHE_TIMEOUT', 600))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -128,6 +218,10 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Uploaded recipe images and their thumbnails.
+MEDIA_URL = '/media/'
+MEDIA_ROOT = os.environ.get('MEDIA_ROOT', str(BASE_DIR / 'media'))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
@@ -136,5 +230,73 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 AUTH_USER_MODEL = 'core.User'
 
 REST_FRAMEWORK = {
-    'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    # Without the docs, views keep DRF's own (already imported) AutoSchema, so
+    # `extend_schema` doesn't pull in drf-spectacular's introspection at startup.
+    'DEFAULT_SCHEMA_CLASS': (
+        'drf_spectacular.openapi.AutoSchema' if API_DOCS_ENABLED else 'rest_framework.schemas.openapi.AutoSchema'
+    ),
+    # Stock renderers that also report their time to the request metrics.
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.TimedJSONRenderer',
+        'core.renderers.TimedBrowsableAPIRenderer',
+    ],
+    # Login and signup throttles, checked before any password is hashed.
+    # Rates take the form `<requests>/<second|minute|hour|day>`.
+    'DEFAULT_THROTTLE_RATES': {
+        'login_ip': os.environ.get('LOGIN_IP_THROTTLE_RATE', '30/minute'),
+        'login_email': os.environ.get('LOGIN_EMAIL_THROTTLE_RATE', '10/minute'),
+        'signup_ip': os.environ.get('SIGNUP_IP_THROTTLE_RATE', '20/hour'),
+        'signup_email': os.environ.get('SIGNUP_EMAIL_THROTTLE_RATE', '5/hour'),
+    },
+    # Number of trusted reverse proxies in front of the app. Throttles only
+    # honour X-Forwarded-For entries added by them; 0 uses REMOTE_ADDR.
+    'NUM_PROXIES': int(os.environ.get('API_NUM_PROXIES', 0)),
+}
+
+# Per-request query count, SQL, serialization and total time, returned in a
+# Server-Timing header and aggregated per route at /metrics.
+REQUEST_METRICS_ENABLED = os.environ.get('REQUEST_METRICS_ENABLED', 'true').lower() == 'true'
+REQUEST_METRICS_SERVER_TIMING = os.environ.get('REQUEST_METRICS_SERVER_TIMING', 'true').lower() == 'true'
+
+# Cache holding the throttles' request histories. Must be shared between
+# workers for the limits to hold across them.
+THROTTLE_CACHE_ALIAS = 'default'
+
+# Default and maximum number of items per page for the cursor-paginated
+# list endpoints. Clients pick a size in between with `?page_size=`.
+API_PAGE_SIZE = int(os.environ.get('API_PAGE_SIZE', 100))
+API_MAX_PAGE_SIZE = int(os.environ.get('API_MAX_PAGE_SIZE', 1000))
+
+# `?with_count=true` adds a total to list responses: exact up to this many
+# rows, a planner estimate or this cap beyond it.
+API_COUNT_LIMIT = int(os.environ.get('API_COUNT_LIMIT', 10000))
+
+# Largest number of operations accepted by one /recipes/bulk/ request.
+RECIPE_BULK_MAX_OPERATIONS = int(os.environ.get('RECIPE_BULK_MAX_OPERATIONS', 1000))
+
+# Rows fetched per server-side cursor round trip by /recipes/export/.
+RECIPE_EXPORT_CHUNK_SIZE = int(os.environ.get('RECIPE_EXPORT_CHUNK_SIZE', 2000))
+
+# Admin changelists count at most this many rows; larger tables report an
+# estimate instead of running COUNT(*) over the whole result.
+ADMIN_COUNT_LIMIT = int(os.environ.get('ADMIN_COUNT_LIMIT', 10000))
+
+# Pre-built OpenAPI document written by `manage.py build_schema`. Without it
+# (or when the file is missing) each worker generates the schema once.
+API_SCHEMA_FILE = os.environ.get('API_SCHEMA_FILE', '')
+
+# Resolve URL patterns, build serializer fields and open database connections
+# when a WSGI/ASGI worker loads, before it accepts traffic.
+WARM_UP_ON_STARTUP = os.environ.get('WARM_UP_ON_STARTUP', 'true').lower() == 'true'
+
+# Recipe image uploads are streamed to disk and refused past this size or
+# pixel count. Thumbnails fit within each size's bounding box and are
+# rendered by a pool of worker processes; 0 workers renders them inline.
+RECIPE_IMAGE_MAX_BYTES = int(os.environ.get('RECIPE_IMAGE_MAX_BYTES', 10 * 1024 * 1024))
+RECIPE_IMAGE_MAX_PIXELS = int(os.environ.get('RECIPE_IMAGE_MAX_PIXELS', 40_000_000))
+RECIPE_IMAGE_SIZES = {
+    'small': 160,
+    'medium': 480,
+    'large': 1280,
 }
+RECIPE_THUMBNAIL_WORKERS = int(os.environ.get('RECIPE_THUMBNAIL_WORKERS', 2))
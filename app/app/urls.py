@@ -14,25 +14,20 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularSwaggerView,
-)
+
+from core.views import MetricsView, SchemaView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path(
         route='api/schema/',
-        view=SpectacularAPIView.as_view(),
+        view=SchemaView.as_view(),
         name='api-schema',
     ),
-    path(
-        route='api/docs/',
-        view=SpectacularSwaggerView.as_view(url_name='api-schema'),
-        name='api-docs',
-    ),
     path(
         route='api/user/',
         view=include('user.urls')
@@ -41,4 +36,25 @@ urlpatterns = [
         route='api/recipes/',
         view=include('recipe.urls')
     ),
+    path(
+        route='api/core/',
+        view=include('core.urls')
+    ),
+    path(
+        route='metrics',
+        view=MetricsView.as_view(),
+        name='metrics',
+    ),
 ]
+
+if settings.API_DOCS_ENABLED:
+    from drf_spectacular.views import SpectacularSwaggerView
+
+    urlpatterns.append(path(
+        route='api/docs/',
+        view=SpectacularSwaggerView.as_view(url_name='api-schema'),
+        name='api-docs',
+    ))
+
+# Only routed when DEBUG; deployments serve MEDIA_ROOT from the web server.
+urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -4,3 +4,17 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self) -> None:
+        from core import signals  # noqa: F401
+        from core.database import pool_stats
+        from core.instrumentation import format_metric, metrics
+
+        metrics.register_collector(lambda: format_metric(
+            'db_pool', 'gauge', 'Connection pool statistics, by database alias.',
+            (
+                ('', {'alias': pool['alias'], 'stat': name}, value)
+                for pool in pool_stats()
+                for name, value in sorted(pool['stats'].items())
+            ),
+        ))
@@ -0,0 +1,174 @@
+import time
+from datetime import datetime
+from functools import partial
+from hashlib import sha256
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.db import transaction
+from django.db.models import Model
+from django.http import HttpRequest
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.authentication import TokenAuthentication, get_authorization_header
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+
+from core.models import User
+
+
+# All a cached lookup keeps of the user: enough for authentication and
+# permission checks, without the password hash or profile.
+TOKEN_USER_FIELDS: tuple[str, ...] = ('id', 'is_active', 'is_staff', 'is_superuser')
+
+
+def get_token_cache() -> BaseCache:
+    return caches[settings.AUTH_TOKEN_CACHE_ALIAS]
+
+
+def _digest(key: str) -> str:
+    # Hash the key so raw credentials never end up in the cache backend.
+    return sha256(key.encode()).hexdigest()
+
+
+def token_cache_key(key: str) -> str:
+    return f'auth-token:{_digest(key)}'
+
+
+def token_version_key(key: str) -> str:
+    return f'auth-token-version:{_digest(key)}'
+
+
+def _initial_version() -> int:
+    # Seeded from the clock, so a version key that was evicted restarts
+    # above any version still stored in cached entries.
+    return time.time_ns() // 1000
+
+
+def _bump_token_versions(keys: list[str]) -> None:
+    cache: BaseCache = get_token_cache()
+    for key in keys:
+        try:
+            cache.incr(token_version_key(key))
+        except ValueError:
+            cache.set(token_version_key(key), _initial_version(), timeout=None)
+    cache.delete_many([token_cache_key(key) for key in keys])
+
+
+def invalidate_tokens(keys: list[str]) -> None:
+    """
+    Drop the cached lookups of some tokens.
+
+    Each token's version is bumped right away and again once the surrounding
+    transaction commits. A request that read the token before the change
+    commits can still fill the cache afterwards, but its entry carries the
+    old version and is never served.
+    """
+    _bump_token_versions(keys)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(partial(_bump_token_versions, keys))
+
+
+def invalidate_token(key: str) -> None:
+    invalidate_tokens([key])
+
+
+def invalidate_user_tokens(user_id: int) -> None:
+    keys: list[str] = list(Token.objects.filter(user_id=user_id).values_list('key', flat=True))
+    if keys:
+        invalidate_tokens(keys)
+
+
+def _from_values(model: type[Model], values: dict) -> Model:
+    """An instance with only `values` loaded and its other fields deferred."""
+    return model.from_db(
+        None,
+        list(values),
+        [values[field.attname] for field in model._meta.concrete_fields if field.attname in values],
+    )
+
+
+def _cache_entry(version: int, token: Token) -> tuple[int, datetime, dict]:
+    return version, token.created, {field: getattr(token.user, field) for field in TOKEN_USER_FIELDS}
+
+
+def _from_cache_entry(key: str, entry: tuple[int, datetime, dict]) -> tuple[User, Token]:
+    user: User = _from_values(User, entry[2])
+    token: Token = _from_values(Token, {'key': key, 'user_id': user.pk, 'created': entry[1]})
+    token.user = user
+
+    return user, token
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Token authentication that serves token-to-user lookups from the cache.
+
+    Entries live for AUTH_TOKEN_CACHE_TIMEOUT seconds and are only served
+    while they match their token's version, which the signal handlers in
+    `core.signals` bump when the token is deleted or its user is saved or
+    deleted. Writes that bypass signals, such as
+    `QuerySet.update()`, must call `invalidate_user_tokens()` themselves.
+
+    Only the user's TOKEN_USER_FIELDS are cached; users served from the cache
+    load any other field from the database on first access.
+    """
+
+    def authenticate_credentials(self, key: str) -> tuple[User, Token]:
+        cache: BaseCache = get_token_cache()
+        cache_key: str = token_cache_key(key)
+        version_key: str = token_version_key(key)
+        cached: dict = cache.get_many([cache_key, version_key])
+        version: int | None = cached.get(version_key)
+        entry: tuple[int, datetime, dict] | None = cached.get(cache_key)
+        if entry is not None and entry[0] == version:
+            return _from_cache_entry(key, entry)
+
+        # Read the version before the token, so an invalidation in between
+        # leaves this fill under an outdated version.
+        if version is None:
+            version = _initial_version()
+            if not cache.add(version_key, version, timeout=None):
+                version = cache.get(version_key, version)
+        user, token = super().authenticate_credentials(key)
+        cache.set(cache_key, _cache_entry(version, token), settings.AUTH_TOKEN_CACHE_TIMEOUT)
+
+        return user, token
+
+    async def aauthenticate(self, request: HttpRequest) -> tuple[User, Token] | None:
+        """Async counterpart of `authenticate()` for plain Django async views."""
+        auth: list[bytes] = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise AuthenticationFailed(_('Invalid token header.'))
+        try:
+            key: str = auth[1].decode()
+        except UnicodeError:
+            raise AuthenticationFailed(_('Invalid token header. Token string should not contain invalid characters.'))
+
+        return await self.aauthenticate_credentials(key)
+
+    async def aauthenticate_credentials(self, key: str) -> tuple[User, Token]:
+        cache: BaseCache = get_token_cache()
+        cache_key: str = token_cache_key(key)
+        version_key: str = token_version_key(key)
+        cached: dict = await cache.aget_many([cache_key, version_key])
+        version: int | None = cached.get(version_key)
+        entry: tuple[int, datetime, dict] | None = cached.get(cache_key)
+        if entry is not None and entry[0] == version:
+            return _from_cache_entry(key, entry)
+
+        if version is None:
+            version = _initial_version()
+            if not await cache.aadd(version_key, version, timeout=None):
+                version = await cache.aget(version_key, version)
+        try:
+            token: Token = await self.get_model().objects.select_related('user').aget(key=key)
+        except self.get_model().DoesNotExist:
+            raise AuthenticationFailed(_('Invalid token.'))
+        if not token.user.is_active:
+            raise AuthenticationFailed(_('User inactive or deleted.'))
+        await cache.aset(cache_key, _cache_entry(version, token), settings.AUTH_TOKEN_CACHE_TIMEOUT)
+
+        return token.user, token
@@ -0,0 +1,34 @@
+import statistics
+import time
+from typing import Callable
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    """Nearest-rank percentile of `samples`."""
+    ordered: list[float] = sorted(samples)
+    rank: int = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+
+    return ordered[rank]
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Summary of latencies in seconds, reported in milliseconds."""
+    return {
+        'count': len(samples),
+        'mean_ms': statistics.fmean(samples) * 1000,
+        'p50_ms': percentile(samples, 50) * 1000,
+        'p95_ms': percentile(samples, 95) * 1000,
+        'p99_ms': percentile(samples, 99) * 1000,
+        'max_ms': max(samples) * 1000,
+    }
+
+
+def measure(function: Callable[[], object], repeat: int) -> list[float]:
+    """Run `function` `repeat` times and return the duration of each run."""
+    samples: list[float] = []
+    for _ in range(repeat):
+        started: float = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+
+    return samples
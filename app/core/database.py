@@ -0,0 +1,12 @@
+from django.db import connections
+
+
+def pool_stats() -> list[dict]:
+    """Counters of every connection pool opened by this worker."""
+    stats: list[dict] = []
+    for alias in connections:
+        pool = getattr(connections[alias], 'pool', None)
+        if pool is not None:
+            stats.append({'alias': alias, 'stats': pool.get_stats()})
+
+    return stats
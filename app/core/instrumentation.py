@@ -0,0 +1,220 @@
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+
+# Upper bounds, in seconds, of the request duration histogram buckets.
+DURATION_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class RequestTimings:
+    """Time spent by one request in SQL and in serialization."""
+
+    def __init__(self) -> None:
+        self.started: float = time.perf_counter()
+        self.queries: int = 0
+        self.db: float = 0.0
+        self.serialize: float = 0.0
+        self._serialize_depth: int = 0
+
+    @property
+    def total(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self, total: float) -> str:
+        return (
+            f'db;dur={self.db * 1000:.2f};desc="{self.queries} queries", '
+            f'serialize;dur={self.serialize * 1000:.2f}, '
+            f'total;dur={total * 1000:.2f}'
+        )
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar('request_timings', default=None)
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Database execute wrapper adding each query to the current request's timings.
+
+    Installed once per connection by `install_query_recorder()` rather than per
+    request, so requests don't pay for setting it up.
+    """
+    timings: RequestTimings | None = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+
+    started: float = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.queries += 1
+        timings.db += time.perf_counter() - started
+
+
+def install_query_recorder(connection: BaseDatabaseWrapper) -> None:
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+@contextmanager
+def collect_timings() -> Iterator[RequestTimings]:
+    timings: RequestTimings = RequestTimings()
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def timed_serialization() -> Iterator[None]:
+    """
+    Count the enclosed block as serialization time of the current request.
+
+    Nested blocks are counted once, and queries run inside the block are left
+    to the database time, so the Server-Timing entries don't overlap.
+    """
+    timings: RequestTimings | None = _current.get()
+    if timings is None or timings._serialize_depth:
+        yield
+        return
+
+    timings._serialize_depth += 1
+    started: float = time.perf_counter()
+    db_before: float = timings.db
+    try:
+        yield
+    finally:
+        timings._serialize_depth -= 1
+        timings.serialize += time.perf_counter() - started - (timings.db - db_before)
+
+
+class TimedRepresentationMixin:
+    """Serializer mixin that reports `to_representation()` as serialization time."""
+
+    def to_representation(self, instance):
+        with timed_serialization():
+            return super().to_representation(instance)
+
+
+class RouteMetrics:
+    def __init__(self) -> None:
+        self.statuses: dict[int, int] = {}
+        self.buckets: list[int] = [0] * len(DURATION_BUCKETS)
+        self.count: int = 0
+        self.duration: float = 0.0
+        self.queries: int = 0
+        self.db: float = 0.0
+        self.serialize: float = 0.0
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_metric(
+    name: str,
+    kind: str,
+    description: str,
+    samples: Iterable[tuple[str, dict[str, str], float]],
+) -> Iterator[str]:
+    """
+    Lines of one metric in the Prometheus text exposition format.
+
+    `samples` are `(name suffix, labels, value)`; the suffix is empty except
+    for the `_bucket`/`_sum`/`_count` series of histograms.
+    """
+    yield f'# HELP {name} {description}'
+    yield f'# TYPE {name} {kind}'
+    for suffix, labels, value in samples:
+        label_text: str = ','.join(f'{key}="{_escape(label)}"' for key, label in labels.items())
+        number: str = str(value) if isinstance(value, int) else repr(float(value))
+        yield f'{name}{suffix}{{{label_text}}} {number}' if labels else f'{name}{suffix} {number}'
+
+
+class RequestMetrics:
+    """Process-local per-route request metrics, rendered for Prometheus."""
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._routes: dict[tuple[str, str], RouteMetrics] = {}
+        self._collectors: list[Callable[[], Iterable[str]]] = []
+
+    def observe(self, route: str, method: str, status: int, timings: RequestTimings, total: float) -> None:
+        with self._lock:
+            metrics: RouteMetrics | None = self._routes.get((route, method))
+            if metrics is None:
+                metrics = self._routes[(route, method)] = RouteMetrics()
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+            for index, bound in enumerate(DURATION_BUCKETS):
+                if total <= bound:
+                    metrics.buckets[index] += 1
+                    break
+            metrics.count += 1
+            metrics.duration += total
+            metrics.queries += timings.queries
+            metrics.db += timings.db
+            metrics.serialize += timings.serialize
+
+    def register_collector(self, collector: Callable[[], Iterable[str]]) -> None:
+        """Add a callable yielding extra exposition lines, e.g. cache counters."""
+        self._collectors.append(collector)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+    def render(self) -> str:
+        with self._lock:
+            routes: list[tuple[tuple[str, str], RouteMetrics]] = sorted(self._routes.items())
+            lines: list[str] = [
+                *format_metric(
+                    'http_requests_total', 'counter', 'Requests handled, by route, method and status.',
+                    (
+                        ('', {'route': route, 'method': method, 'status': str(status)}, count)
+                        for (route, method), route_metrics in routes
+                        for status, count in sorted(route_metrics.statuses.items())
+                    ),
+                ),
+                *format_metric(
+                    'http_request_duration_seconds', 'histogram', 'Time to produce a response, by route and method.',
+                    self._histogram_samples(routes),
+                ),
+            ]
+            for name, attribute, description in (
+                ('http_request_db_queries_total', 'queries', 'SQL queries run, by route and method.'),
+                ('http_request_db_seconds_total', 'db', 'Time spent in SQL, by route and method.'),
+                ('http_request_serialize_seconds_total', 'serialize', 'Time spent serializing, by route and method.'),
+            ):
+                lines.extend(format_metric(
+                    name, 'counter', description,
+                    (
+                        ('', {'route': route, 'method': method}, getattr(route_metrics, attribute))
+                        for (route, method), route_metrics in routes
+                    ),
+                ))
+
+        for collector in self._collectors:
+            lines.extend(collector())
+
+        return '\n'.join(lines) + '\n'
+
+    def _histogram_samples(
+        self,
+        routes: list[tuple[tuple[str, str], RouteMetrics]],
+    ) -> Iterator[tuple[str, dict[str, str], float]]:
+        for (route, method), route_metrics in routes:
+            cumulative: int = 0
+            for bound, count in zip(DURATION_BUCKETS, route_metrics.buckets):
+                cumulative += count
+                yield '_bucket', {'route': route, 'method': method, 'le': f'{bound:g}'}, cumulative
+            yield '_bucket', {'route': route, 'method': method, 'le': '+Inf'}, route_metrics.count
+            yield '_sum', {'route': route, 'method': method}, route_metrics.duration
+            yield '_count', {'route': route, 'method': method}, route_metrics.count
+
+
+metrics: RequestMetrics = RequestMetrics()
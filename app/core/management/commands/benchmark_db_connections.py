@@ -0,0 +1,114 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.utils import load_backend
+
+from core.benchmarks import summarize
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare per-request query latency when every request opens a new '
+        'database connection, keeps a persistent one, or borrows one from a pool.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--requests', type=int, default=1_000)
+        parser.add_argument('--concurrency', type=int, default=10)
+        parser.add_argument('--database', default='default')
+        parser.add_argument('--json', action='store_true', help='Print results as JSON.')
+
+    def handle(self, *args, **options) -> None:
+        settings_dict: dict = connections[options['database']].settings_dict
+        base: dict = {
+            **settings_dict,
+            'OPTIONS': {key: value for key, value in settings_dict['OPTIONS'].items() if key != 'pool'},
+        }
+        modes: dict[str, dict] = {
+            'no-reuse': {**base, 'CONN_MAX_AGE': 0},
+            'persistent': {**base, 'CONN_MAX_AGE': None},
+        }
+        if connections[options['database']].vendor == 'postgresql':
+            pool: dict = settings_dict['OPTIONS'].get('pool') or {}
+            modes['pool'] = {
+                **base,
+                'CONN_MAX_AGE': 0,
+                'OPTIONS': {
+                    **base['OPTIONS'],
+                    'pool': {**(pool if isinstance(pool, dict) else {}), 'max_size': options['concurrency']},
+                },
+            }
+        else:
+            self.stderr.write('Connection pooling needs PostgreSQL; skipping the pool mode.')
+
+        results: list[dict] = [self.run(mode, settings, options) for mode, settings in modes.items()]
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        for result in results:
+            self.stdout.write(
+                f"{result['mode']:>10}: {result['throughput_rps']:8.1f} req/s, "
+                f"p50 {result['latency']['p50_ms']:.2f} ms, p99 {result['latency']['p99_ms']:.2f} ms"
+            )
+
+    def run(self, mode: str, settings_dict: dict, options: dict) -> dict:
+        # A separate alias per mode keeps the benchmark pools apart from the
+        # application's own pool, which Django stores per alias.
+        alias: str = f'benchmark-{mode}'
+        backend = load_backend(settings_dict['ENGINE'])
+        local: threading.local = threading.local()
+        wrappers: list[BaseDatabaseWrapper] = []
+        lock: threading.Lock = threading.Lock()
+
+        def wrapper() -> BaseDatabaseWrapper:
+            if not hasattr(local, 'wrapper'):
+                local.wrapper = backend.DatabaseWrapper(settings_dict, alias)
+                with lock:
+                    wrappers.append(local.wrapper)
+
+            return local.wrapper
+
+        def request() -> float:
+            # Mirrors the request_started/request_finished handlers, which
+            # close connections that are past CONN_MAX_AGE or return them to
+            # the pool.
+            started: float = time.perf_counter()
+            connection: BaseDatabaseWrapper = wrapper()
+            connection.close_if_unusable_or_obsolete()
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+                cursor.fetchone()
+            connection.close_if_unusable_or_obsolete()
+
+            return time.perf_counter() - started
+
+        try:
+            started: float = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=options['concurrency']) as executor:
+                samples: list[float] = list(executor.map(lambda _: request(), range(options['requests'])))
+            elapsed: float = time.perf_counter() - started
+        finally:
+            stats: dict | None = None
+            for connection in wrappers:
+                connection.inc_thread_sharing()
+                connection.close()
+            if wrappers and getattr(wrappers[0], 'pool', None) is not None:
+                stats = wrappers[0].pool.get_stats()
+                wrappers[0].close_pool()
+
+        return {
+            'mode': mode,
+            'requests': options['requests'],
+            'concurrency': options['concurrency'],
+            'elapsed_s': elapsed,
+            'throughput_rps': options['requests'] / elapsed,
+            'latency': summarize(samples),
+            'pool': stats,
+        }
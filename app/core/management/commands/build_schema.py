@@ -0,0 +1,34 @@
+import json
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from core.schema import generate_schema
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate the OpenAPI document and write it to API_SCHEMA_FILE, from '
+        'where /api/schema/ serves it without introspecting the API. Run it at '
+        'build time and whenever views or serializers change.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--file', default=settings.API_SCHEMA_FILE, help='Defaults to API_SCHEMA_FILE.')
+
+    def handle(self, *args, **options) -> None:
+        if not options['file']:
+            raise CommandError('Set API_SCHEMA_FILE or pass --file.')
+        if not settings.API_DOCS_ENABLED:
+            raise CommandError('Building the schema needs drf-spectacular; run with API_DOCS_ENABLED=true.')
+
+        schema: dict = generate_schema()
+        path: Path = Path(options['file'])
+        # Write then rename, so workers never read a partial document.
+        temporary: Path = path.with_name(f'{path.name}.tmp')
+        temporary.write_text(json.dumps(schema, default=str))
+        os.replace(temporary, path)
+
+        self.stdout.write(self.style.SUCCESS(f"Wrote {len(schema['paths'])} paths to {path}."))
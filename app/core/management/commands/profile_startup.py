@@ -0,0 +1,137 @@
+import json
+import os
+import re
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+
+# Runs in a fresh interpreter started with `-X importtime`, so nothing is
+# imported yet. Times each startup phase and every AppConfig.ready().
+BOOTSTRAP: str = '''
+import json, sys, time
+
+started = time.perf_counter()
+import django
+from django.apps import config
+from django.conf import settings
+
+ready = {}
+create = config.AppConfig.create.__func__
+
+
+def timed_create(cls, entry):
+    app_config = create(cls, entry)
+    app_ready = app_config.ready
+
+    def timed_ready():
+        ready_started = time.perf_counter()
+        app_ready()
+        ready[app_config.label] = time.perf_counter() - ready_started
+
+    app_config.ready = timed_ready
+    return app_config
+
+
+config.AppConfig.create = classmethod(timed_create)
+phases = {}
+
+phase_started = time.perf_counter()
+settings.INSTALLED_APPS
+phases['settings'] = time.perf_counter() - phase_started
+
+phase_started = time.perf_counter()
+django.setup()
+phases['apps'] = time.perf_counter() - phase_started
+
+phase_started = time.perf_counter()
+from django.urls import get_resolver
+get_resolver().url_patterns
+phases['urls'] = time.perf_counter() - phase_started
+
+if '--warm-up' in sys.argv:
+    from core.warmup import warm_up
+    phases.update((f'warm-up {step}', seconds) for step, seconds in warm_up().items())
+
+phases['total'] = time.perf_counter() - started
+print(json.dumps({'phases': phases, 'ready': ready}))
+'''
+
+IMPORT_TIME_LINE: re.Pattern = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def parse_import_times(output: str) -> list[dict]:
+    """Parse `-X importtime` output into `{module, depth, self_s, cumulative_s}` rows."""
+    modules: list[dict] = []
+    for line in output.splitlines():
+        match: re.Match | None = IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        modules.append({
+            'module': module,
+            'depth': (len(indent) - 1) // 2,
+            'self_s': int(self_us) / 1_000_000,
+            'cumulative_s': int(cumulative_us) / 1_000_000,
+        })
+
+    return modules
+
+
+class Command(BaseCommand):
+    help = (
+        'Start the project in a fresh interpreter and report where the time '
+        'goes: settings, app loading, URLconf and optional warm-up phases, '
+        'each AppConfig.ready(), and import time by package and module.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--limit', type=int, default=15, help='Rows per table.')
+        parser.add_argument('--warm-up', action='store_true', help='Also time core.warmup.warm_up().')
+        parser.add_argument('--json', action='store_true', help='Print the report as JSON.')
+
+    def handle(self, *args, **options) -> None:
+        command: list[str] = [sys.executable, '-X', 'importtime', '-c', BOOTSTRAP]
+        if options['warm_up']:
+            command.append('--warm-up')
+        result: subprocess.CompletedProcess = subprocess.run(
+            command,
+            capture_output=True,
+            text=True,
+            cwd=settings.BASE_DIR,
+            env={**os.environ, 'DJANGO_SETTINGS_MODULE': settings.SETTINGS_MODULE},
+        )
+        if result.returncode != 0:
+            raise CommandError(f'Startup failed:\n{result.stderr[-4_000:]}')
+
+        startup: dict = json.loads(result.stdout.strip().splitlines()[-1])
+        modules: list[dict] = parse_import_times(result.stderr)
+        packages: dict[str, float] = {}
+        for module in modules:
+            package: str = module['module'].split('.')[0]
+            packages[package] = packages.get(package, 0.0) + module['self_s']
+
+        report: dict = {
+            'phases': startup['phases'],
+            'ready': dict(sorted(startup['ready'].items(), key=lambda item: -item[1])),
+            'packages': dict(sorted(packages.items(), key=lambda item: -item[1])[:options['limit']]),
+            'modules': sorted(modules, key=lambda module: -module['cumulative_s'])[:options['limit']],
+        }
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write('Phases:')
+        for phase, seconds in report['phases'].items():
+            self.stdout.write(f'  {phase:<28} {seconds * 1000:8.1f} ms')
+        self.stdout.write('AppConfig.ready():')
+        for label, seconds in report['ready'].items():
+            self.stdout.write(f'  {label:<28} {seconds * 1000:8.1f} ms')
+        self.stdout.write('Import time by package (self):')
+        for package, seconds in report['packages'].items():
+            self.stdout.write(f'  {package:<28} {seconds * 1000:8.1f} ms')
+        self.stdout.write('Slowest imports (cumulative):')
+        for module in report['modules']:
+            self.stdout.write(f"  {module['module']:<48} {module['cumulative_s'] * 1000:8.1f} ms")
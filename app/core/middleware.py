@@ -0,0 +1,150 @@
+from typing import Callable
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse
+
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.permissions import SAFE_METHODS
+
+from core.authentication import CachedTokenAuthentication
+from core.instrumentation import RequestTimings, collect_timings, metrics
+from core.routers import (
+    ais_pinned_to_primary,
+    apin_to_primary,
+    is_pinned_to_primary,
+    pin_to_primary,
+    replica_reads,
+)
+
+
+def request_user_id(request: HttpRequest) -> int | None:
+    """Id of the user a request's token or session belongs to, if any."""
+    try:
+        authenticated: tuple | None = CachedTokenAuthentication().authenticate(request)
+    except AuthenticationFailed:
+        return None
+    if authenticated is not None:
+        return authenticated[0].pk
+
+    user = getattr(request, 'user', None)
+    return user.pk if user is not None and user.is_authenticated else None
+
+
+async def arequest_user_id(request: HttpRequest) -> int | None:
+    """Async counterpart of `request_user_id()`."""
+    try:
+        authenticated: tuple | None = await CachedTokenAuthentication().aauthenticate(request)
+    except AuthenticationFailed:
+        return None
+    if authenticated is not None:
+        return authenticated[0].pk
+
+    if not hasattr(request, 'auser'):
+        return None
+    user = await request.auser()
+    return user.pk if user.is_authenticated else None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Let safe requests read from replicas, with read-your-writes stickiness.
+
+    A successful unsafe request pins its user to the primary for
+    DB_REPLICA_STICKY_SECONDS, so replication lag never hides a user's own
+    changes from any of their clients. Streaming response bodies are produced
+    after this middleware returns and therefore read from the primary.
+
+    Runs after AuthenticationMiddleware so session users are known; token
+    users are resolved through the token cache the views use as well.
+    """
+    sync_capable: bool = True
+    async_capable: bool = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+        self.async_mode: bool = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self.async_mode:
+            return self.__acall__(request)
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+
+        user_id: int | None = request_user_id(request)
+        if request.method not in SAFE_METHODS:
+            response: HttpResponse = self.get_response(request)
+            if user_id is not None and response.status_code < 400:
+                pin_to_primary(user_id)
+
+            return response
+
+        with replica_reads(user_id is None or not is_pinned_to_primary(user_id)):
+            return self.get_response(request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        if not settings.DATABASE_REPLICAS:
+            return await self.get_response(request)
+
+        user_id: int | None = await arequest_user_id(request)
+        if request.method not in SAFE_METHODS:
+            response: HttpResponse = await self.get_response(request)
+            if user_id is not None and response.status_code < 400:
+                await apin_to_primary(user_id)
+
+            return response
+
+        # Set in this coroutine's context, which the awaited handler shares.
+        with replica_reads(user_id is None or not await ais_pinned_to_primary(user_id)):
+            return await self.get_response(request)
+
+
+class RequestMetricsMiddleware:
+    """
+    Record each request's query count, SQL time, serialization time and total
+    time, report them in a `Server-Timing` header and aggregate them per route
+    for `/metrics`.
+
+    Streaming response bodies are produced after this middleware returns, so
+    their time is not included.
+    """
+    sync_capable: bool = True
+    async_capable: bool = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        if not settings.REQUEST_METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode: bool = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self.async_mode:
+            return self.__acall__(request)
+
+        with collect_timings() as timings:
+            response: HttpResponse = self.get_response(request)
+
+        return self.record(request, response, timings)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        # Views adapted to threads run in a copy of this context, so they
+        # record into the same timings.
+        with collect_timings() as timings:
+            response: HttpResponse = await self.get_response(request)
+
+        return self.record(request, response, timings)
+
+    def record(self, request: HttpRequest, response: HttpResponse, timings: RequestTimings) -> HttpResponse:
+        total: float = timings.total
+        if settings.REQUEST_METRICS_SERVER_TIMING:
+            response['Server-Timing'] = timings.server_timing(total)
+        # Unmatched URLs share one label to keep the number of series bounded.
+        route: str = request.resolver_match.view_name if request.resolver_match else 'unmatched'
+        metrics.observe(route, request.method, response.status_code, timings, total)
+
+        return response
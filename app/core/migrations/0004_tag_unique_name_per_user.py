@@ -0,0 +1,44 @@
+# Generated by Django 5.0.14 on 2026-10-18 03:13
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def merge_duplicate_tags(apps, schema_editor) -> None:
+    """Fold tags sharing a (user, name) pair into the oldest one."""
+    Tag = apps.get_model('core', 'Tag')
+    RecipeTag = apps.get_model('core', 'Recipe').tags.through
+
+    duplicates = (
+        Tag.objects
+        .values('user_id', 'name')
+        .annotate(keep_id=Min('id'), total=Count('id'))
+        .filter(total__gt=1)
+    )
+    for duplicate in duplicates:
+        keep_id = duplicate['keep_id']
+        drop_ids = list(
+            Tag.objects
+            .filter(user_id=duplicate['user_id'], name=duplicate['name'])
+            .exclude(id=keep_id)
+            .values_list('id', flat=True)
+        )
+        linked_recipe_ids = RecipeTag.objects.filter(tag_id=keep_id).values('recipe_id')
+        for drop_id in drop_ids:
+            RecipeTag.objects.filter(tag_id=drop_id).exclude(recipe_id__in=linked_recipe_ids).update(tag_id=keep_id)
+        Tag.objects.filter(id__in=drop_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_tag_recipe_tags'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_tags, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='tag',
+            constraint=models.UniqueConstraint(fields=('user', 'name'), name='unique_tag_name_per_user'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.0.14 on 2026-10-18 03:26
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+SEARCH_VECTOR = """
+    setweight(to_tsvector('pg_catalog.english', coalesce({row}title, '')), 'A') ||
+    setweight(to_tsvector('pg_catalog.english', coalesce({row}description, '')), 'B')
+"""
+
+
+def create_search_trigger(apps, schema_editor) -> None:
+    """Keep core_recipe.search_vector in sync on PostgreSQL; other backends fall back to LIKE."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute(f"""
+        CREATE FUNCTION core_recipe_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {SEARCH_VECTOR.format(row='NEW.')};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    schema_editor.execute("""
+        CREATE TRIGGER core_recipe_search_vector_update
+        BEFORE INSERT OR UPDATE OF title, description ON core_recipe
+        FOR EACH ROW EXECUTE FUNCTION core_recipe_search_vector_update()
+    """)
+    schema_editor.execute(f'UPDATE core_recipe SET search_vector = {SEARCH_VECTOR.format(row="")}')
+    schema_editor.execute('CREATE INDEX recipe_search_vector_idx ON core_recipe USING gin (search_vector)')
+
+
+def drop_search_trigger(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute('DROP INDEX IF EXISTS recipe_search_vector_idx')
+    schema_editor.execute('DROP TRIGGER IF EXISTS core_recipe_search_vector_update ON core_recipe')
+    schema_editor.execute('DROP FUNCTION IF EXISTS core_recipe_search_vector_update()')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_recipe_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recipe',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_trigger, drop_search_trigger),
+    ]
@@ -0,0 +1,106 @@
+# Generated by Django 5.1.15 on 2026-10-18 03:56
+
+from django.db import migrations, models
+
+
+POSTGRESQL_TRIGGERS = [
+    """
+    CREATE FUNCTION core_tag_recipe_count_add() RETURNS trigger AS $$
+    BEGIN
+        UPDATE core_tag SET recipe_count = core_tag.recipe_count + links.count
+        FROM (SELECT tag_id, count(*) AS count FROM new_links GROUP BY tag_id) AS links
+        WHERE core_tag.id = links.tag_id;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE FUNCTION core_tag_recipe_count_remove() RETURNS trigger AS $$
+    BEGIN
+        UPDATE core_tag SET recipe_count = core_tag.recipe_count - links.count
+        FROM (SELECT tag_id, count(*) AS count FROM old_links GROUP BY tag_id) AS links
+        WHERE core_tag.id = links.tag_id;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    # Statement-level triggers with transition tables: one UPDATE per INSERT,
+    # COPY or DELETE statement, however many links it touches.
+    """
+    CREATE TRIGGER core_recipe_tags_count_insert
+    AFTER INSERT ON core_recipe_tags
+    REFERENCING NEW TABLE AS new_links
+    FOR EACH STATEMENT EXECUTE FUNCTION core_tag_recipe_count_add()
+    """,
+    """
+    CREATE TRIGGER core_recipe_tags_count_delete
+    AFTER DELETE ON core_recipe_tags
+    REFERENCING OLD TABLE AS old_links
+    FOR EACH STATEMENT EXECUTE FUNCTION core_tag_recipe_count_remove()
+    """,
+]
+
+SQLITE_TRIGGERS = [
+    """
+    CREATE TRIGGER core_recipe_tags_count_insert
+    AFTER INSERT ON core_recipe_tags
+    BEGIN
+        UPDATE core_tag SET recipe_count = recipe_count + 1 WHERE id = NEW.tag_id;
+    END
+    """,
+    """
+    CREATE TRIGGER core_recipe_tags_count_delete
+    AFTER DELETE ON core_recipe_tags
+    BEGIN
+        UPDATE core_tag SET recipe_count = recipe_count - 1 WHERE id = OLD.tag_id;
+    END
+    """,
+]
+
+
+def create_count_triggers(apps, schema_editor) -> None:
+    """Keep core_tag.recipe_count in sync with every change to core_recipe_tags."""
+    triggers: list[str] = {
+        'postgresql': POSTGRESQL_TRIGGERS,
+        'sqlite': SQLITE_TRIGGERS,
+    }.get(schema_editor.connection.vendor, [])
+    for statement in triggers:
+        schema_editor.execute(statement)
+    schema_editor.execute("""
+        UPDATE core_tag SET recipe_count = (
+            SELECT count(*) FROM core_recipe_tags WHERE core_recipe_tags.tag_id = core_tag.id
+        )
+    """)
+
+
+def drop_count_triggers(apps, schema_editor) -> None:
+    vendor: str = schema_editor.connection.vendor
+    if vendor not in ('postgresql', 'sqlite'):
+        return
+
+    on_table: str = ' ON core_recipe_tags' if vendor == 'postgresql' else ''
+    schema_editor.execute(f'DROP TRIGGER IF EXISTS core_recipe_tags_count_insert{on_table}')
+    schema_editor.execute(f'DROP TRIGGER IF EXISTS core_recipe_tags_count_delete{on_table}')
+    if vendor == 'postgresql':
+        schema_editor.execute('DROP FUNCTION IF EXISTS core_tag_recipe_count_add()')
+        schema_editor.execute('DROP FUNCTION IF EXISTS core_tag_recipe_count_remove()')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_recipe_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tag',
+            name='recipe_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(condition=models.Q(('recipe_count__gt', 0)), fields=['user', '-name'], name='tag_user_name_assigned_idx'),
+        ),
+        migrations.RunPython(create_count_triggers, drop_count_triggers),
+    ]
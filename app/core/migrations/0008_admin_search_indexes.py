@@ -0,0 +1,41 @@
+from django.db import migrations
+
+
+# Admin prefix searches (`^email`, `^name`) compile to
+# `UPPER(column::text) LIKE UPPER('term%')`, which only these indexes serve.
+INDEXES: dict[str, tuple[str, str]] = {
+    'user_email_upper_pattern_idx': ('core_user', 'email'),
+    'tag_name_upper_pattern_idx': ('core_tag', 'name'),
+}
+
+
+def create_search_indexes(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for name, (table, column) in INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} (UPPER({column}::text) text_pattern_ops)'
+        )
+
+
+def drop_search_indexes(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for name in INDEXES:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction; building the
+    # indexes this way keeps the tables writable on large installations.
+    atomic = False
+
+    dependencies = [
+        ('core', '0007_tag_recipe_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.15 on 2026-10-18 04:23
+
+import core.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_admin_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recipe',
+            name='image',
+            field=models.ImageField(blank=True, editable=False, upload_to=core.models.recipe_image_path),
+        ),
+        migrations.AddField(
+            model_name='recipe',
+            name='image_sizes',
+            field=models.JSONField(default=dict, editable=False),
+        ),
+    ]
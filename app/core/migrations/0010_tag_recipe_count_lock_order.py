@@ -0,0 +1,45 @@
+from django.db import migrations
+
+
+# The count triggers from 0007 updated tags in whatever order the join
+# produced, so two statements sharing popular tags could each lock one the
+# other needed next and deadlock. Locking the affected tags in id order
+# first makes concurrent writers queue on the first shared tag instead.
+POSTGRESQL_FUNCTIONS: dict[str, tuple[str, str]] = {
+    'core_tag_recipe_count_add': ('new_links', '+'),
+    'core_tag_recipe_count_remove': ('old_links', '-'),
+}
+
+
+def lock_tags_in_id_order(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for function, (links, operator) in POSTGRESQL_FUNCTIONS.items():
+        schema_editor.execute(f"""
+            CREATE OR REPLACE FUNCTION {function}() RETURNS trigger AS $$
+            BEGIN
+                PERFORM 1 FROM core_tag
+                WHERE id IN (SELECT tag_id FROM {links})
+                ORDER BY id
+                FOR UPDATE;
+                UPDATE core_tag SET recipe_count = core_tag.recipe_count {operator} links.count
+                FROM (SELECT tag_id, count(*) AS count FROM {links} GROUP BY tag_id) AS links
+                WHERE core_tag.id = links.tag_id;
+                RETURN NULL;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_recipe_image'),
+    ]
+
+    operations = [
+        # The ordered functions are equivalent to the previous ones, so there
+        # is nothing to restore on the way back.
+        migrations.RunPython(lock_tags_in_id_order, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+from django.db import migrations, models
+
+
+# The (user, ...) indexes from 0005 can't serve the admin's price and time
+# range filters, which run across all users.
+INDEXES: list[models.Index] = [
+    models.Index(fields=['price'], name='recipe_price_idx'),
+    models.Index(fields=['time_minutes'], name='recipe_time_minutes_idx'),
+]
+
+
+def create_indexes(apps, schema_editor) -> None:
+    Recipe = apps.get_model('core', 'Recipe')
+    for index in INDEXES:
+        if schema_editor.connection.vendor == 'postgresql':
+            schema_editor.add_index(Recipe, index, concurrently=True)
+        else:
+            schema_editor.add_index(Recipe, index)
+
+
+def drop_indexes(apps, schema_editor) -> None:
+    Recipe = apps.get_model('core', 'Recipe')
+    for index in INDEXES:
+        if schema_editor.connection.vendor == 'postgresql':
+            schema_editor.remove_index(Recipe, index, concurrently=True)
+        else:
+            schema_editor.remove_index(Recipe, index)
+
+
+class Migration(migrations.Migration):
+    # As in 0008, build the indexes concurrently so the recipe table stays
+    # writable; that can't happen inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('core', '0010_tag_recipe_count_lock_order'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[migrations.AddIndex(model_name='recipe', index=index) for index in INDEXES],
+            database_operations=[migrations.RunPython(create_indexes, drop_indexes)],
+        ),
+    ]
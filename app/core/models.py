@@ -1,16 +1,26 @@
+import posixpath
 from decimal import Decimal
+from uuid import uuid4
 
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.db.models import (
     Model,
     CharField,
     TextField,
     IntegerField,
+    PositiveIntegerField,
     BooleanField,
     DecimalField,
     EmailField,
     ForeignKey,
+    ImageField,
+    JSONField,
     ManyToManyField,
+    Manager,
+    Index,
+    UniqueConstraint,
+    Q,
     CASCADE,
 )
 from django.contrib.auth.models import (
@@ -54,13 +64,76 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = 'email'
 
 
+class TagManager(Manager):
+    def get_or_create_many(self, user: User, names: list[str]) -> dict[str, 'Tag']:
+        """
+        Return the user's tags for `names`, creating the missing ones.
+
+        Runs one lookup and, when something is missing, one upsert that relies
+        on the (user, name) unique constraint, so concurrent writers can't
+        create duplicates.
+        """
+        names = list(dict.fromkeys(names))
+        tags: dict[str, Tag] = {
+            tag.name: tag
+            for tag in self.filter(user=user, name__in=names)
+        }
+        missing: list[Tag] = [
+            self.model(user=user, name=name)
+            for name in names
+            if name not in tags
+        ]
+        if missing:
+            self.bulk_create(
+                missing,
+                update_conflicts=True,
+                unique_fields=['user', 'name'],
+                update_fields=['name'],
+            )
+            tags.update((tag.name, tag) for tag in missing)
+
+        return tags
+
+
 class Tag(Model):
     name: str|CharField = CharField(max_length=255)
     user: User|ForeignKey = ForeignKey(to=settings.AUTH_USER_MODEL, on_delete=CASCADE)
+    # Number of recipes using the tag, maintained by database triggers on the
+    # recipe/tag link table so every write path keeps it consistent.
+    recipe_count: int|PositiveIntegerField = PositiveIntegerField(default=0, editable=False)
+
+    objects = TagManager()
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(fields=['user', 'name'], name='unique_tag_name_per_user'),
+        ]
+        indexes = [
+            Index(
+                fields=['user', '-name'],
+                condition=Q(recipe_count__gt=0),
+                name='tag_user_name_assigned_idx',
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.name
 
+    def save(self, *args, **kwargs) -> None:
+        # Never write back a possibly stale recipe_count over the triggers' value.
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'recipe_count'
+            ]
+        super().save(*args, **kwargs)
+
+
+def recipe_image_path(instance: 'Recipe', filename: str) -> str:
+    """Store each upload under a fresh random name, keeping its extension."""
+    return f'recipes/{uuid4().hex}{posixpath.splitext(filename)[1].lower()}'
+
 
 class Recipe(Model):
     user: User|ForeignKey = ForeignKey(to=settings.AUTH_USER_MODEL, on_delete=CASCADE)
@@ -70,6 +143,38 @@ class Recipe(Model):
     price: Decimal|DecimalField = DecimalField(max_digits=5, decimal_places=2)
     link: str|CharField = CharField(max_length=255, blank=True)
     tags: list[Tag]|ManyToManyField = ManyToManyField(to='Tag')
+    # Maintained by a database trigger on PostgreSQL; left empty elsewhere.
+    search_vector: str|SearchVectorField = SearchVectorField(null=True, editable=False)
+    # Replaced only through the upload endpoint. image_sizes maps each of
+    # RECIPE_IMAGE_SIZES to its thumbnail's name once a worker has rendered it.
+    image: str|ImageField = ImageField(upload_to=recipe_image_path, blank=True, editable=False)
+    image_sizes: dict|JSONField = JSONField(default=dict, editable=False)
+
+    class Meta:
+        indexes = [
+            Index(fields=['user', '-id'], name='recipe_user_id_desc_idx'),
+            Index(fields=['user', 'price'], name='recipe_user_price_idx'),
+            Index(fields=['user', 'time_minutes'], name='recipe_user_time_minutes_idx'),
+            # For the admin's range filters, which span every user.
+            Index(fields=['price'], name='recipe_price_idx'),
+            Index(fields=['time_minutes'], name='recipe_time_minutes_idx'),
+        ]
 
     def __str__(self) -> str:
         return self.title
+
+    def save(self, *args, **kwargs) -> None:
+        # Never write back a possibly stale image over a newer upload or over
+        # thumbnails recorded by the workers meanwhile. As with any
+        # update_fields save, a recipe whose row has been deleted is not
+        # inserted again; pass force_insert=True for that.
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            deferred: set[str] = self.get_deferred_fields()
+            kwargs['update_fields'] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred
+                and field.name not in ('image', 'image_sizes')
+            ]
+        super().save(*args, **kwargs)
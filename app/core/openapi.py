@@ -0,0 +1,31 @@
+"""
+Schema annotations for views and serializers.
+
+Only drf-spectacular reads them, so with API_DOCS_ENABLED off they are
+no-ops and workers start without importing drf-spectacular at all.
+"""
+from collections.abc import Callable
+
+from django.conf import settings
+
+
+if settings.API_DOCS_ENABLED:
+    from drf_spectacular.types import OpenApiTypes
+    from drf_spectacular.utils import extend_schema, extend_schema_field, extend_schema_view
+else:
+    class _OpenApiTypes:
+        def __getattr__(self, name: str) -> str:
+            return name
+
+    OpenApiTypes = _OpenApiTypes()
+
+    def _unchanged(target):
+        return target
+
+    def extend_schema(*args, **kwargs) -> Callable:
+        return _unchanged
+
+    extend_schema_field = extend_schema_view = extend_schema
+
+
+__all__ = ['OpenApiTypes', 'extend_schema', 'extend_schema_field', 'extend_schema_view']
@@ -0,0 +1,80 @@
+import json
+
+from django.conf import settings
+from django.core.paginator import EmptyPage, Page, Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+
+def estimate_count(queryset: QuerySet, limit: int) -> tuple[int, bool]:
+    """
+    Count `queryset` without scanning more than `limit` rows.
+
+    Returns `(count, exact)`. An unfiltered queryset on PostgreSQL is sized
+    from the planner's estimate in `pg_class` when that is above `limit`;
+    otherwise the count runs over a subquery capped at `limit + 1` rows. When
+    the cap is hit the count is inexact: the planner's row estimate for the
+    query on PostgreSQL, and `limit` elsewhere.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor == 'postgresql' and not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                [queryset.model._meta.db_table],
+            )
+            row: tuple | None = cursor.fetchone()
+        # reltuples is -1 until the table is first analyzed.
+        if row is not None and row[0] > limit:
+            return row[0], False
+
+    rows: QuerySet = queryset.order_by().values('pk')
+    count: int = rows[:limit + 1].count()
+    if count > limit:
+        if connection.vendor == 'postgresql':
+            plan: list[dict] = json.loads(rows.explain(format='json'))
+            return max(int(plan[0]['Plan']['Plan Rows']), limit), False
+
+        return limit, False
+
+    return count, True
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator whose `count` comes from `estimate_count()`, for admin changelists.
+
+    While the count is an estimate, pages past it stay reachable through
+    `?p=`: the rows may go on beyond the estimated last page, and a page past
+    their end is simply empty.
+    """
+
+    @cached_property
+    def _estimate(self) -> tuple[int, bool]:
+        return estimate_count(self.object_list, settings.ADMIN_COUNT_LIMIT)
+
+    @property
+    def count(self) -> int:
+        return self._estimate[0]
+
+    @property
+    def count_exact(self) -> bool:
+        return self._estimate[1]
+
+    def validate_number(self, number) -> int:
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if self.count_exact or int(number) < 1:
+                raise
+            return int(number)
+
+    def page(self, number) -> Page:
+        number = self.validate_number(number)
+        if self.count_exact:
+            return super().page(number)
+
+        # Unlike Paginator.page(), never clip the last page to the estimate.
+        bottom: int = (number - 1) * self.per_page
+        return self._get_page(self.object_list[bottom:bottom + self.per_page], number, self)
@@ -0,0 +1,19 @@
+from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
+
+from core.instrumentation import timed_serialization
+
+
+class TimedRenderMixin:
+    """Renderer mixin that reports rendering as serialization time."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with timed_serialization():
+            return super().render(data, accepted_media_type, renderer_context)
+
+
+class TimedJSONRenderer(TimedRenderMixin, JSONRenderer):
+    pass
+
+
+class TimedBrowsableAPIRenderer(TimedRenderMixin, BrowsableAPIRenderer):
+    pass
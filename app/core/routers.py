@@ -0,0 +1,75 @@
+import random
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Model
+
+
+# Whether the current request may read from a replica. Off by default so
+# management commands, shells and unsafe requests always use the primary.
+_replica_reads: ContextVar[bool] = ContextVar('replica_reads', default=False)
+
+
+@contextmanager
+def replica_reads(enabled: bool = True) -> Iterator[None]:
+    token: Token = _replica_reads.set(enabled)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def get_sticky_cache() -> BaseCache:
+    return caches[settings.DB_REPLICA_STICKY_CACHE_ALIAS]
+
+
+def sticky_cache_key(user_id: int) -> str:
+    return f'db-primary-pin:{user_id}'
+
+
+def pin_to_primary(user_id: int) -> None:
+    """Send the user's reads to the primary for the next DB_REPLICA_STICKY_SECONDS."""
+    get_sticky_cache().set(sticky_cache_key(user_id), True, settings.DB_REPLICA_STICKY_SECONDS)
+
+
+async def apin_to_primary(user_id: int) -> None:
+    await get_sticky_cache().aset(sticky_cache_key(user_id), True, settings.DB_REPLICA_STICKY_SECONDS)
+
+
+def is_pinned_to_primary(user_id: int) -> bool:
+    return get_sticky_cache().get(sticky_cache_key(user_id), False)
+
+
+async def ais_pinned_to_primary(user_id: int) -> bool:
+    return await get_sticky_cache().aget(sticky_cache_key(user_id), False)
+
+
+class PrimaryReplicaRouter:
+    """
+    Route writes to the primary and reads to a random replica.
+
+    Reads stay on the primary unless `replica_reads()` is active, which
+    `ReplicaRoutingMiddleware` does for safe requests, and inside transactions,
+    so a read following a write in the same transaction sees it.
+    """
+
+    def db_for_read(self, model: type[Model], **hints) -> str:
+        replicas: list[str] = settings.DATABASE_REPLICAS
+        if replicas and _replica_reads.get() and not connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return random.choice(replicas)
+
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model: type[Model], **hints) -> str:
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints) -> bool:
+        # Replicas hold the same data as the primary.
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, model_name: str | None = None, **hints) -> bool:
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,112 @@
+"""
+The OpenAPI document, built once per process instead of on every request.
+
+Introspecting every view and serializer takes far longer than serving the
+result, and the document only changes with the code. It is loaded from
+API_SCHEMA_FILE when that file exists (see the build_schema command) and
+generated on first use otherwise; each rendering is kept together with its
+gzipped body and ETag.
+"""
+import gzip
+import json
+import threading
+from hashlib import sha256
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+
+# drf-spectacular's generator and renderers (and PyYAML) are imported only
+# when a document is actually generated or rendered, not at worker startup.
+RENDERERS: dict[str, str] = {
+    'yaml': 'drf_spectacular.renderers.OpenApiYamlRenderer',
+    'json': 'drf_spectacular.renderers.OpenApiJsonRenderer',
+}
+
+
+class SchemaMediaType(JSONRenderer):
+    """
+    Content negotiation for the schema view.
+
+    Documents are pre-rendered by `SchemaCache`; this only renders error
+    responses, as JSON.
+    """
+
+
+class YamlSchemaMediaType(SchemaMediaType):
+    media_type = 'application/vnd.oai.openapi'
+    format = 'yaml'
+
+
+class YamlSchemaMediaType2(YamlSchemaMediaType):
+    media_type = 'application/yaml'
+
+
+class JsonSchemaMediaType(SchemaMediaType):
+    media_type = 'application/vnd.oai.openapi+json'
+    format = 'json'
+
+
+class JsonSchemaMediaType2(JsonSchemaMediaType):
+    media_type = 'application/json'
+
+
+class RenderedSchema:
+    def __init__(self, content: bytes) -> None:
+        self.content: bytes = content
+        self.gzipped: bytes = gzip.compress(content, compresslevel=9, mtime=0)
+        self.etag: str = f'"{sha256(content).hexdigest()[:32]}"'
+
+
+def generate_schema() -> dict:
+    from drf_spectacular.generators import SchemaGenerator
+
+    return SchemaGenerator().get_schema(request=None, public=True)
+
+
+class SchemaCache:
+    """Process-local schema and its renderings, filled on first use."""
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._schema: dict | None = None
+        self._rendered: dict[str, RenderedSchema] = {}
+
+    def schema(self) -> dict:
+        with self._lock:
+            if self._schema is None:
+                self._schema = self._load()
+
+            return self._schema
+
+    def rendered(self, renderer_format: str) -> RenderedSchema:
+        schema: dict = self.schema()
+        with self._lock:
+            if renderer_format not in self._rendered:
+                renderer: BaseRenderer = import_string(RENDERERS[renderer_format])()
+                content: bytes = renderer.render(schema, renderer_context={})
+                self._rendered[renderer_format] = RenderedSchema(content)
+
+            return self._rendered[renderer_format]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._schema = None
+            self._rendered.clear()
+
+    def _load(self) -> dict:
+        if settings.API_SCHEMA_FILE:
+            path: Path = Path(settings.API_SCHEMA_FILE)
+            if path.exists():
+                return json.loads(path.read_text())
+        if not settings.API_DOCS_ENABLED:
+            raise ImproperlyConfigured('With API_DOCS_ENABLED off the schema is only served from API_SCHEMA_FILE.')
+
+        return generate_schema()
+
+
+schema_cache: SchemaCache = SchemaCache()
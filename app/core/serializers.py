@@ -0,0 +1,6 @@
+from rest_framework import serializers
+
+
+class DatabasePoolStatsSerializer(serializers.Serializer):
+    alias = serializers.CharField()
+    stats = serializers.DictField(child=serializers.IntegerField())
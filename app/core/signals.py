@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from rest_framework.authtoken.models import Token
+
+from core.authentication import invalidate_token, invalidate_user_tokens
+from core.instrumentation import install_query_recorder
+from core.models import User
+
+
+@receiver(post_delete, sender=Token)
+def drop_cached_token(sender, instance: Token, **kwargs) -> None:
+    invalidate_token(instance.key)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def drop_cached_user_tokens(sender, instance: User, **kwargs) -> None:
+    invalidate_user_tokens(instance.pk)
+
+
+@receiver(connection_created)
+def record_request_queries(sender, connection: BaseDatabaseWrapper, **kwargs) -> None:
+    if settings.REQUEST_METRICS_ENABLED:
+        install_query_recorder(connection)
@@ -1,8 +1,14 @@
-from django.test import TestCase, Client
+from decimal import Decimal
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 
-from core.models import User
+from core.admin import RecipeAdmin
+from core.models import Recipe, Tag, User
 
 
 class AdminSiteTest(TestCase):
@@ -37,3 +43,99 @@ class AdminSiteTest(TestCase):
         res = self.client.get(url)
 
         self.assertEqual(res.status_code, 200)
+
+
+class LargeTableAdminTests(TestCase):
+    def setUp(self) -> None:
+        self.client: Client = Client()
+        self.admin_user: User = get_user_model().objects.create_superuser(
+            email='admin@example.com',
+            password='testpass123',
+        )
+        self.client.force_login(self.admin_user)
+        self.user: User = get_user_model().objects.create_user(email='cook@example.com', password='testpass123')
+        self.tag: Tag = Tag.objects.create(user=self.user, name='Vegan')
+        self.recipes: list[Recipe] = [
+            Recipe.objects.create(
+                user=self.user,
+                title=title,
+                price=Decimal(price),
+                time_minutes=minutes,
+            )
+            for title, price, minutes in [('Curry', '12.00', 40), ('Salad', '4.00', 10), ('Stew', '8.50', 90)]
+        ]
+        self.recipes[0].tags.add(self.tag)
+
+    def changelist(self, model: str, params: dict | None = None):
+        return self.client.get(reverse(f'admin:core_{model}_changelist'), params or {})
+
+    def test_recipe_changelist_queries_independent_of_rows(self) -> None:
+        self.changelist('recipe')
+        with CaptureQueriesContext(connection) as few:
+            self.changelist('recipe')
+        for i in range(20):
+            Recipe.objects.create(user=self.user, title=f'Extra {i}', price=Decimal('1.00'), time_minutes=5)
+        with CaptureQueriesContext(connection) as many:
+            response = self.changelist('recipe')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(few.captured_queries), len(many.captured_queries))
+        self.assertEqual(response.context['cl'].full_result_count, None)
+
+    def test_recipe_changelist_filters(self) -> None:
+        response = self.changelist('recipe', {'price_range': '< 5'})
+        self.assertEqual([recipe.title for recipe in response.context['cl'].result_list], ['Salad'])
+
+        response = self.changelist('recipe', {'time_range': '>= 60'})
+        self.assertEqual([recipe.title for recipe in response.context['cl'].result_list], ['Stew'])
+
+    def test_recipe_changelist_search(self) -> None:
+        response = self.changelist('recipe', {'q': 'curry'})
+
+        self.assertEqual([recipe.title for recipe in response.context['cl'].result_list], ['Curry'])
+
+    @override_settings(ADMIN_COUNT_LIMIT=2)
+    def test_recipe_changelist_count_capped(self) -> None:
+        response = self.changelist('recipe')
+
+        # The count is only an estimate; every row is still listed.
+        self.assertGreaterEqual(response.context['cl'].result_count, 2)
+        self.assertFalse(response.context['cl'].paginator.count_exact)
+        self.assertEqual(len(response.context['cl'].result_list), 3)
+
+    @override_settings(ADMIN_COUNT_LIMIT=2)
+    def test_recipe_pages_past_estimate_reachable(self) -> None:
+        with mock.patch.object(RecipeAdmin, 'list_per_page', 1):
+            last = self.changelist('recipe', {'p': 3})
+            past_end = self.changelist('recipe', {'p': 4})
+
+        self.assertEqual(last.status_code, 200)
+        self.assertEqual(list(last.context['cl'].result_list), [self.recipes[0]])
+        self.assertEqual(past_end.status_code, 200)
+        self.assertEqual(list(past_end.context['cl'].result_list), [])
+
+    def test_recipe_change_page(self) -> None:
+        response = self.client.get(reverse('admin:core_recipe_change', args=[self.recipes[0].id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, '<select name="tags"')
+
+    def test_tag_changelist_search(self) -> None:
+        Tag.objects.create(user=self.user, name='Dinner')
+
+        response = self.changelist('tag', {'q': 'veg'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context['cl'].result_list), [self.tag])
+        self.assertContains(response, 'cook@example.com')
+
+    def test_user_autocomplete(self) -> None:
+        response = self.client.get(reverse('admin:autocomplete'), {
+            'app_label': 'core',
+            'model_name': 'recipe',
+            'field_name': 'user',
+            'term': 'cook',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([result['text'] for result in response.json()['results']], ['cook@example.com'])
@@ -0,0 +1,116 @@
+import pickle
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from core.authentication import (
+    CachedTokenAuthentication,
+    get_token_cache,
+    invalidate_user_tokens,
+    token_cache_key,
+)
+from core.models import User
+
+
+ME_URL = reverse('user:me')
+
+
+class CachedTokenAuthenticationTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user: User = get_user_model().objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            name='Test Name',
+        )
+        self.token: Token = Token.objects.create(user=self.user)
+        self.client: APIClient = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def count_queries(self) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(ME_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    def test_token_lookup_served_from_cache(self) -> None:
+        authentication: CachedTokenAuthentication = CachedTokenAuthentication()
+        with CaptureQueriesContext(connection) as cold:
+            authentication.authenticate_credentials(self.token.key)
+        with CaptureQueriesContext(connection) as warm:
+            user, token = authentication.authenticate_credentials(self.token.key)
+
+        self.assertEqual(len(cold.captured_queries), 1)
+        self.assertEqual(len(warm.captured_queries), 0)
+        self.assertEqual((user.pk, user.is_active), (self.user.pk, True))
+        self.assertEqual((token.key, token.user_id), (self.token.key, self.user.pk))
+
+    def test_cached_lookup_leaves_out_password_and_profile(self) -> None:
+        response = self.client.get(ME_URL)
+
+        entry: bytes = pickle.dumps(get_token_cache().get(token_cache_key(self.token.key)))
+        self.assertNotIn(self.user.password.encode(), entry)
+        self.assertNotIn(self.user.email.encode(), entry)
+        self.assertEqual(self.client.get(ME_URL).data, response.data)
+
+    def test_deleted_token_rejected(self) -> None:
+        self.count_queries()
+        self.token.delete()
+
+        response = self.client.get(ME_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deactivated_user_rejected(self) -> None:
+        self.count_queries()
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.get(ME_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_changed_user_not_served_stale(self) -> None:
+        self.count_queries()
+        self.user.name = 'New Name'
+        self.user.save()
+
+        response = self.client.get(ME_URL)
+
+        self.assertEqual(response.data['name'], 'New Name')
+
+    def test_fill_racing_invalidation_not_served(self) -> None:
+        # A request reads the user, then a deactivation commits before that
+        # request writes the lookup to the cache.
+        authenticate_credentials = TokenAuthentication.authenticate_credentials
+
+        def read_then_deactivate(authentication, key):
+            result = authenticate_credentials(authentication, key)
+            get_user_model().objects.filter(id=self.user.id).update(is_active=False)
+            invalidate_user_tokens(self.user.id)
+            return result
+
+        with mock.patch.object(TokenAuthentication, 'authenticate_credentials', read_then_deactivate):
+            self.count_queries()
+
+        response = self.client.get(ME_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_invalid_token_rejected(self) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION='Token invalid')
+
+        response = self.client.get(ME_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
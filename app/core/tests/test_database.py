@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db.utils import ConnectionHandler
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app import settings as project_settings
+from core.database import pool_stats
+
+
+DB_POOL_STATS_URL = reverse('core:db-pool-stats')
+
+
+class PoolStatsTests(SimpleTestCase):
+    def test_reports_only_pooled_aliases(self) -> None:
+        pool = mock.Mock()
+        pool.get_stats.return_value = {'pool_size': 2, 'pool_available': 1}
+        fake_connections: dict = {
+            'default': SimpleNamespace(pool=pool),
+            'replica': SimpleNamespace(pool=None),
+            'legacy': SimpleNamespace(),
+        }
+
+        with mock.patch('core.database.connections', fake_connections):
+            stats: list[dict] = pool_stats()
+
+        self.assertEqual(stats, [{'alias': 'default', 'stats': {'pool_size': 2, 'pool_available': 1}}])
+
+
+class DatabasePoolSettingsTests(SimpleTestCase):
+    def test_project_pool_options_accepted(self) -> None:
+        settings_dict: dict = {**project_settings.DATABASES['default'], 'NAME': 'recipe_db'}
+        wrapper = ConnectionHandler({'default': settings_dict})['default']
+        # Pools are shared per alias; keep this one apart from the test database's.
+        wrapper.alias = 'pool-settings-test'
+        self.addCleanup(wrapper._connection_pools.pop, wrapper.alias, None)
+
+        # Builds the (unopened) psycopg pool from the project's options.
+        pool = wrapper.pool
+
+        self.assertEqual(pool.max_size, project_settings.DATABASES['default']['OPTIONS']['pool']['max_size'])
+
+
+class DatabasePoolStatsApiTests(TestCase):
+    def setUp(self) -> None:
+        self.client: APIClient = APIClient()
+
+    def test_requires_staff(self) -> None:
+        user = get_user_model().objects.create_user(email='user@example.com', password='testpass123')
+        self.client.force_authenticate(user)
+
+        response = self.client.get(DB_POOL_STATS_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_staff_sees_pool_stats(self) -> None:
+        admin = get_user_model().objects.create_superuser(email='admin@example.com', password='testpass123')
+        self.client.force_authenticate(admin)
+
+        with mock.patch('core.views.pool_stats', return_value=[{'alias': 'default', 'stats': {'pool_size': 4}}]):
+            response = self.client.get(DB_POOL_STATS_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [{'alias': 'default', 'stats': {'pool_size': 4}}])
@@ -0,0 +1,122 @@
+import re
+import time
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIHandler
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from core.instrumentation import collect_timings, format_metric, metrics, record_query, timed_serialization
+from core.models import Recipe, User
+
+
+RECIPES_URL = reverse('recipe:recipe-list')
+METRICS_URL = reverse('metrics')
+
+
+class TimingsTests(SimpleTestCase):
+    def test_serialization_excludes_nested_blocks_and_queries(self) -> None:
+        with collect_timings() as timings:
+            with timed_serialization():
+                with timed_serialization():
+                    time.sleep(0.01)
+                record_query(lambda *args: time.sleep(0.02), 'SELECT 1', None, False, {})
+
+        self.assertEqual(timings.queries, 1)
+        self.assertGreaterEqual(timings.db, 0.02)
+        self.assertGreaterEqual(timings.serialize, 0.01)
+        self.assertLess(timings.serialize, 0.02)
+
+    def test_serialization_outside_request_is_ignored(self) -> None:
+        with timed_serialization():
+            pass
+
+    def test_format_metric_escapes_labels(self) -> None:
+        lines: list[str] = list(format_metric('demo', 'gauge', 'Demo.', [('', {'name': 'a"b\\c'}, 1.5), ('', {}, 2)]))
+
+        self.assertEqual(lines, [
+            '# HELP demo Demo.',
+            '# TYPE demo gauge',
+            'demo{name="a\\"b\\\\c"} 1.5',
+            'demo 2',
+        ])
+
+
+class RequestMetricsMiddlewareTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        metrics.reset()
+        self.user: User = get_user_model().objects.create_user(email='test@example.com', password='testpass123')
+        Recipe.objects.create(user=self.user, title='Soup', time_minutes=10, price='2.50')
+        self.client: APIClient = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=self.user).key}')
+
+    def test_server_timing_header(self) -> None:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(RECIPES_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        match: re.Match | None = re.fullmatch(
+            r'db;dur=[\d.]+;desc="(\d+) queries", serialize;dur=[\d.]+, total;dur=[\d.]+',
+            response['Server-Timing'],
+        )
+        self.assertIsNotNone(match)
+        self.assertEqual(int(match.group(1)), len(context.captured_queries))
+
+    async def test_server_timing_header_on_async_view(self) -> None:
+        token: Token = await Token.objects.aget(user=self.user)
+
+        response = await self.async_client.get(
+            reverse('recipe:async-recipe-list'),
+            headers={'Authorization': f'Token {token.key}'},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+;desc="[1-9]\d* queries"')
+
+    # Django only logs handler adaptation with DEBUG on.
+    @override_settings(DEBUG=True, DATABASE_REPLICAS=['replica'])
+    def test_async_handler_chain_not_adapted(self) -> None:
+        with mock.patch('django.core.handlers.base.logger') as logger:
+            ASGIHandler()
+
+        adapted: list[str] = [call.args[1] for call in logger.debug.call_args_list]
+        self.assertFalse([name for name in adapted if 'core.middleware' in name])
+
+    @override_settings(REQUEST_METRICS_SERVER_TIMING=False)
+    def test_server_timing_header_can_be_disabled(self) -> None:
+        response = self.client.get(RECIPES_URL)
+
+        self.assertNotIn('Server-Timing', response)
+
+    def test_metrics_require_staff(self) -> None:
+        response = self.client.get(METRICS_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_metrics_aggregate_per_route(self) -> None:
+        self.client.get(RECIPES_URL)
+        self.client.get(RECIPES_URL)
+        self.client.get('/no-such-page/')
+        self.client.force_authenticate(get_user_model().objects.create_superuser('admin@example.com', 'pass12345'))
+
+        response = self.client.get(METRICS_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        body: str = response.content.decode()
+        self.assertIn('http_requests_total{route="recipe:recipe-list",method="GET",status="200"} 2', body)
+        self.assertIn('http_requests_total{route="unmatched",method="GET",status="404"} 1', body)
+        self.assertIn('http_request_duration_seconds_count{route="recipe:recipe-list",method="GET"} 2', body)
+        self.assertIn('http_request_duration_seconds_bucket{route="recipe:recipe-list",method="GET",le="+Inf"} 2', body)
+        self.assertIn('http_request_db_queries_total{route="recipe:recipe-list",method="GET"}', body)
+        self.assertIn('http_request_serialize_seconds_total{route="recipe:recipe-list",method="GET"}', body)
+        self.assertIn('response_cache_lookups_total{result="misses"}', body)
@@ -1,5 +1,6 @@
 from decimal import Decimal
 
+from django.db import IntegrityError
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 
@@ -73,3 +74,63 @@ class ModelTests(TestCase):
         tag: models.Tag = models.Tag.objects.create(user=user, name='Tag1')
 
         self.assertEqual(str(tag), tag.name)
+
+    def test_tag_name_unique_per_user(self) -> None:
+        user: models.User = create_user()
+        other_user: models.User = create_user(email='other@example.com')
+        models.Tag.objects.create(user=user, name='Vegan')
+        models.Tag.objects.create(user=other_user, name='Vegan')
+
+        with self.assertRaises(IntegrityError):
+            models.Tag.objects.create(user=user, name='Vegan')
+
+    def test_get_or_create_many_tags(self) -> None:
+        user: models.User = create_user()
+        existing: models.Tag = models.Tag.objects.create(user=user, name='Vegan')
+
+        tags: dict[str, models.Tag] = models.Tag.objects.get_or_create_many(
+            user=user,
+            names=['Vegan', 'Dinner', 'Dinner'],
+        )
+
+        self.assertEqual(set(tags), {'Vegan', 'Dinner'})
+        self.assertEqual(tags['Vegan'].id, existing.id)
+        self.assertIsNotNone(tags['Dinner'].id)
+        self.assertEqual(models.Tag.objects.filter(user=user).count(), 2)
+
+    def test_tag_recipe_count_follows_links(self) -> None:
+        user: models.User = create_user()
+        vegan: models.Tag = models.Tag.objects.create(user=user, name='Vegan')
+        dinner: models.Tag = models.Tag.objects.create(user=user, name='Dinner')
+        first: models.Recipe = models.Recipe.objects.create(
+            user=user, title='Soup', time_minutes=5, price=Decimal('1.00'),
+        )
+        second: models.Recipe = models.Recipe.objects.create(
+            user=user, title='Salad', time_minutes=5, price=Decimal('1.00'),
+        )
+
+        first.tags.add(vegan, dinner)
+        second.tags.add(vegan)
+        vegan.refresh_from_db()
+        dinner.refresh_from_db()
+        self.assertEqual((vegan.recipe_count, dinner.recipe_count), (2, 1))
+
+        first.tags.remove(dinner)
+        second.delete()
+        vegan.refresh_from_db()
+        dinner.refresh_from_db()
+        self.assertEqual((vegan.recipe_count, dinner.recipe_count), (1, 0))
+
+    def test_tag_save_keeps_recipe_count(self) -> None:
+        user: models.User = create_user()
+        tag: models.Tag = models.Tag.objects.create(user=user, name='Vegan')
+        recipe: models.Recipe = models.Recipe.objects.create(
+            user=user, title='Soup', time_minutes=5, price=Decimal('1.00'),
+        )
+        recipe.tags.add(tag)
+
+        tag.name = 'Vegetarian'
+        tag.save()
+        tag.refresh_from_db()
+
+        self.assertEqual(tag.recipe_count, 1)
@@ -0,0 +1,30 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from core.models import Recipe, User
+from core.paginators import estimate_count
+
+
+class EstimateCountTests(TestCase):
+    def setUp(self) -> None:
+        self.user: User = get_user_model().objects.create_user(email='user@example.com', password='testpass123')
+        Recipe.objects.bulk_create(
+            Recipe(user=self.user, title=f'Recipe {i}', price=Decimal('1.00'), time_minutes=i)
+            for i in range(5)
+        )
+
+    def test_exact_below_limit(self) -> None:
+        self.assertEqual(estimate_count(Recipe.objects.all(), limit=10), (5, True))
+        self.assertEqual(estimate_count(Recipe.objects.filter(time_minutes__lt=2), limit=10), (2, True))
+
+    def test_exact_at_limit(self) -> None:
+        self.assertEqual(estimate_count(Recipe.objects.all(), limit=5), (5, True))
+
+    def test_capped_above_limit(self) -> None:
+        count, exact = estimate_count(Recipe.objects.order_by('title'), limit=3)
+
+        # Past the limit the count is an estimate; PostgreSQL's comes from the planner.
+        self.assertGreaterEqual(count, 3)
+        self.assertFalse(exact)
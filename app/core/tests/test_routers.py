@@ -0,0 +1,142 @@
+from unittest import mock
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from rest_framework.authtoken.models import Token
+
+from core.middleware import ReplicaRoutingMiddleware
+from core.models import Recipe, User
+from core.routers import PrimaryReplicaRouter, replica_reads
+from recipe.cache import bump_user_version
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class PrimaryReplicaRouterTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.router: PrimaryReplicaRouter = PrimaryReplicaRouter()
+
+    def test_reads_use_primary_by_default(self) -> None:
+        self.assertEqual(self.router.db_for_read(Recipe), 'default')
+
+    def test_reads_use_replica_when_enabled(self) -> None:
+        with replica_reads():
+            self.assertEqual(self.router.db_for_read(Recipe), 'replica')
+
+        self.assertEqual(self.router.db_for_read(Recipe), 'default')
+
+    def test_reads_inside_transaction_use_primary(self) -> None:
+        with mock.patch.object(connections['default'], 'in_atomic_block', True), replica_reads():
+            self.assertEqual(self.router.db_for_read(Recipe), 'default')
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_reads_use_primary_without_replicas(self) -> None:
+        with replica_reads():
+            self.assertEqual(self.router.db_for_read(Recipe), 'default')
+
+    def test_writes_and_migrations_use_primary(self) -> None:
+        with replica_reads():
+            self.assertEqual(self.router.db_for_write(Recipe), 'default')
+
+        self.assertTrue(self.router.allow_migrate('default', 'core'))
+        self.assertFalse(self.router.allow_migrate('replica', 'core'))
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReplicaRoutingMiddlewareTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.factory: RequestFactory = RequestFactory()
+        self.response_status: int = 200
+        self.read_from: list[str] = []
+        self.middleware: ReplicaRoutingMiddleware = ReplicaRoutingMiddleware(self.view)
+        self.user: User = get_user_model().objects.create_user(email='a@example.com', password='testpass123')
+        self.other: User = get_user_model().objects.create_user(email='b@example.com', password='testpass123')
+        self.tokens: dict[str, str] = {
+            'a': Token.objects.create(user=self.user).key,
+            'b': Token.objects.create(user=self.other).key,
+        }
+
+    def route_read(self) -> str:
+        # Look past the transaction TestCase wraps each test in.
+        with mock.patch.object(connections['default'], 'in_atomic_block', False):
+            return PrimaryReplicaRouter().db_for_read(Recipe)
+
+    def view(self, request: HttpRequest) -> HttpResponse:
+        self.read_from.append(self.route_read())
+
+        return HttpResponse(status=self.response_status)
+
+    def request(self, method: str, client: str) -> HttpRequest:
+        return getattr(self.factory, method)('/', HTTP_AUTHORIZATION=f'Token {self.tokens[client]}')
+
+    def get(self, client: str = 'a') -> str:
+        self.middleware(self.request('get', client))
+
+        return self.read_from[-1]
+
+    def post(self, client: str = 'a') -> None:
+        self.middleware(self.request('post', client))
+
+    def test_safe_requests_read_from_replica(self) -> None:
+        self.assertEqual(self.get(), 'replica')
+
+    def test_unsafe_requests_read_from_primary(self) -> None:
+        self.post()
+
+        self.assertEqual(self.read_from, ['default'])
+
+    def test_writer_reads_from_primary_after_write(self) -> None:
+        self.post('a')
+
+        self.assertEqual(self.get('a'), 'default')
+        self.assertEqual(self.get('b'), 'replica')
+
+    def test_pin_shared_by_clients_of_same_user(self) -> None:
+        self.post('a')
+        # The same user signed in with a session, e.g. in the browsable API.
+        request: HttpRequest = self.factory.get('/')
+        request.user = self.user
+
+        self.middleware(request)
+
+        self.assertEqual(self.read_from[-1], 'default')
+
+    def test_version_bump_pins_user(self) -> None:
+        bump_user_version(self.user.id)
+
+        self.assertEqual(self.get('a'), 'default')
+
+    def test_failed_write_does_not_pin(self) -> None:
+        self.response_status = 400
+        self.post('a')
+
+        self.assertEqual(self.get('a'), 'replica')
+
+    def test_invalid_token_reads_from_replica(self) -> None:
+        self.middleware(self.factory.get('/', HTTP_AUTHORIZATION='Token invalid'))
+
+        self.assertEqual(self.read_from, ['replica'])
+
+    @override_settings(DB_REPLICA_STICKY_SECONDS=0)
+    def test_pin_expires(self) -> None:
+        self.post('a')
+
+        self.assertEqual(self.get('a'), 'replica')
+
+    async def test_async_handler_not_adapted(self) -> None:
+        async def view(request: HttpRequest) -> HttpResponse:
+            self.read_from.append(self.route_read())
+            return HttpResponse()
+
+        middleware: ReplicaRoutingMiddleware = ReplicaRoutingMiddleware(view)
+        await sync_to_async(self.post)('a')
+
+        await middleware(self.request('get', 'a'))
+        await middleware(self.request('get', 'b'))
+
+        self.assertTrue(iscoroutinefunction(middleware))
+        self.assertEqual(self.read_from[-2:], ['default', 'replica'])
@@ -0,0 +1,80 @@
+import gzip
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+
+from rest_framework import status
+
+from core import schema
+from core.schema import schema_cache
+
+
+SCHEMA_URL = reverse('api-schema')
+
+
+class SchemaViewTests(SimpleTestCase):
+    def setUp(self) -> None:
+        schema_cache.reset()
+        self.addCleanup(schema_cache.reset)
+
+    def test_schema_generated_once(self) -> None:
+        with mock.patch('core.schema.generate_schema', wraps=schema.generate_schema) as generate:
+            first = self.client.get(SCHEMA_URL)
+            second = self.client.get(SCHEMA_URL, {'format': 'json'})
+
+        self.assertEqual(generate.call_count, 1)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertIn(b'openapi:', first.content)
+        self.assertIn('/api/recipes/recipes/', json.loads(second.content)['paths'])
+        self.assertNotEqual(first['ETag'], second['ETag'])
+
+    def test_not_modified(self) -> None:
+        etag: str = self.client.get(SCHEMA_URL)['ETag']
+
+        response = self.client.get(SCHEMA_URL, headers={'If-None-Match': etag})
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_gzip(self) -> None:
+        plain = self.client.get(SCHEMA_URL)
+
+        compressed = self.client.get(SCHEMA_URL, headers={'Accept-Encoding': 'gzip, br'})
+
+        self.assertEqual(compressed['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(compressed.content), plain.content)
+        self.assertLess(len(compressed.content), len(plain.content))
+        self.assertIn('Accept-Encoding', compressed['Vary'])
+
+    def test_served_from_built_file(self) -> None:
+        generated: bytes = self.client.get(SCHEMA_URL).content
+        schema_cache.reset()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path: Path = Path(directory) / 'openapi.json'
+            call_command('build_schema', file=str(path), stdout=StringIO())
+            with (
+                override_settings(API_SCHEMA_FILE=str(path)),
+                mock.patch('core.schema.generate_schema') as generate,
+            ):
+                response = self.client.get(SCHEMA_URL)
+
+        generate.assert_not_called()
+        self.assertEqual(response.content, generated)
+
+    def test_unknown_format(self) -> None:
+        response = self.client.get(SCHEMA_URL, {'format': 'xml'})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(API_DOCS_ENABLED=False, API_SCHEMA_FILE='')
+    def test_not_generated_without_docs(self) -> None:
+        with self.assertRaises(ImproperlyConfigured):
+            schema_cache.schema()
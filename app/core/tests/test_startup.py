@@ -0,0 +1,142 @@
+import asyncio
+import importlib
+import json
+import os
+import subprocess
+import sys
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import OperationalError, connection
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+
+from core.management.commands.profile_startup import parse_import_times
+from core.warmup import (
+    close_database_pools,
+    register_fork_hooks,
+    warm_up,
+    warm_up_databases,
+    warm_up_serializers,
+    warm_up_urls,
+)
+from recipe.views import RecipeViewSet
+
+
+class WarmUpTests(TransactionTestCase):
+    def setUp(self) -> None:
+        # Fork hooks can't be unregistered; keep them out of the test process.
+        fork_hooks = mock.patch('core.warmup.register_fork_hooks')
+        fork_hooks.start()
+        self.addCleanup(fork_hooks.stop)
+
+    def test_warm_up_reports_each_step(self) -> None:
+        timings: dict[str, float] = warm_up()
+
+        self.assertEqual(list(timings), ['urls', 'serializers', 'databases'])
+
+    def test_views_and_serializers_collected(self) -> None:
+        views = warm_up_urls()
+
+        self.assertIn(RecipeViewSet, [getattr(view, 'cls', None) for view in views])
+        self.assertGreater(warm_up_serializers(views), 0)
+
+    def test_unreachable_database_logged(self) -> None:
+        with (
+            mock.patch.object(connection, 'ensure_connection', side_effect=OperationalError('down')),
+            self.assertLogs('core.warmup', level='WARNING') as logs,
+        ):
+            warm_up()
+
+        self.assertIn("'default'", logs.output[0])
+
+    def test_database_error_of_any_kind_logged(self) -> None:
+        with (
+            mock.patch.object(connection, 'ensure_connection', side_effect=TypeError('bad option')),
+            self.assertLogs('core.warmup', level='WARNING') as logs,
+        ):
+            warm_up()
+
+        self.assertIn("'default'", logs.output[0])
+
+    @override_settings(WARM_UP_ON_STARTUP=True)
+    def test_asgi_import_inside_event_loop(self) -> None:
+        async def import_asgi() -> None:
+            importlib.import_module('app.asgi')
+
+        self.addCleanup(sys.modules.pop, 'app.asgi', None)
+        sys.modules.pop('app.asgi', None)
+        with mock.patch('core.warmup.logger') as logger:
+            asyncio.run(import_asgi())
+
+        logger.warning.assert_not_called()
+        logger.info.assert_called_once()
+
+
+class PreforkWarmUpTests(SimpleTestCase):
+    def test_fork_hooks_registered_once(self) -> None:
+        with (
+            mock.patch('core.warmup._fork_hooks_registered', False),
+            mock.patch('core.warmup.os.register_at_fork') as register_at_fork,
+        ):
+            register_fork_hooks()
+            register_fork_hooks()
+
+        register_at_fork.assert_called_once_with(before=close_database_pools, after_in_child=warm_up_databases)
+
+    def test_only_open_pools_closed_before_fork(self) -> None:
+        pooled = mock.Mock(alias='default', _connection_pools={'default': object()})
+        unpooled = mock.Mock(alias='replica', _connection_pools={})
+
+        with mock.patch('core.warmup.connections.all', return_value=[pooled, unpooled]):
+            close_database_pools()
+
+        pooled.close_pool.assert_called_once_with()
+        unpooled.close_pool.assert_not_called()
+
+
+class ApiDocsDisabledTests(SimpleTestCase):
+    def test_drf_spectacular_not_imported(self) -> None:
+        script: str = (
+            'import sys, django; django.setup();'
+            'from django.urls import get_resolver; get_resolver().url_patterns;'
+            'print(sorted(name for name in sys.modules if name.startswith("drf_spectacular")))'
+        )
+
+        result: subprocess.CompletedProcess = subprocess.run(
+            [sys.executable, '-c', script],
+            capture_output=True,
+            check=True,
+            text=True,
+            env={**os.environ, 'DJANGO_SETTINGS_MODULE': settings.SETTINGS_MODULE, 'API_DOCS_ENABLED': 'false'},
+        )
+
+        self.assertEqual(result.stdout.strip(), '[]')
+
+
+class ProfileStartupTests(SimpleTestCase):
+    def test_parse_import_times(self) -> None:
+        output: str = '\n'.join([
+            'import time: self [us] | cumulative | imported package',
+            'import time:       120 |        120 |     django.utils',
+            'import time:       300 |        420 |   django.conf',
+            'import time:        80 |        500 | django',
+        ])
+
+        self.assertEqual(parse_import_times(output), [
+            {'module': 'django.utils', 'depth': 2, 'self_s': 0.00012, 'cumulative_s': 0.00012},
+            {'module': 'django.conf', 'depth': 1, 'self_s': 0.0003, 'cumulative_s': 0.00042},
+            {'module': 'django', 'depth': 0, 'self_s': 0.00008, 'cumulative_s': 0.0005},
+        ])
+
+    def test_report(self) -> None:
+        output: StringIO = StringIO()
+
+        call_command('profile_startup', json=True, limit=5, stdout=output)
+
+        report: dict = json.loads(output.getvalue())
+        self.assertEqual(list(report['phases']), ['settings', 'apps', 'urls', 'total'])
+        self.assertIn('core', report['ready'])
+        self.assertIn('django', report['packages'])
+        self.assertEqual(len(report['modules']), 5)
@@ -0,0 +1,10 @@
+from django.urls import path
+
+from core import views
+
+
+app_name: str = 'core'
+
+urlpatterns: list = [
+    path(route='db-pool-stats/', view=views.DatabasePoolStatsView.as_view(), name='db-pool-stats'),
+]
@@ -0,0 +1,71 @@
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+
+from rest_framework.permissions import AllowAny, IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.authentication import CachedTokenAuthentication
+from core.database import pool_stats
+from core.instrumentation import metrics
+from core.openapi import OpenApiTypes, extend_schema
+from core.schema import (
+    JsonSchemaMediaType,
+    JsonSchemaMediaType2,
+    RenderedSchema,
+    YamlSchemaMediaType,
+    YamlSchemaMediaType2,
+    schema_cache,
+)
+from core.serializers import DatabasePoolStatsSerializer
+
+
+class DatabasePoolStatsView(APIView):
+    """Size, availability and wait counters of this worker's database pools."""
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(responses=DatabasePoolStatsSerializer(many=True))
+    def get(self, request: Request) -> Response:
+        return Response(pool_stats())
+
+
+class MetricsView(APIView):
+    """Per-route request metrics of this worker in the Prometheus text format."""
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(responses={(200, 'text/plain'): OpenApiTypes.STR})
+    def get(self, request: Request) -> HttpResponse:
+        return HttpResponse(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+class SchemaView(APIView):
+    """
+    OpenAPI schema of this API, as YAML or, with `?format=json`, JSON.
+
+    Served from the per-process `schema_cache` with an ETag, and gzipped for
+    clients that accept it.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    renderer_classes = [YamlSchemaMediaType, YamlSchemaMediaType2, JsonSchemaMediaType, JsonSchemaMediaType2]
+
+    @extend_schema(responses={200: OpenApiTypes.OBJECT})
+    def get(self, request: Request) -> HttpResponse:
+        rendered: RenderedSchema = schema_cache.rendered(request.accepted_renderer.format)
+        if rendered.etag in parse_etags(request.headers.get('If-None-Match', '')):
+            response: HttpResponse = HttpResponseNotModified()
+        elif 'gzip' in request.headers.get('Accept-Encoding', ''):
+            response = HttpResponse(rendered.gzipped, content_type=request.accepted_media_type)
+            response['Content-Encoding'] = 'gzip'
+        else:
+            response = HttpResponse(rendered.content, content_type=request.accepted_media_type)
+
+        response['ETag'] = rendered.etag
+        response['Cache-Control'] = 'public, max-age=0, must-revalidate'
+        patch_vary_headers(response, ['Accept', 'Accept-Encoding'])
+
+        return response
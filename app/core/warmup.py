@@ -0,0 +1,130 @@
+"""
+Work a fresh worker would otherwise do while serving its first requests.
+
+`warm_up()` runs from the WSGI/ASGI entry points when WARM_UP_ON_STARTUP is
+set, so rolling deploys and autoscaling don't route traffic to a worker
+that still has to compile URL patterns, build serializer fields and open
+its database connections.
+
+Servers that load the application before forking workers (`gunicorn
+--preload`) run it in the master. Its connection pools are closed before
+each fork and the databases are warmed up again in the new worker, so
+workers never share the master's sockets.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+
+from django.db import connections
+from django.urls import URLPattern, URLResolver, get_resolver
+
+from rest_framework.serializers import BaseSerializer
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def iter_views(patterns: list[URLPattern | URLResolver]) -> Iterator[Callable]:
+    """Yield the view of every URL pattern, compiling each pattern's regex."""
+    for pattern in patterns:
+        pattern.pattern.regex
+        if isinstance(pattern, URLResolver):
+            yield from iter_views(pattern.url_patterns)
+        else:
+            yield pattern.callback
+
+
+def warm_up_urls() -> list[Callable]:
+    resolver: URLResolver = get_resolver()
+    # Building the reverse lookup tables walks and imports every URLconf.
+    resolver.reverse_dict
+
+    return list(iter_views(resolver.url_patterns))
+
+
+def warm_up_serializers(views: list[Callable]) -> int:
+    serializer_classes: set[type[BaseSerializer]] = {
+        view.cls.serializer_class
+        for view in views
+        if getattr(getattr(view, 'cls', None), 'serializer_class', None) is not None
+    }
+    for serializer_class in serializer_classes:
+        serializer_class().fields
+
+    return len(serializer_classes)
+
+
+def connect_databases() -> None:
+    for connection in connections.all():
+        try:
+            connection.ensure_connection()
+        except Exception:
+            # A worker that can't warm up should still start and serve.
+            logger.warning('Warm-up could not connect to database %r.', connection.alias, exc_info=True)
+        finally:
+            try:
+                # Hands pooled connections back instead of tying them to this thread.
+                connection.close()
+            except Exception:
+                logger.warning('Warm-up could not close database %r.', connection.alias, exc_info=True)
+
+
+def warm_up_databases() -> None:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        connect_databases()
+        return
+
+    # ASGI servers may import the application from inside their event loop,
+    # where Django refuses synchronous database access.
+    thread: threading.Thread = threading.Thread(target=connect_databases, name='warm-up-databases')
+    thread.start()
+    thread.join()
+
+
+def close_database_pools() -> None:
+    for connection in connections.all():
+        # Only pools this process opened; the `pool` property would create one.
+        if connection.alias in getattr(connection, '_connection_pools', {}):
+            connection.close_pool()
+
+
+_fork_hooks_registered: bool = False
+
+
+def register_fork_hooks() -> None:
+    global _fork_hooks_registered
+    if not _fork_hooks_registered:
+        os.register_at_fork(before=close_database_pools, after_in_child=warm_up_databases)
+        _fork_hooks_registered = True
+
+
+def warm_up() -> dict[str, float]:
+    """Run every warm-up step and return the seconds each one took."""
+    timings: dict[str, float] = {}
+
+    started: float = time.perf_counter()
+    views: list[Callable] = warm_up_urls()
+    timings['urls'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    serializers: int = warm_up_serializers(views)
+    timings['serializers'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    warm_up_databases()
+    register_fork_hooks()
+    timings['databases'] = time.perf_counter() - started
+
+    logger.info(
+        'Worker warmed up: %d views, %d serializers, %s.',
+        len(views),
+        serializers,
+        ', '.join(f'{step} {seconds * 1000:.0f} ms' for step, seconds in timings.items()),
+    )
+
+    return timings
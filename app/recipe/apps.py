@@ -4,3 +4,13 @@ from django.apps import AppConfig
 class RecipeConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'recipe'
+
+    def ready(self) -> None:
+        from recipe import signals  # noqa: F401
+        from core.instrumentation import format_metric, metrics
+        from recipe.cache import stats
+
+        metrics.register_collector(lambda: format_metric(
+            'response_cache_lookups_total', 'counter', 'Recipe and tag response cache lookups, by result.',
+            (('', {'result': result}, count) for result, count in stats.as_dict().items()),
+        ))
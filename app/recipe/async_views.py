@@ -0,0 +1,197 @@
+"""
+Native async read endpoints for recipes and tags.
+
+These mirror the list/retrieve responses of `RecipeViewSet` and `TagViewSet`
+but run on Django's async ORM, so under ASGI a worker serves many concurrent
+(slow) clients from its event loop instead of one thread per request.
+"""
+from functools import partial, wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import QuerySet
+from django.http import HttpRequest, JsonResponse
+from django.views.decorators.http import require_safe
+
+from rest_framework.exceptions import AuthenticationFailed
+
+from core.authentication import CachedTokenAuthentication
+from core.models import Recipe, Tag
+from core.paginators import estimate_count
+from recipe.fieldsets import SparseFieldsSerializer
+from recipe.filters import TagFilterSerializer, filter_tags
+from recipe.pagination import PaginationCountSerializer, decode_position, encode_position
+from recipe.serializers import (
+    RecipeReadSerializer,
+    RecipeDetailReadSerializer,
+    TagDetailSerializer,
+    aget_tags_by_recipe,
+)
+
+
+authentication: CachedTokenAuthentication = CachedTokenAuthentication()
+
+
+def token_required(view):
+    @wraps(view)
+    async def wrapper(request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        try:
+            result = await authentication.aauthenticate(request)
+        except AuthenticationFailed as exc:
+            return _unauthorized(str(exc.detail))
+        if result is None:
+            return _unauthorized('Authentication credentials were not provided.')
+
+        request.user, request.auth = result
+
+        return await view(request, *args, **kwargs)
+
+    return wrapper
+
+
+def _unauthorized(detail: str) -> JsonResponse:
+    response: JsonResponse = JsonResponse({'detail': detail}, status=401)
+    response['WWW-Authenticate'] = authentication.authenticate_header(None)
+
+    return response
+
+
+def _not_found() -> JsonResponse:
+    return JsonResponse({'detail': 'Not found.'}, status=404)
+
+
+def _page_size(request: HttpRequest) -> int:
+    try:
+        page_size: int = int(request.GET.get('page_size', settings.API_PAGE_SIZE))
+    except ValueError:
+        page_size = settings.API_PAGE_SIZE
+
+    return max(1, min(page_size, settings.API_MAX_PAGE_SIZE))
+
+
+async def _paginate(request: HttpRequest, queryset: QuerySet, field: str) -> tuple[list[dict], str | None]:
+    """Keyset pagination on a unique, descending `field`."""
+    cursor: str | None = request.GET.get('cursor')
+    if cursor:
+        queryset = queryset.filter(**{f'{field}__lt': decode_position(cursor)})
+
+    page_size: int = _page_size(request)
+    rows: list[dict] = [row async for row in queryset[:page_size + 1]]
+    if len(rows) <= page_size:
+        return rows, None
+
+    query = request.GET.copy()
+    query['cursor'] = encode_position(str(rows[page_size - 1][field]))
+
+    return rows[:page_size], request.build_absolute_uri(f'{request.path}?{query.urlencode()}')
+
+
+async def _page_response(request: HttpRequest, queryset: QuerySet, field: str, serialize) -> JsonResponse:
+    params = PaginationCountSerializer(data=request.GET)
+    if not params.is_valid():
+        return JsonResponse(params.errors, status=400)
+
+    try:
+        rows, next_url = await _paginate(request, queryset, field)
+    except ValueError as exc:
+        return JsonResponse({'detail': str(exc)}, status=404)
+
+    page: dict = {
+        'next': next_url,
+        'previous': None,
+        'results': await serialize(rows),
+    }
+    if params.validated_data['with_count']:
+        count, exact = await sync_to_async(estimate_count)(queryset, settings.API_COUNT_LIMIT)
+        page = {'count': count, 'count_exact': exact, **page}
+
+    return JsonResponse(page)
+
+
+def _sparse_fields(request: HttpRequest, serializer_class) -> SparseFieldsSerializer:
+    return SparseFieldsSerializer(data=request.GET, context={'allowed_fields': serializer_class.Meta.fields})
+
+
+async def _serialize_recipes(
+    rows: list[dict],
+    serializer_class=RecipeReadSerializer,
+    fields: list[str] | None = None,
+) -> list[dict]:
+    serializer = serializer_class(fields=fields)
+    if 'tags' in serializer.selected_fields:
+        tags: dict[int, list[dict]] = await aget_tags_by_recipe([row['id'] for row in rows])
+        for row in rows:
+            row['tags'] = tags.get(row['id'], [])
+
+    return [serializer.to_representation(row) for row in rows]
+
+
+async def _serialize_tags(rows: list[dict]) -> list[dict]:
+    return rows
+
+
+@require_safe
+@token_required
+async def recipe_list(request: HttpRequest) -> JsonResponse:
+    params: SparseFieldsSerializer = _sparse_fields(request, RecipeReadSerializer)
+    if not params.is_valid():
+        return JsonResponse(params.errors, status=400)
+
+    fields: list[str] | None = params.validated_data.get('fields')
+    queryset: QuerySet = (
+        Recipe.objects
+        .filter(user=request.user)
+        .order_by('-id')
+        .values(*RecipeReadSerializer.get_value_fields(fields))
+    )
+
+    return await _page_response(request, queryset, 'id', partial(_serialize_recipes, fields=fields))
+
+
+@require_safe
+@token_required
+async def recipe_detail(request: HttpRequest, pk: int) -> JsonResponse:
+    params: SparseFieldsSerializer = _sparse_fields(request, RecipeDetailReadSerializer)
+    if not params.is_valid():
+        return JsonResponse(params.errors, status=400)
+
+    fields: list[str] | None = params.validated_data.get('fields')
+    try:
+        row: dict = await (
+            Recipe.objects
+            .filter(user=request.user)
+            .values(*RecipeDetailReadSerializer.get_value_fields(fields))
+            .aget(pk=pk)
+        )
+    except Recipe.DoesNotExist:
+        return _not_found()
+
+    recipes: list[dict] = await _serialize_recipes([row], RecipeDetailReadSerializer, fields)
+
+    return JsonResponse(recipes[0])
+
+
+@require_safe
+@token_required
+async def tag_list(request: HttpRequest) -> JsonResponse:
+    params = TagFilterSerializer(data=request.GET)
+    if not params.is_valid():
+        return JsonResponse(params.errors, status=400)
+
+    queryset: QuerySet = filter_tags(
+        Tag.objects.filter(user=request.user).order_by('-name').values(*TagDetailSerializer.Meta.fields),
+        params.validated_data,
+    )
+
+    return await _page_response(request, queryset, 'name', _serialize_tags)
+
+
+@require_safe
+@token_required
+async def tag_detail(request: HttpRequest, pk: int) -> JsonResponse:
+    try:
+        tag: dict = await Tag.objects.filter(user=request.user).values(*TagDetailSerializer.Meta.fields).aget(pk=pk)
+    except Tag.DoesNotExist:
+        return _not_found()
+
+    return JsonResponse(tag)
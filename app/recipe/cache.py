@@ -0,0 +1,96 @@
+import threading
+import time
+from hashlib import sha256
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.db import transaction
+
+from core.routers import pin_to_primary
+
+
+class CacheStats:
+    """Process-local hit and miss counters for the response cache."""
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def as_dict(self) -> dict[str, int]:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+stats: CacheStats = CacheStats()
+
+
+def get_response_cache() -> BaseCache:
+    return caches[settings.RESPONSE_CACHE_ALIAS]
+
+
+def _version_key(user_id: int) -> str:
+    return f'recipe-api:version:{user_id}'
+
+
+def _initial_version() -> int:
+    # Seeded from the clock, so a version key that was evicted restarts
+    # above any version still embedded in cached responses.
+    return time.time_ns() // 1000
+
+
+def get_user_version(user_id: int) -> int:
+    """Return the current version of a user's recipes and tags."""
+    cache: BaseCache = get_response_cache()
+    key: str = _version_key(user_id)
+    version: int | None = cache.get(key)
+    if version is None:
+        version = _initial_version()
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+
+    return version
+
+
+def _bump(user_id: int) -> None:
+    cache: BaseCache = get_response_cache()
+    key: str = _version_key(user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _initial_version(), timeout=None)
+    if settings.DATABASE_REPLICAS:
+        # Responses cached under the new version must come from the primary,
+        # not from a replica that may not have the change yet.
+        pin_to_primary(user_id)
+
+
+def bump_user_version(user_id: int) -> None:
+    """
+    Invalidate every cached response of a user.
+
+    The version is bumped right away and again once the surrounding
+    transaction commits, so a read that raced the write can't leave
+    uncommitted-era data cached under the new version.
+    """
+    _bump(user_id)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _bump(user_id))
+
+
+def response_cache_key(user_id: int, version: int, *parts: str) -> str:
+    digest: str = sha256(':'.join(parts).encode()).hexdigest()
+    return f'recipe-api:response:{user_id}:{version}:{digest}'
@@ -0,0 +1,78 @@
+import csv
+import json
+from collections.abc import Iterator
+from itertools import islice
+
+from django.db.models import QuerySet
+
+from rest_framework import serializers
+
+from recipe.serializers import RecipeDetailReadSerializer, get_tags_by_recipe
+
+
+NDJSON: str = 'ndjson'
+CSV: str = 'csv'
+
+CONTENT_TYPES: dict[str, str] = {
+    NDJSON: 'application/x-ndjson',
+    CSV: 'text/csv; charset=utf-8',
+}
+
+# Tag names are joined into a single CSV column.
+CSV_TAG_SEPARATOR: str = ';'
+
+# Image URLs point into this deployment's storage, so exports leave them out.
+EXPORT_FIELDS: list[str] = [field for field in RecipeDetailReadSerializer.Meta.fields if field != 'images']
+
+
+class RecipeExportSerializer(serializers.Serializer):
+    export_format = serializers.ChoiceField(choices=list(CONTENT_TYPES), default=NDJSON)
+
+
+def iter_recipe_chunks(queryset: QuerySet, chunk_size: int) -> Iterator[list[dict]]:
+    """
+    Render a `values()` queryset with RecipeDetailReadSerializer, chunk by chunk.
+
+    Rows come from a server-side cursor and tags are loaded with one query per
+    chunk, so memory is bounded by `chunk_size` rather than the result size.
+    """
+    serializer: RecipeDetailReadSerializer = RecipeDetailReadSerializer(fields=EXPORT_FIELDS)
+    rows: Iterator[dict] = queryset.iterator(chunk_size=chunk_size)
+    while chunk := list(islice(rows, chunk_size)):
+        tags: dict[int, list[dict]] = get_tags_by_recipe([row['id'] for row in chunk])
+        for row in chunk:
+            row['tags'] = tags.get(row['id'], [])
+
+        yield [serializer.to_representation(row) for row in chunk]
+
+
+class _Buffer:
+    """File-like object that hands back what the csv writer writes."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def render_ndjson(chunks: Iterator[list[dict]]) -> Iterator[str]:
+    for chunk in chunks:
+        yield ''.join(json.dumps(recipe, ensure_ascii=False) + '\n' for recipe in chunk)
+
+
+def render_csv(chunks: Iterator[list[dict]]) -> Iterator[str]:
+    writer = csv.writer(_Buffer())
+    columns: list[str] = EXPORT_FIELDS
+    yield writer.writerow(columns)
+    for chunk in chunks:
+        yield ''.join(
+            writer.writerow([
+                CSV_TAG_SEPARATOR.join(tag['name'] for tag in recipe['tags']) if column == 'tags' else recipe[column]
+                for column in columns
+            ])
+            for recipe in chunk
+        )
+
+
+def export_recipes(queryset: QuerySet, export_format: str, chunk_size: int) -> Iterator[str]:
+    render = render_csv if export_format == CSV else render_ndjson
+
+    return render(iter_recipe_chunks(queryset, chunk_size))
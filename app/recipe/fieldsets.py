@@ -0,0 +1,29 @@
+from rest_framework import serializers
+
+
+class SparseFieldsSerializer(serializers.Serializer):
+    """
+    `?fields=id,title,price` limits a read response to the given fields.
+
+    The fields a view can return are passed as `allowed_fields` in the
+    context; the validated value lists the requested ones in that order.
+    """
+    fields = serializers.CharField(
+        required=False,
+        trim_whitespace=True,
+        help_text='Comma-separated fields to return, e.g. `id,title,price`. Tags are only loaded when listed.',
+    )
+
+    def validate_fields(self, value: str) -> list[str]:
+        allowed: list[str] = self.context['allowed_fields']
+        requested: set[str] = {name.strip() for name in value.split(',') if name.strip()}
+        if not requested:
+            raise serializers.ValidationError('Expected a comma-separated list of fields.')
+
+        unknown: set[str] = requested - set(allowed)
+        if unknown:
+            raise serializers.ValidationError(
+                f'Unknown fields: {", ".join(sorted(unknown))}. Choose from: {", ".join(allowed)}.'
+            )
+
+        return [name for name in allowed if name in requested]
@@ -0,0 +1,100 @@
+from django.db.models import Exists, OuterRef, QuerySet
+
+from rest_framework import serializers
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.request import Request
+
+from core.models import Recipe
+
+
+class RecipeFilterSerializer(serializers.Serializer):
+    MATCH_ANY: str = 'any'
+    MATCH_ALL: str = 'all'
+    MAX_TAGS: int = 50
+
+    tags = serializers.CharField(required=False, help_text='Comma-separated tag ids.')
+    tags_match = serializers.ChoiceField(choices=[MATCH_ANY, MATCH_ALL], default=MATCH_ANY)
+    price_min = serializers.DecimalField(max_digits=5, decimal_places=2, required=False)
+    price_max = serializers.DecimalField(max_digits=5, decimal_places=2, required=False)
+    time_minutes_min = serializers.IntegerField(required=False)
+    time_minutes_max = serializers.IntegerField(required=False)
+
+    def validate_tags(self, value: str) -> list[int]:
+        try:
+            tag_ids: list[int] = [int(tag_id) for tag_id in value.split(',') if tag_id.strip()]
+        except ValueError:
+            raise serializers.ValidationError('Expected a comma-separated list of tag ids.')
+        if len(tag_ids) > self.MAX_TAGS:
+            raise serializers.ValidationError(f'Filter by at most {self.MAX_TAGS} tags.')
+
+        return list(dict.fromkeys(tag_ids))
+
+
+class RecipeFilterBackend(BaseFilterBackend):
+    """
+    Filter recipes by `?tags=1,2&tags_match=any|all`, `price_min`/`price_max`
+    and `time_minutes_min`/`time_minutes_max`.
+
+    Ranges are served by the (user, price) and (user, time_minutes) indexes;
+    tags use EXISTS probes on the recipe_tags unique index, so no DISTINCT
+    over a join is needed.
+    """
+
+    def filter_queryset(self, request: Request, queryset: QuerySet, view) -> QuerySet:
+        params = RecipeFilterSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+
+        return filter_recipes(queryset, params.validated_data)
+
+
+def filter_recipes(queryset: QuerySet, params: dict) -> QuerySet:
+    ranges: dict[str, str] = {
+        'price_min': 'price__gte',
+        'price_max': 'price__lte',
+        'time_minutes_min': 'time_minutes__gte',
+        'time_minutes_max': 'time_minutes__lte',
+    }
+    queryset = queryset.filter(**{
+        lookup: params[param]
+        for param, lookup in ranges.items()
+        if params.get(param) is not None
+    })
+
+    tag_ids: list[int] = params.get('tags') or []
+    if not tag_ids:
+        return queryset
+
+    links: QuerySet = Recipe.tags.through.objects.filter(recipe_id=OuterRef('pk'))
+    if params.get('tags_match') == RecipeFilterSerializer.MATCH_ALL:
+        for tag_id in tag_ids:
+            queryset = queryset.filter(Exists(links.filter(tag_id=tag_id)))
+
+        return queryset
+
+    return queryset.filter(Exists(links.filter(tag_id__in=tag_ids)))
+
+
+class TagFilterSerializer(serializers.Serializer):
+    assigned_only = serializers.BooleanField(default=False, help_text='Only tags used by at least one recipe.')
+
+
+class TagFilterBackend(BaseFilterBackend):
+    """
+    Keep only tags used by a recipe with `?assigned_only=1`.
+
+    Reads the trigger-maintained `recipe_count`, which the partial
+    (user, -name) index covers, instead of probing the link table per tag.
+    """
+
+    def filter_queryset(self, request: Request, queryset: QuerySet, view) -> QuerySet:
+        params = TagFilterSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+
+        return filter_tags(queryset, params.validated_data)
+
+
+def filter_tags(queryset: QuerySet, params: dict) -> QuerySet:
+    if params.get('assigned_only'):
+        return queryset.filter(recipe_count__gt=0)
+
+    return queryset
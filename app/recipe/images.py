@@ -0,0 +1,203 @@
+"""
+Recipe image uploads and their thumbnails.
+
+Uploads are streamed to a temporary file and moved into storage, never held
+in memory. Thumbnails for each of RECIPE_IMAGE_SIZES are rendered by worker
+processes after the upload is committed, and recorded in
+`Recipe.image_sizes` one by one as they finish. They are written next to the
+original, so storage has to be on a local or mounted filesystem.
+"""
+import logging
+import multiprocessing
+import posixpath
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.db import connections, transaction
+
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from core.models import Recipe
+from recipe.cache import bump_user_version
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Allowance for multipart boundaries, part headers and other form fields on
+# top of the image itself.
+MULTIPART_OVERHEAD_BYTES: int = 64 * 1024
+
+
+class ImageTooLarge(APIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = 'The image is too large.'
+    default_code = 'image_too_large'
+
+
+class RecipeImageUploadHandler(TemporaryFileUploadHandler):
+    """
+    Streams uploads to a temporary file, refusing them past RECIPE_IMAGE_MAX_BYTES.
+
+    Requests that announce a larger body are refused before any of it is
+    read; others are cut off at the first chunk over the limit.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.max_bytes: int = settings.RECIPE_IMAGE_MAX_BYTES
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None) -> None:
+        if content_length and content_length > self.max_bytes + MULTIPART_OVERHEAD_BYTES:
+            raise self.too_large()
+
+    def receive_data_chunk(self, raw_data: bytes, start: int) -> bytes | None:
+        if start + len(raw_data) > self.max_bytes:
+            raise self.too_large()
+
+        return super().receive_data_chunk(raw_data, start)
+
+    def too_large(self) -> ImageTooLarge:
+        return ImageTooLarge(f'Images are limited to {self.max_bytes} bytes.')
+
+
+def thumbnail_name(name: str, label: str) -> str:
+    return f'{posixpath.splitext(name)[0]}_{label}.webp'
+
+
+def image_urls(name: str, sizes: dict[str, str]) -> dict[str, str] | None:
+    """URLs of an image and of each thumbnail rendered so far, smallest first."""
+    if not name:
+        return None
+
+    urls: dict[str, str] = {'original': default_storage.url(name)}
+    for label in sorted(settings.RECIPE_IMAGE_SIZES, key=settings.RECIPE_IMAGE_SIZES.get):
+        if label in sizes:
+            urls[label] = default_storage.url(sizes[label])
+
+    return urls
+
+
+def delete_image_files(name: str) -> None:
+    """Delete an image and its thumbnails, whichever of them exist."""
+    for file_name in [name, *(thumbnail_name(name, label) for label in settings.RECIPE_IMAGE_SIZES)]:
+        default_storage.delete(file_name)
+
+
+def record_thumbnail(recipe_id: int, name: str, label: str, thumbnail: str) -> None:
+    """
+    Add a rendered thumbnail to its recipe.
+
+    The thumbnail is deleted instead when the recipe's image has been
+    replaced or the recipe deleted since it was queued.
+    """
+    with transaction.atomic():
+        recipe: dict | None = (
+            Recipe.objects
+            .select_for_update()
+            .filter(id=recipe_id, image=name)
+            .values('user_id', 'image_sizes')
+            .first()
+        )
+        if recipe is not None:
+            Recipe.objects.filter(id=recipe_id).update(image_sizes={**recipe['image_sizes'], label: thumbnail})
+
+    if recipe is None:
+        default_storage.delete(thumbnail)
+        return
+
+    # update() skips model signals, so invalidate cached reads here.
+    bump_user_version(recipe['user_id'])
+
+
+class ThumbnailQueue:
+    """
+    Renders thumbnails in a pool of RECIPE_THUMBNAIL_WORKERS processes.
+
+    The pool is started on first use, with spawned rather than forked workers
+    since web workers run threads. Each size is a task of its own, so small
+    thumbnails are served while larger ones are still rendering. With no
+    workers configured, thumbnails are rendered in the calling thread.
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+
+    def submit(self, recipe_id: int, name: str) -> None:
+        # Imported here so only processes that render thumbnails load Pillow.
+        from recipe.thumbnails import make_thumbnail
+
+        source: str = default_storage.path(name)
+        for label, max_side in sorted(settings.RECIPE_IMAGE_SIZES.items(), key=lambda item: item[1]):
+            thumbnail: str = thumbnail_name(name, label)
+            args: tuple = (source, max_side, default_storage.path(thumbnail))
+            if settings.RECIPE_THUMBNAIL_WORKERS:
+                future: Future = self._submit(make_thumbnail, *args)
+                future.add_done_callback(partial(self._finished, recipe_id, name, label, thumbnail))
+                continue
+
+            try:
+                make_thumbnail(*args)
+                record_thumbnail(recipe_id, name, label, thumbnail)
+            except Exception:
+                logger.exception('Could not create the %s thumbnail of recipe %d.', label, recipe_id)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+    def _submit(self, *args) -> Future:
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._start()
+            try:
+                return self._executor.submit(*args)
+            except BrokenProcessPool:
+                # A worker died, e.g. killed for using too much memory.
+                self._executor = self._start()
+                return self._executor.submit(*args)
+
+    def _start(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=settings.RECIPE_THUMBNAIL_WORKERS,
+            mp_context=multiprocessing.get_context('spawn'),
+        )
+
+    def _finished(self, recipe_id: int, name: str, label: str, thumbnail: str, future: Future) -> None:
+        # Runs on the pool's management thread, which opens its own connections.
+        try:
+            future.result()
+            record_thumbnail(recipe_id, name, label, thumbnail)
+        except Exception:
+            logger.exception('Could not create the %s thumbnail of recipe %d.', label, recipe_id)
+        finally:
+            connections.close_all()
+
+
+thumbnail_queue: ThumbnailQueue = ThumbnailQueue()
+
+
+def store_recipe_image(recipe: Recipe, upload: UploadedFile) -> None:
+    """
+    Replace a recipe's image and queue its thumbnails.
+
+    Temporary uploads are moved into storage rather than copied. The previous
+    image and its thumbnails are deleted once the new one is committed.
+    """
+    previous: str = recipe.image.name
+    recipe.image = upload
+    recipe.image_sizes = {}
+    recipe.save(update_fields=['image', 'image_sizes'])
+
+    transaction.on_commit(partial(thumbnail_queue.submit, recipe.id, recipe.image.name))
+    if previous:
+        transaction.on_commit(partial(delete_image_files, previous))
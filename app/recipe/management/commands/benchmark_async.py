@@ -0,0 +1,121 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.contrib.auth import get_user_model
+from django.db import close_old_connections
+from django.test import AsyncClient, Client, override_settings
+from django.urls import reverse
+
+from rest_framework.authtoken.models import Token
+
+from core.benchmarks import summarize
+from core.models import Recipe, User
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare recipe list throughput at high concurrency: the sync DRF view '
+        'under WSGI and ASGI, and the native async view under ASGI.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--requests', type=int, default=2_000)
+        parser.add_argument('--concurrency', type=int, default=100)
+        parser.add_argument('--recipes', type=int, default=100)
+        parser.add_argument('--json', action='store_true', help='Print results as JSON.')
+        parser.add_argument(
+            '--allow-writes',
+            action='store_true',
+            help='Run even with DEBUG off. The command creates and deletes a benchmark user and its recipes.',
+        )
+
+    def handle(self, *args, **options) -> None:
+        if not settings.DEBUG and not options['allow_writes']:
+            raise CommandError(
+                'benchmark_async writes to the configured database; '
+                'run it with DEBUG on or pass --allow-writes.'
+            )
+
+        email: str = 'benchmark-async@example.com'
+        get_user_model().objects.filter(email=email).delete()
+        user: User = get_user_model().objects.create_user(email=email, password='benchmark')
+        try:
+            Recipe.objects.bulk_create(
+                Recipe(user=user, title=f'Recipe {i}', time_minutes=10, price=Decimal('1.00'))
+                for i in range(options['recipes'])
+            )
+            token: Token = Token.objects.create(user=user)
+            headers: dict[str, str] = {'Authorization': f'Token {token.key}'}
+
+            # Disable the response cache so every request reaches the view.
+            with override_settings(ALLOWED_HOSTS=['*'], RESPONSE_CACHE_TIMEOUT=0):
+                results: list[dict] = [
+                    self.run_wsgi(reverse('recipe:recipe-list'), headers, options),
+                    self.run_asgi('asgi-sync', reverse('recipe:recipe-list'), headers, options),
+                    self.run_asgi('asgi-async', reverse('recipe:async-recipe-list'), headers, options),
+                ]
+        finally:
+            user.delete()
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        for result in results:
+            self.stdout.write(
+                f"{result['mode']:>10}: {result['throughput_rps']:8.1f} req/s, {result['errors']} errors, "
+                f"p50 {result['latency']['p50_ms']:.1f} ms, p99 {result['latency']['p99_ms']:.1f} ms"
+            )
+
+    def run_wsgi(self, url: str, headers: dict[str, str], options: dict) -> dict:
+        client: Client = Client()
+
+        def request() -> tuple[float, int]:
+            started: float = time.perf_counter()
+            response = client.get(url, headers=headers)
+            close_old_connections()
+
+            return time.perf_counter() - started, response.status_code
+
+        started: float = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as executor:
+            samples: list[tuple[float, int]] = list(executor.map(lambda _: request(), range(options['requests'])))
+
+        return self.result('wsgi-sync', samples, time.perf_counter() - started, options)
+
+    def run_asgi(self, mode: str, url: str, headers: dict[str, str], options: dict) -> dict:
+        async def run() -> tuple[list[tuple[float, int]], float]:
+            client: AsyncClient = AsyncClient()
+            semaphore: asyncio.Semaphore = asyncio.Semaphore(options['concurrency'])
+
+            async def request() -> tuple[float, int]:
+                async with semaphore:
+                    started: float = time.perf_counter()
+                    response = await client.get(url, headers=headers)
+
+                    return time.perf_counter() - started, response.status_code
+
+            started: float = time.perf_counter()
+            samples: list[tuple[float, int]] = await asyncio.gather(*(request() for _ in range(options['requests'])))
+
+            return samples, time.perf_counter() - started
+
+        samples, elapsed = asyncio.run(run())
+
+        return self.result(mode, samples, elapsed, options)
+
+    def result(self, mode: str, samples: list[tuple[float, int]], elapsed: float, options: dict) -> dict:
+        return {
+            'mode': mode,
+            'requests': options['requests'],
+            'errors': sum(1 for _, status_code in samples if status_code != 200),
+            'concurrency': options['concurrency'],
+            'elapsed_s': elapsed,
+            'throughput_rps': options['requests'] / elapsed,
+            'latency': summarize([latency for latency, _ in samples]),
+        }
@@ -0,0 +1,96 @@
+import json
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from core.benchmarks import measure, summarize
+from core.models import Recipe, Tag, User
+from recipe.serializers import RecipeSerializer, RecipeReadSerializer
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Compare RecipeSerializer with the values() read path on generated recipes.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+        parser.add_argument('--tags-per-recipe', type=int, default=3)
+        parser.add_argument('--repeat', type=int, default=3)
+        parser.add_argument('--json', action='store_true', help='Print results as JSON.')
+
+    def handle(self, *args, **options) -> None:
+        results: list[dict] = []
+        for size in options['sizes']:
+            try:
+                with transaction.atomic():
+                    results.append(self.run(size, options['tags_per_recipe'], options['repeat']))
+                    raise Rollback
+            except Rollback:
+                pass
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        for result in results:
+            self.stdout.write(
+                f"{result['recipes']:>8} recipes: "
+                f"model serializer {result['model_serializer']['p50_ms']:.1f} ms, "
+                f"fast path {result['fast_path']['p50_ms']:.1f} ms, "
+                f"speedup x{result['speedup']:.1f}"
+            )
+
+    def run(self, size: int, tags_per_recipe: int, repeat: int) -> dict:
+        user: User = get_user_model().objects.create_user(email='benchmark@example.com', password='benchmark')
+        tags: list[Tag] = Tag.objects.bulk_create(
+            Tag(user=user, name=f'Tag {i}') for i in range(max(tags_per_recipe, 20))
+        )
+        recipes: list[Recipe] = Recipe.objects.bulk_create(
+            (
+                Recipe(
+                    user=user,
+                    title=f'Recipe {i}',
+                    description='Benchmark recipe',
+                    time_minutes=i % 120,
+                    price=Decimal(i % 10_000) / 100,
+                    link='http://example.com/recipe.pdf',
+                )
+                for i in range(size)
+            ),
+            batch_size=5_000,
+        )
+        Recipe.tags.through.objects.bulk_create(
+            (
+                Recipe.tags.through(recipe_id=recipe.id, tag_id=tags[(recipe.id + j) % len(tags)].id)
+                for recipe in recipes
+                for j in range(tags_per_recipe)
+            ),
+            batch_size=5_000,
+        )
+
+        recipes_queryset = Recipe.objects.filter(user=user).order_by('-id')
+        model_samples: list[float] = measure(
+            lambda: RecipeSerializer(recipes_queryset.prefetch_related('tags'), many=True).data,
+            repeat,
+        )
+        fast_samples: list[float] = measure(
+            lambda: RecipeReadSerializer(
+                recipes_queryset.values(*RecipeReadSerializer.get_value_fields()),
+                many=True,
+            ).data,
+            repeat,
+        )
+        model_summary: dict = summarize(model_samples)
+        fast_summary: dict = summarize(fast_samples)
+
+        return {
+            'recipes': size,
+            'model_serializer': model_summary,
+            'fast_path': fast_summary,
+            'speedup': model_summary['p50_ms'] / fast_summary['p50_ms'],
+        }
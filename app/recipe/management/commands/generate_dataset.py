@@ -0,0 +1,105 @@
+import json
+import random
+import time
+from decimal import Decimal
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from core.models import Tag, User
+from recipe.importer import RecipeImporter
+
+
+WORDS: list[str] = [
+    'apple', 'basil', 'bean', 'beef', 'bread', 'butter', 'carrot', 'cheese', 'chicken', 'chili',
+    'curry', 'egg', 'garlic', 'ginger', 'honey', 'lamb', 'lemon', 'lentil', 'mushroom', 'noodle',
+    'onion', 'pasta', 'pepper', 'pork', 'potato', 'rice', 'salmon', 'soup', 'spinach', 'tomato',
+]
+
+
+def dataset_email(prefix: str, index: int) -> str:
+    return f'{prefix}{index}@example.com'
+
+
+class Command(BaseCommand):
+    help = (
+        'Create a reproducible dataset for load tests: users with a fixed number '
+        'of recipes and tags each. Existing users with the same email prefix are '
+        'deleted first, so the same arguments always produce the same data.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--users', type=int, default=10)
+        parser.add_argument('--recipes-per-user', type=int, default=1_000)
+        parser.add_argument('--tags-per-user', type=int, default=50)
+        parser.add_argument('--tags-per-recipe', type=int, default=3)
+        parser.add_argument('--email-prefix', default='loadtest')
+        parser.add_argument('--password', default='loadtest-password')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--batch-size', type=int, default=5_000)
+        parser.add_argument('--json', action='store_true', help='Print a summary as JSON.')
+        parser.add_argument(
+            '--allow-writes',
+            action='store_true',
+            help='Run even with DEBUG off. The command deletes every user with the email prefix first.',
+        )
+
+    def handle(self, *args, **options) -> None:
+        if not settings.DEBUG and not options['allow_writes']:
+            raise CommandError(
+                'generate_dataset deletes and creates users in the configured database; '
+                'run it with DEBUG on or pass --allow-writes.'
+            )
+
+        started: float = time.perf_counter()
+        generator: random.Random = random.Random(options['seed'])
+        prefix: str = options['email_prefix']
+        get_user_model().objects.filter(email__startswith=prefix, email__endswith='@example.com').delete()
+
+        password: str = make_password(options['password'])
+        users: list[User] = get_user_model().objects.bulk_create(
+            get_user_model()(email=dataset_email(prefix, index), name=f'Load test {index}', password=password)
+            for index in range(options['users'])
+        )
+
+        tag_names: list[str] = [f'tag-{index}' for index in range(options['tags_per_user'])]
+        tags_per_recipe: int = min(options['tags_per_recipe'], len(tag_names))
+        importer: RecipeImporter = RecipeImporter()
+        importer.users = {user.email: user for user in users}
+        batch: list[dict] = []
+        for user in users:
+            for _ in range(options['recipes_per_user']):
+                batch.append({
+                    'email': user.email,
+                    'recipe': {
+                        'title': ' '.join(generator.sample(WORDS, 3)).capitalize(),
+                        'description': ' '.join(generator.choices(WORDS, k=20)),
+                        'time_minutes': generator.randint(5, 180),
+                        'price': Decimal(generator.randint(100, 9_999)) / 100,
+                        'link': '',
+                    },
+                    'tags': generator.sample(tag_names, tags_per_recipe),
+                })
+                if len(batch) == options['batch_size']:
+                    importer.import_batch(batch)
+                    batch = []
+        if batch:
+            importer.import_batch(batch)
+
+        summary: dict = {
+            'users': len(users),
+            'recipes': len(users) * options['recipes_per_user'],
+            'tags': Tag.objects.filter(user__in=users).count(),
+            'seed': options['seed'],
+            'elapsed_s': time.perf_counter() - started,
+        }
+        if options['json']:
+            self.stdout.write(json.dumps(summary, indent=2))
+            return
+
+        self.stdout.write(
+            f"Created {summary['users']} users, {summary['recipes']} recipes and "
+            f"{summary['tags']} tags in {summary['elapsed_s']:.1f} s."
+        )
@@ -0,0 +1,88 @@
+import json
+import os
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+from typing import TextIO
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from recipe.export import CSV, NDJSON
+from recipe.importer import InvalidRow, RecipeImporter, clean_row, read_rows
+
+
+class Command(BaseCommand):
+    help = (
+        'Stream recipes from an NDJSON or CSV file, in the format written by '
+        '/recipes/export/, into the database in large batches. Progress is '
+        'checkpointed after every committed batch so an interrupted import '
+        'resumes where it stopped.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('path', help="Input file, or '-' for stdin.")
+        parser.add_argument('--format', choices=[NDJSON, CSV], help='Input format; guessed from the file extension.')
+        parser.add_argument('--user', help='Email of the owner for rows without a `user` field.')
+        parser.add_argument('--batch-size', type=int, default=5_000)
+        parser.add_argument(
+            '--checkpoint',
+            help="Progress file; defaults to '<path>.checkpoint'. Required to resume imports from stdin.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        path: str = options['path']
+        input_format: str = options['format'] or (CSV if path.endswith('.csv') else NDJSON)
+        checkpoint: Path | None = (
+            Path(options['checkpoint']) if options['checkpoint']
+            else None if path == '-'
+            else Path(f'{path}.checkpoint')
+        )
+        done: int = self.read_checkpoint(checkpoint)
+        if done:
+            self.stdout.write(f'Resuming after {done} rows.')
+
+        importer: RecipeImporter = RecipeImporter()
+        imported: int = 0
+        started: float = time.perf_counter()
+        stream: TextIO = sys.stdin if path == '-' else open(path, newline='', encoding='utf-8')
+        try:
+            rows = islice(read_rows(stream, input_format), done, None)
+            while batch := [
+                clean_row(line, row, options['user'])
+                for line, row in islice(rows, options['batch_size'])
+            ]:
+                importer.import_batch(batch)
+                imported += len(batch)
+                self.write_checkpoint(checkpoint, done + imported)
+                self.progress(imported, started)
+        except InvalidRow as error:
+            raise CommandError(f'{error} Rows before the failing batch are imported; rerun to resume.')
+        except ValueError as error:
+            raise CommandError(str(error))
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        if checkpoint is not None and checkpoint.exists():
+            checkpoint.unlink()
+        self.stdout.write(self.style.SUCCESS(f'Imported {imported} recipes.'))
+
+    def read_checkpoint(self, checkpoint: Path | None) -> int:
+        if checkpoint is None or not checkpoint.exists():
+            return 0
+
+        return json.loads(checkpoint.read_text())['rows']
+
+    def write_checkpoint(self, checkpoint: Path | None, rows: int) -> None:
+        if checkpoint is None:
+            return
+
+        # Write then rename, so a crash never leaves a truncated checkpoint.
+        temporary: Path = checkpoint.with_name(f'{checkpoint.name}.tmp')
+        temporary.write_text(json.dumps({'rows': rows}))
+        os.replace(temporary, checkpoint)
+
+    def progress(self, imported: int, started: float) -> None:
+        elapsed: float = time.perf_counter() - started
+        self.stdout.write(f'{imported} rows, {imported / elapsed:,.0f} rows/s')
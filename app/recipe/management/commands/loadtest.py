@@ -0,0 +1,205 @@
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from typing import Callable
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import close_old_connections
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from rest_framework.authtoken.models import Token
+
+from core.benchmarks import summarize
+from core.models import Recipe, User
+
+
+SCENARIOS: list[str] = [
+    'recipe-list',
+    'recipe-list-sparse',
+    'recipe-retrieve',
+    'recipe-create',
+    'recipe-update',
+    'token-login',
+    'tag-list',
+]
+
+
+class InProcessTransport:
+    """Send requests through Django's test client, one client per thread."""
+
+    def __init__(self) -> None:
+        self.local: threading.local = threading.local()
+
+    def __call__(self, method: str, path: str, headers: dict[str, str], body: dict | None) -> int:
+        if not hasattr(self.local, 'client'):
+            self.local.client = Client(raise_request_exception=False)
+        response = self.local.client.generic(
+            method,
+            path,
+            data=json.dumps(body) if body is not None else '',
+            content_type='application/json',
+            headers=headers,
+        )
+        close_old_connections()
+
+        return response.status_code
+
+
+class HttpTransport:
+    """Send requests to a running server."""
+
+    def __init__(self, base_url: str) -> None:
+        self.base_url: str = base_url.rstrip('/')
+
+    def __call__(self, method: str, path: str, headers: dict[str, str], body: dict | None) -> int:
+        request: urllib.request.Request = urllib.request.Request(
+            f'{self.base_url}{path}',
+            data=json.dumps(body).encode() if body is not None else None,
+            headers={**headers, 'Content-Type': 'application/json'},
+            method=method,
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as error:
+            return error.code
+
+
+class Command(BaseCommand):
+    help = (
+        'Load test the API hot paths against a dataset made by generate_dataset '
+        'and report throughput and p50/p95/p99 latency per endpoint. Requests '
+        'run in-process unless --base-url points at a running server. Create '
+        'scenarios add recipes, so regenerate the dataset before runs that are '
+        'meant to be compared.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=SCENARIOS)
+        parser.add_argument('--requests', type=int, default=500, help='Requests per scenario.')
+        parser.add_argument('--concurrency', type=int, default=10)
+        parser.add_argument('--email-prefix', default='loadtest')
+        parser.add_argument('--password', default='loadtest-password')
+        parser.add_argument('--base-url', help='Target a running server instead of the in-process app.')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--output', help='Write the JSON report to this file.')
+        parser.add_argument('--json', action='store_true', help='Print the JSON report.')
+
+    def handle(self, *args, **options) -> None:
+        users: list[User] = list(
+            get_user_model().objects
+            .filter(email__startswith=options['email_prefix'], email__endswith='@example.com')
+            .order_by('id')
+        )
+        if not users:
+            raise CommandError('No dataset users found; run generate_dataset first.')
+
+        tokens: dict[int, str] = {
+            user.id: Token.objects.get_or_create(user=user)[0].key
+            for user in users
+        }
+        recipe_ids: dict[int, list[int]] = {
+            user.id: list(Recipe.objects.filter(user=user).order_by('id').values_list('id', flat=True)[:1_000])
+            for user in users
+        }
+        if not any(recipe_ids.values()):
+            raise CommandError('Dataset users have no recipes; run generate_dataset first.')
+
+        transport = HttpTransport(options['base_url']) if options['base_url'] else InProcessTransport()
+        generator: random.Random = random.Random(options['seed'])
+        # In-process runs lift the login throttles, which would otherwise
+        # turn the login scenario into a measurement of 429 responses.
+        unthrottled: AbstractContextManager = nullcontext() if options['base_url'] else override_settings(
+            ALLOWED_HOSTS=['*'],
+            REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {}},
+        )
+
+        results: list[dict] = []
+        with unthrottled:
+            for scenario in options['scenarios']:
+                requests: list[Callable[[], int]] = []
+                for _ in range(options['requests']):
+                    user: User = generator.choice(users)
+                    recipe_id: int = generator.choice(recipe_ids[user.id] or [0])
+                    requests.append(self.build_request(scenario, user, tokens[user.id], recipe_id, options, transport))
+                results.append(self.run(scenario, requests, options['concurrency']))
+
+        report: dict = {
+            'target': options['base_url'] or 'in-process',
+            'users': len(users),
+            'requests': options['requests'],
+            'concurrency': options['concurrency'],
+            'seed': options['seed'],
+            'scenarios': results,
+        }
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                json.dump(report, output, indent=2)
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        for result in results:
+            self.stdout.write(
+                f"{result['scenario']:>18}: {result['throughput_rps']:8.1f} req/s, {result['errors']} errors, "
+                f"p50 {result['latency']['p50_ms']:.1f} ms, p95 {result['latency']['p95_ms']:.1f} ms, "
+                f"p99 {result['latency']['p99_ms']:.1f} ms"
+            )
+
+    def build_request(
+        self,
+        scenario: str,
+        user: User,
+        token: str,
+        recipe_id: int,
+        options: dict,
+        transport: Callable[[str, str, dict[str, str], dict | None], int],
+    ) -> Callable[[], int]:
+        headers: dict[str, str] = {'Authorization': f'Token {token}'}
+        method, path, body = {
+            'recipe-list': ('GET', reverse('recipe:recipe-list'), None),
+            'recipe-list-sparse': ('GET', f"{reverse('recipe:recipe-list')}?fields=id,title,price", None),
+            'recipe-retrieve': ('GET', reverse('recipe:recipe-detail', args=[recipe_id]), None),
+            'recipe-create': (
+                'POST',
+                reverse('recipe:recipe-list'),
+                {'title': 'Load test recipe', 'time_minutes': 10, 'price': '5.00', 'tags': [{'name': 'tag-0'}]},
+            ),
+            'recipe-update': ('PATCH', reverse('recipe:recipe-detail', args=[recipe_id]), {'time_minutes': 15}),
+            'token-login': ('POST', reverse('user:token'), {'email': user.email, 'password': options['password']}),
+            'tag-list': ('GET', reverse('recipe:tag-list'), None),
+        }[scenario]
+        if scenario == 'token-login':
+            headers = {}
+
+        return lambda: transport(method, path, headers, body)
+
+    def run(self, scenario: str, requests: list[Callable[[], int]], concurrency: int) -> dict:
+        def timed(request: Callable[[], int]) -> tuple[float, int]:
+            started: float = time.perf_counter()
+            status_code: int = request()
+
+            return time.perf_counter() - started, status_code
+
+        started: float = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            samples: list[tuple[float, int]] = list(executor.map(timed, requests))
+        elapsed: float = time.perf_counter() - started
+
+        return {
+            'scenario': scenario,
+            'requests': len(samples),
+            'errors': sum(1 for _, status_code in samples if status_code >= 400),
+            'elapsed_s': elapsed,
+            'throughput_rps': len(samples) / elapsed,
+            'latency': summarize([latency for latency, _ in samples]),
+        }
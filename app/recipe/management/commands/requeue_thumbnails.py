@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import Q, QuerySet
+
+from core.models import Recipe
+from recipe.images import thumbnail_queue
+
+
+class Command(BaseCommand):
+    help = (
+        'Queue thumbnails again for recipes whose image is missing one of '
+        'RECIPE_IMAGE_SIZES. Jobs are lost when a worker restarts before '
+        'rendering them, and new sizes are only rendered for new uploads; run '
+        'it after deploys or when sizes are added.'
+    )
+
+    def handle(self, *args, **options) -> None:
+        recipes: QuerySet = (
+            Recipe.objects
+            .exclude(image='')
+            .filter(~Q(image_sizes__has_keys=list(settings.RECIPE_IMAGE_SIZES)))
+            .order_by('id')
+            .values_list('id', 'image')
+        )
+
+        count: int = 0
+        for recipe_id, name in recipes.iterator():
+            thumbnail_queue.submit(recipe_id, name)
+            count += 1
+        # Waits for the worker processes to render and record everything queued.
+        thumbnail_queue.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(f'Queued thumbnails for {count} recipes.'))
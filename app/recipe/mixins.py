@@ -0,0 +1,111 @@
+from hashlib import sha256
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
+
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from recipe.cache import (
+    get_response_cache,
+    get_user_version,
+    response_cache_key,
+    stats,
+)
+
+
+class ConditionalResponseMixin:
+    """
+    Strong ETags derived from the user's data version, not the response body.
+
+    A matching `If-None-Match` on `list`/`retrieve` answers 304 before any
+    rows are fetched or serialized. `If-Match` on PUT/PATCH answers 412 when
+    the client's copy is out of date.
+    """
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        return self._conditional_get(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        return self._conditional_get(super().retrieve, request, *args, **kwargs)
+
+    def update(self, request: Request, *args, **kwargs) -> Response:
+        if_match: str | None = request.headers.get('If-Match')
+        if if_match is not None and not self._etag_matches(if_match, self._current_etag(request)):
+            return Response(
+                {'detail': 'The resource has changed since it was fetched.'},
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
+
+        response: Response = super().update(request, *args, **kwargs)
+
+        return self._with_etag(response, self._current_etag(request))
+
+    def _current_etag(self, request: Request) -> str:
+        version: int = get_user_version(request.user.pk)
+        representation: str = f'{request.get_full_path()}:{request.accepted_renderer.format}'
+        digest: str = sha256(representation.encode()).hexdigest()[:16]
+
+        return quote_etag(f'{request.user.pk}-{version}-{digest}')
+
+    def _etag_matches(self, header: str, etag: str) -> bool:
+        candidates: list[str] = [
+            candidate.removeprefix('W/')
+            for candidate in parse_etags(header)
+        ]
+
+        return '*' in candidates or etag in candidates
+
+    def _conditional_get(self, handler, request: Request, *args, **kwargs) -> Response:
+        etag: str = self._current_etag(request)
+        if_none_match: str | None = request.headers.get('If-None-Match')
+        if if_none_match is not None and self._etag_matches(if_none_match, etag):
+            return self._with_etag(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+
+        return self._with_etag(handler(request, *args, **kwargs), etag)
+
+    def _with_etag(self, response: Response, etag: str) -> Response:
+        if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            response['ETag'] = etag
+        patch_vary_headers(response, ['Authorization'])
+
+        return response
+
+
+class CachedResponseMixin:
+    """
+    Serve `list` and `retrieve` from a per-user, versioned read-through cache.
+
+    Keys embed the user's current version (see `recipe.cache`), so any write
+    to the user's recipes or tags makes the old entries unreachable and they
+    simply expire.
+    """
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        return self._cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        return self._cached_response(super().retrieve, request, *args, **kwargs)
+
+    def _cached_response(self, handler, request: Request, *args, **kwargs) -> Response:
+        user_id: int = request.user.pk
+        key: str = response_cache_key(user_id, get_user_version(user_id), request.get_full_path())
+        cache = get_response_cache()
+
+        data = cache.get(key)
+        if data is not None:
+            stats.hit()
+            response: Response = Response(data)
+            response['X-Cache'] = 'HIT'
+
+            return response
+
+        stats.miss()
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, settings.RESPONSE_CACHE_TIMEOUT)
+        response['X-Cache'] = 'MISS'
+
+        return response
@@ -0,0 +1,166 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.conf import settings
+from django.db.models import Q, QuerySet
+
+from rest_framework import serializers
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core.paginators import estimate_count
+
+
+class PaginationCountSerializer(serializers.Serializer):
+    with_count = serializers.BooleanField(
+        default=False,
+        help_text='Add `count` and `count_exact` to the response. Large totals are estimated.',
+    )
+
+
+class BaseCursorPagination(CursorPagination):
+    """
+    Keyset pagination over an opaque cursor.
+
+    Pages are fetched with `WHERE <ordering field> < <last seen value> LIMIT n`,
+    so every page costs the same and no COUNT(*) or OFFSET scan is issued.
+    The ordering field should be unique within the paginated queryset; ties
+    fall back to a short offset from the last distinct position.
+
+    A total is only computed on request with `?with_count=true`, and is exact
+    up to API_COUNT_LIMIT rows; see `core.paginators.estimate_count()`.
+    """
+    page_size_query_param = 'page_size'
+    count_query_param = 'with_count'
+
+    def __init__(self) -> None:
+        self.page_size: int = settings.API_PAGE_SIZE
+        self.max_page_size: int = settings.API_MAX_PAGE_SIZE
+        self.count: int | None = None
+        self.count_exact: bool = True
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view=None) -> list | None:
+        params = PaginationCountSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        if params.validated_data[self.count_query_param]:
+            self.count, self.count_exact = estimate_count(queryset, settings.API_COUNT_LIMIT)
+
+        return super().paginate_queryset(self.filter_position(queryset, request), request, view)
+
+    def filter_position(self, queryset: QuerySet, request: Request) -> QuerySet:
+        """Hook for positions DRF can't apply itself; runs after counting."""
+        return queryset
+
+    def get_paginated_response(self, data) -> Response:
+        response: Response = super().get_paginated_response(data)
+        if self.count is not None:
+            response.data = {'count': self.count, 'count_exact': self.count_exact, **response.data}
+
+        return response
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        paginated: dict = super().get_paginated_response_schema(schema)
+        paginated['properties'] = {
+            'count': {'type': 'integer', 'example': 123},
+            'count_exact': {'type': 'boolean'},
+            **paginated['properties'],
+        }
+
+        return paginated
+
+    def get_schema_operation_parameters(self, view) -> list[dict]:
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                'name': self.count_query_param,
+                'required': False,
+                'in': 'query',
+                'description': PaginationCountSerializer().fields[self.count_query_param].help_text,
+                'schema': {'type': 'boolean'},
+            },
+        ]
+
+
+class RecipeCursorPagination(BaseCursorPagination):
+    """
+    Recipes newest first, or by `rank` then id for search results.
+
+    DRF keysets on the first ordering field alone and pages through equal
+    ranks by offset, which stops at `offset_cutoff`. Ranked cursors therefore
+    carry `<rank>:<id>` positions, applied here as `(rank, id) < (r, i)`.
+    """
+    ordering = '-id'
+    ranked_ordering: tuple[str, ...] = ('-rank', '-id')
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view=None) -> list | None:
+        self.ranked_cursor: Cursor | None = None
+        page: list | None = super().paginate_queryset(queryset, request, view)
+
+        cursor: Cursor | None = self.ranked_cursor
+        if cursor is not None:
+            # DRF paginated without the position; link back to it as it would.
+            self.cursor = cursor
+            if cursor.reverse:
+                self.has_next, self.next_position = True, cursor.position
+            else:
+                self.has_previous, self.previous_position = True, cursor.position
+            self.display_page_controls = self.template is not None
+
+        return page
+
+    def get_ordering(self, request, queryset, view) -> tuple[str, ...]:
+        # Search results are ranked; ties on rank are broken by id.
+        if 'rank' in queryset.query.annotations:
+            return self.ranked_ordering
+
+        return super().get_ordering(request, queryset, view)
+
+    def filter_position(self, queryset: QuerySet, request: Request) -> QuerySet:
+        cursor: Cursor | None = super().decode_cursor(request)
+        if 'rank' not in queryset.query.annotations or cursor is None or cursor.position is None:
+            return queryset
+
+        try:
+            rank, recipe_id = cursor.position.split(':')
+            rank, recipe_id = float(rank), int(recipe_id)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+
+        self.ranked_cursor = cursor
+        if cursor.reverse:
+            return queryset.filter(Q(rank__gt=rank) | Q(rank=rank, id__gt=recipe_id))
+
+        return queryset.filter(Q(rank__lt=rank) | Q(rank=rank, id__lt=recipe_id))
+
+    def decode_cursor(self, request: Request) -> Cursor | None:
+        cursor: Cursor | None = super().decode_cursor(request)
+        if self.ranked_cursor is not None:
+            # Already applied by filter_position().
+            return cursor._replace(position=None)
+
+        return cursor
+
+    def _get_position_from_instance(self, instance, ordering) -> str:
+        position: str = super()._get_position_from_instance(instance, ordering)
+        if tuple(ordering) != self.ranked_ordering:
+            return position
+
+        recipe_id: int = instance['id'] if isinstance(instance, dict) else instance.id
+        return f'{position}:{recipe_id}'
+
+
+class TagCursorPagination(BaseCursorPagination):
+    ordering = '-name'
+
+
+def encode_position(position: str) -> str:
+    """Opaque cursor for the keyset position used by the async endpoints."""
+    return urlsafe_b64encode(position.encode()).decode()
+
+
+def decode_position(cursor: str) -> str:
+    try:
+        return urlsafe_b64decode(cursor.encode()).decode()
+    except (ValueError, UnicodeError):
+        raise ValueError('Invalid cursor.')
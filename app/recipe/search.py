@@ -0,0 +1,60 @@
+from functools import reduce
+from operator import add, and_
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import Case, F, FloatField, Q, QuerySet, Value, When
+
+from rest_framework import serializers
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.request import Request
+
+
+SEARCH_CONFIG: str = 'english'
+
+
+class RecipeSearchSerializer(serializers.Serializer):
+    search = serializers.CharField(required=False, max_length=200, trim_whitespace=True)
+
+
+class RecipeSearchFilter(BaseFilterBackend):
+    """
+    Ranked full-text search over title and description with `?search=`.
+
+    Adds a `rank` annotation that `RecipeCursorPagination` orders by.
+    """
+
+    def filter_queryset(self, request: Request, queryset: QuerySet, view) -> QuerySet:
+        params = RecipeSearchSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        term: str = params.validated_data.get('search', '')
+        if not term:
+            return queryset
+
+        return search_recipes(queryset, term)
+
+
+def search_recipes(queryset: QuerySet, term: str) -> QuerySet:
+    if connections[queryset.db].vendor == 'postgresql':
+        query: SearchQuery = SearchQuery(term, config=SEARCH_CONFIG, search_type='websearch')
+
+        return (
+            queryset
+            .filter(search_vector=query)
+            .annotate(rank=SearchRank(F('search_vector'), query))
+        )
+
+    # Test databases have no tsvector support: match every word with LIKE
+    # and rank title hits above description hits.
+    words: list[str] = term.split()
+    matches: list[Q] = [Q(title__icontains=word) | Q(description__icontains=word) for word in words]
+    scores: list[Case] = [
+        Case(
+            When(title__icontains=word, then=Value(1.0)),
+            default=Value(0.4),
+            output_field=FloatField(),
+        )
+        for word in words
+    ]
+
+    return queryset.filter(reduce(and_, matches)).annotate(rank=reduce(add, scores))
@@ -1,16 +1,78 @@
+from operator import attrgetter
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Manager, Q
+
 from rest_framework import serializers
+from rest_framework.settings import api_settings
+from core.instrumentation import TimedRepresentationMixin
 from core.models import Recipe, Tag, User
+from core.openapi import extend_schema_field
+from recipe.cache import bump_user_version
+from recipe.images import image_urls, store_recipe_image
 
 
-class TagSerializer(serializers.ModelSerializer):
+class TagSerializer(TimedRepresentationMixin, serializers.ModelSerializer):
     class Meta:
         model = Tag
         fields = ['id', 'name']
         read_only_field = ['id']
 
+    def validate_name(self, value: str) -> str:
+        # Only renames through the tag endpoint can collide; nested tags on a
+        # recipe are resolved by name instead.
+        if self.instance is not None:
+            duplicate: bool = (
+                Tag.objects
+                .filter(user=self.instance.user, name=value)
+                .exclude(id=self.instance.id)
+                .exists()
+            )
+            if duplicate:
+                raise serializers.ValidationError('A tag with this name already exists.')
+
+        return value
+
+
+class TagDetailSerializer(TagSerializer):
+    class Meta(TagSerializer.Meta):
+        fields = TagSerializer.Meta.fields + ['recipe_count']
+        read_only_fields = ['id', 'recipe_count']
+
+
+class RecipeTagListSerializer(serializers.ListSerializer):
+    """
+    A recipe's tags in id order, as `get_tags_by_recipe()` lists them.
+
+    Sorted here rather than in SQL so prefetched and freshly loaded tags come
+    out alike without another query.
+    """
+
+    def to_representation(self, data) -> list[dict]:
+        tags = data.all() if isinstance(data, Manager) else data
+        return super().to_representation(sorted(tags, key=attrgetter('id')))
+
 
-class RecipeSerializer(serializers.ModelSerializer):
-    tags: TagSerializer = TagSerializer(many=True, required=False)
+@extend_schema_field({
+    'type': 'object',
+    'nullable': True,
+    'properties': {'original': {'type': 'string'}},
+    'additionalProperties': {'type': 'string'},
+})
+class RecipeImagesField(serializers.Field):
+    """URLs of a recipe's image and of each thumbnail rendered so far."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(source='*', read_only=True, **kwargs)
+
+    def to_representation(self, recipe: Recipe) -> dict[str, str] | None:
+        return image_urls(recipe.image.name, recipe.image_sizes)
+
+
+class RecipeSerializer(TimedRepresentationMixin, serializers.ModelSerializer):
+    tags: RecipeTagListSerializer = RecipeTagListSerializer(child=TagSerializer(), required=False)
+    images: RecipeImagesField = RecipeImagesField()
 
     class Meta:
         model = Recipe
@@ -21,30 +83,39 @@ class RecipeSerializer(serializers.ModelSerializer):
             'price',
             'link',
             'tags',
+            'images',
         ]
         read_only_fields = ['id']
 
-    def _get_or_create_tags(self, recipe: Recipe, tags: list[dict]) -> None:
+    def _set_tags(self, recipe: Recipe, tags: list[dict], created: bool = False) -> None:
         auth_user: User = self.context['request'].user
-        for tag in tags:
-            tag_obj, _ = Tag.objects.get_or_create(
-                user=auth_user,
-                **tag
-            )
-            recipe.tags.add(tag_obj)
+        wanted: dict[str, Tag] = Tag.objects.get_or_create_many(
+            user=auth_user,
+            names=[tag['name'] for tag in tags],
+        )
+        wanted_ids: set[int] = {tag.id for tag in wanted.values()}
+        # Tags are prefetched by the view, so diffing against them is free.
+        current_ids: set[int] = set() if created else {tag.id for tag in recipe.tags.all()}
+
+        removed_ids: set[int] = current_ids - wanted_ids
+        if removed_ids:
+            recipe.tags.remove(*removed_ids)
+
+        added: list[Tag] = [tag for tag in wanted.values() if tag.id not in current_ids]
+        if added:
+            recipe.tags.add(*added)
 
     def create(self, validated_data: dict) -> Recipe:
         tags: list[dict] = validated_data.pop('tags', [])
         recipe: Recipe = Recipe.objects.create(**validated_data)
-        self._get_or_create_tags(recipe=recipe, tags=tags)
+        self._set_tags(recipe=recipe, tags=tags, created=True)
 
         return recipe
 
     def update(self, instance: Recipe, validated_data: dict) -> Recipe:
         tags: list[dict] | None = validated_data.pop('tags', None)
         if tags is not None:
-            instance.tags.clear()
-            self._get_or_create_tags(recipe=instance, tags=tags)
+            self._set_tags(recipe=instance, tags=tags)
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
@@ -57,3 +128,292 @@ class RecipeSerializer(serializers.ModelSerializer):
 class RecipeDetailSerializer(RecipeSerializer):
     class Meta(RecipeSerializer.Meta):
         fields = RecipeSerializer.Meta.fields + ['description']
+
+
+class RecipeImageSerializer(serializers.ModelSerializer):
+    # Accepted formats and the extension each is stored with.
+    FORMATS: dict[str, str] = {'JPEG': '.jpg', 'PNG': '.png', 'WEBP': '.webp'}
+
+    image = serializers.ImageField(write_only=True)
+    images: RecipeImagesField = RecipeImagesField()
+
+    class Meta:
+        model = Recipe
+        fields = ['id', 'image', 'images']
+        read_only_fields = ['id']
+
+    def validate_image(self, value):
+        # Django's image validation has already opened the file with Pillow.
+        if value.image.format not in self.FORMATS:
+            raise serializers.ValidationError('Upload a JPEG, PNG or WebP image.')
+        width, height = value.image.size
+        if width * height > settings.RECIPE_IMAGE_MAX_PIXELS:
+            raise serializers.ValidationError(f'Images are limited to {settings.RECIPE_IMAGE_MAX_PIXELS} pixels.')
+        # Name the file after its content rather than whatever the client sent.
+        value.name = f'image{self.FORMATS[value.image.format]}'
+
+        return value
+
+    def update(self, instance: Recipe, validated_data: dict) -> Recipe:
+        store_recipe_image(instance, validated_data['image'])
+
+        return instance
+
+
+TAG_LOOKUP_BATCH_SIZE: int = 5_000
+
+
+def get_tags_by_recipe(recipe_ids: list[int]) -> dict[int, list[dict]]:
+    """
+    Load the tags of many recipes grouped by recipe id.
+
+    One query per TAG_LOOKUP_BATCH_SIZE recipes, i.e. a single query for any
+    API page.
+    """
+    tags: dict[int, list[dict]] = {}
+    for start in range(0, len(recipe_ids), TAG_LOOKUP_BATCH_SIZE):
+        links = (
+            Recipe.tags.through.objects
+            .filter(recipe_id__in=recipe_ids[start:start + TAG_LOOKUP_BATCH_SIZE])
+            .order_by('tag_id')
+            .values_list('recipe_id', 'tag_id', 'tag__name')
+        )
+        for recipe_id, tag_id, tag_name in links:
+            tags.setdefault(recipe_id, []).append({'id': tag_id, 'name': tag_name})
+
+    return tags
+
+
+async def aget_tags_by_recipe(recipe_ids: list[int]) -> dict[int, list[dict]]:
+    """Async counterpart of `get_tags_by_recipe()`."""
+    tags: dict[int, list[dict]] = {}
+    for start in range(0, len(recipe_ids), TAG_LOOKUP_BATCH_SIZE):
+        links = (
+            Recipe.tags.through.objects
+            .filter(recipe_id__in=recipe_ids[start:start + TAG_LOOKUP_BATCH_SIZE])
+            .order_by('tag_id')
+            .values_list('recipe_id', 'tag_id', 'tag__name')
+        )
+        async for recipe_id, tag_id, tag_name in links:
+            tags.setdefault(recipe_id, []).append({'id': tag_id, 'name': tag_name})
+
+    return tags
+
+
+class RecipeReadListSerializer(TimedRepresentationMixin, serializers.ListSerializer):
+    def to_representation(self, data) -> list[dict]:
+        rows: list[dict] = list(data)
+        if 'tags' in self.child.selected_fields:
+            tags: dict[int, list[dict]] = get_tags_by_recipe([row['id'] for row in rows])
+            for row in rows:
+                row['tags'] = tags.get(row['id'], [])
+
+        return [self.child.to_representation(row) for row in rows]
+
+
+class RecipeReadSerializer(TimedRepresentationMixin, serializers.BaseSerializer):
+    """
+    Read-only fast path that renders RecipeSerializer's output from `values()`.
+
+    Skips building DRF fields per object; tags for a whole page are loaded
+    with a single grouped query by the list serializer. `fields` limits the
+    output to a subset of `Meta.fields`, and tags are only loaded when
+    they are part of it.
+    """
+
+    class Meta:
+        fields = RecipeSerializer.Meta.fields
+        list_serializer_class = RecipeReadListSerializer
+
+    # Columns behind each output field, where they differ from its name.
+    VALUE_COLUMNS: dict[str, tuple[str, ...]] = {
+        'id': (),
+        'tags': (),
+        'images': ('image', 'image_sizes'),
+    }
+
+    def __init__(self, *args, fields: list[str] | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.selected_fields: list[str] = fields or self.Meta.fields
+
+    @classmethod
+    def get_value_fields(cls, fields: list[str] | None = None) -> list[str]:
+        """
+        Columns to select with `QuerySet.values()` for the given output fields.
+
+        `id` is always selected: pagination and the tag lookup key on it.
+        """
+        return ['id', *(
+            column
+            for field in fields or cls.Meta.fields
+            for column in cls.VALUE_COLUMNS.get(field, (field,))
+        )]
+
+    def to_representation(self, instance: dict) -> dict:
+        if 'tags' in self.selected_fields and 'tags' not in instance:
+            instance['tags'] = get_tags_by_recipe([instance['id']]).get(instance['id'], [])
+        if 'images' in self.selected_fields:
+            instance['images'] = image_urls(instance['image'], instance['image_sizes'])
+
+        data: dict = {field: instance[field] for field in self.selected_fields}
+        if 'price' in data and api_settings.COERCE_DECIMAL_TO_STRING:
+            data['price'] = format(data['price'], 'f')
+
+        return data
+
+
+class RecipeDetailReadSerializer(RecipeReadSerializer):
+    class Meta(RecipeReadSerializer.Meta):
+        fields = RecipeDetailSerializer.Meta.fields
+
+
+class RecipeBulkListSerializer(serializers.ListSerializer):
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            recipe_ids: set[int] = set()
+            for item in data:
+                try:
+                    recipe_ids.add(int(item['id']))
+                except (TypeError, KeyError, ValueError):
+                    continue
+
+            # Load every recipe the batch refers to in one query, so each
+            # operation can be validated without hitting the database.
+            self.context['recipes'] = (
+                Recipe.objects
+                .filter(user=self.context['request'].user, id__in=recipe_ids)
+                .prefetch_related('tags')
+                .in_bulk()
+            )
+            self.context['seen_recipe_ids'] = set()
+
+        return super().to_internal_value(data)
+
+    def create(self, validated_data: list[dict]) -> list[dict]:
+        auth_user: User = self.context['request'].user
+        tag_names: list[str] = [
+            tag['name']
+            for operation in validated_data
+            for tag in operation.get('data', {}).get('tags', [])
+        ]
+
+        with transaction.atomic():
+            tags: dict[str, Tag] = (
+                Tag.objects.get_or_create_many(user=auth_user, names=tag_names) if tag_names else {}
+            )
+            results: list[tuple[str, Recipe | int]] = []
+            created: list[Recipe] = []
+            # Grouped by the fields each operation sets, so a row is never
+            # written back with stale values for fields it didn't change.
+            updated: dict[tuple[str, ...], list[Recipe]] = {}
+            deleted_ids: list[int] = []
+            links: list[tuple[Recipe, list[Tag], bool]] = []
+
+            for operation in validated_data:
+                action: str = operation['action']
+                if action == RecipeBulkOperationSerializer.DELETE:
+                    deleted_ids.append(operation['id'])
+                    results.append((action, operation['id']))
+                    continue
+
+                data: dict = dict(operation['data'])
+                tag_data: list[dict] | None = data.pop('tags', None)
+                if action == RecipeBulkOperationSerializer.CREATE:
+                    recipe: Recipe = Recipe(user=auth_user, **data)
+                    created.append(recipe)
+                else:
+                    recipe = operation['recipe']
+                    for attr, value in data.items():
+                        setattr(recipe, attr, value)
+                    if data:
+                        updated.setdefault(tuple(sorted(data)), []).append(recipe)
+
+                if tag_data is not None:
+                    links.append((
+                        recipe,
+                        [tags[tag['name']] for tag in tag_data],
+                        action == RecipeBulkOperationSerializer.CREATE,
+                    ))
+                results.append((action, recipe))
+
+            Recipe.objects.bulk_create(created)
+            for update_fields, recipes in updated.items():
+                Recipe.objects.bulk_update(recipes, fields=list(update_fields))
+            self._write_tag_links(links)
+            if deleted_ids:
+                Recipe.objects.filter(user=auth_user, id__in=deleted_ids).delete()
+            # Bulk writes skip model signals, so invalidate cached reads here.
+            bump_user_version(auth_user.id)
+
+        return [
+            {'action': action, 'id': recipe if isinstance(recipe, int) else recipe.id}
+            for action, recipe in results
+        ]
+
+    def _write_tag_links(self, links: list[tuple[Recipe, list[Tag], bool]]) -> None:
+        through = Recipe.tags.through
+        removed: Q = Q()
+        added: list = []
+        for recipe, tags, created in links:
+            wanted_ids: set[int] = {tag.id for tag in tags}
+            current_ids: set[int] = set() if created else {tag.id for tag in recipe.tags.all()}
+            if current_ids - wanted_ids:
+                removed |= Q(recipe_id=recipe.id, tag_id__in=current_ids - wanted_ids)
+            added.extend(
+                through(recipe_id=recipe.id, tag_id=tag_id)
+                for tag_id in wanted_ids - current_ids
+            )
+
+        if removed:
+            through.objects.filter(removed).delete()
+        through.objects.bulk_create(added)
+
+
+class RecipeBulkOperationSerializer(serializers.Serializer):
+    CREATE: str = 'create'
+    UPDATE: str = 'update'
+    DELETE: str = 'delete'
+
+    action = serializers.ChoiceField(choices=[CREATE, UPDATE, DELETE])
+    id = serializers.IntegerField(required=False)
+    data = serializers.DictField(required=False)
+
+    class Meta:
+        list_serializer_class = RecipeBulkListSerializer
+
+    def validate(self, attrs: dict) -> dict:
+        action: str = attrs['action']
+        if action == self.CREATE:
+            if 'data' not in attrs:
+                raise serializers.ValidationError({'data': 'This field is required.'})
+            recipe: Recipe | None = None
+        else:
+            if 'id' not in attrs:
+                raise serializers.ValidationError({'id': 'This field is required.'})
+            recipe = self.context['recipes'].get(attrs['id'])
+            if recipe is None:
+                raise serializers.ValidationError({'id': 'Not found.'})
+            if recipe.id in self.context['seen_recipe_ids']:
+                raise serializers.ValidationError({'id': 'Recipe is already changed by another operation.'})
+            self.context['seen_recipe_ids'].add(recipe.id)
+
+        if action != self.DELETE:
+            if 'data' not in attrs:
+                raise serializers.ValidationError({'data': 'This field is required.'})
+            recipe_serializer: RecipeDetailSerializer = RecipeDetailSerializer(
+                instance=recipe,
+                data=attrs['data'],
+                partial=action == self.UPDATE,
+                context=self.context,
+            )
+            if not recipe_serializer.is_valid():
+                raise serializers.ValidationError({'data': recipe_serializer.errors})
+            attrs['data'] = recipe_serializer.validated_data
+            attrs['recipe'] = recipe
+
+        return attrs
+
+
+class ResponseCacheStatsSerializer(serializers.Serializer):
+    hits = serializers.IntegerField()
+    misses = serializers.IntegerField()
@@ -0,0 +1,29 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from core.models import Recipe, Tag
+from recipe.cache import bump_user_version
+from recipe.images import delete_image_files
+
+
+@receiver(post_save, sender=Recipe)
+@receiver(post_delete, sender=Recipe)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_owner_responses(sender, instance: Recipe | Tag, **kwargs) -> None:
+    bump_user_version(instance.user_id)
+
+
+@receiver(m2m_changed, sender=Recipe.tags.through)
+def invalidate_recipe_tag_responses(sender, instance: Recipe | Tag, action: str, **kwargs) -> None:
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        bump_user_version(instance.user_id)
+
+
+@receiver(post_delete, sender=Recipe)
+def delete_recipe_image(sender, instance: Recipe, **kwargs) -> None:
+    if instance.image:
+        transaction.on_commit(partial(delete_image_files, instance.image.name))
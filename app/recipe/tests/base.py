@@ -1,7 +1,12 @@
+from contextlib import contextmanager
 from decimal import Decimal
+from typing import Iterator
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from core.models import (
     User,
@@ -11,6 +16,10 @@ from core.models import (
 
 
 class BaseTestCase(TestCase):
+    def setUp(self) -> None:
+        # Cached responses and versions must not leak between tests.
+        cache.clear()
+
     def create_user(self, **params: dict) -> None:
         defaults: dict = {
             'email': 'test@example.com',
@@ -34,3 +43,16 @@ class BaseTestCase(TestCase):
 
     def create_tag(self, name: str, user: User) -> Tag:
         return Tag.objects.create(name=name, user=user)
+
+    @contextmanager
+    def assertQueryBudget(self, budget: int) -> Iterator[CaptureQueriesContext]:
+        """Fail if the block runs more than `budget` database queries."""
+        with CaptureQueriesContext(connection) as context:
+            yield context
+
+        executed: int = len(context.captured_queries)
+        if executed > budget:
+            queries: str = '\n'.join(
+                f'{i}. {query["sql"]}' for i, query in enumerate(context.captured_queries, start=1)
+            )
+            self.fail(f'{executed} queries executed, budget is {budget}:\n{queries}')
@@ -0,0 +1,131 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from core.models import Recipe, Tag, User
+from recipe.serializers import RecipeSerializer, RecipeDetailSerializer
+from recipe.tests.base import BaseTestCase
+
+
+RECIPES_URL = reverse('recipe:async-recipe-list')
+TAGS_URL = reverse('recipe:async-tag-list')
+
+
+def recipe_detail_url(recipe_id: int) -> str:
+    return reverse('recipe:async-recipe-detail', args=[recipe_id])
+
+
+@sync_to_async
+def serialize(serializer_class, recipe_id: int) -> dict:
+    return dict(serializer_class(Recipe.objects.get(id=recipe_id)).data)
+
+
+class AsyncReadAPITests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.user: User = self.create_user()
+        self.token: Token = Token.objects.create(user=self.user)
+        self.headers: dict = {'Authorization': f'Token {self.token.key}'}
+
+    async def test_auth_required(self) -> None:
+        response = await self.async_client.get(RECIPES_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_invalid_token_rejected(self) -> None:
+        response = await self.async_client.get(RECIPES_URL, headers={'Authorization': 'Token invalid'})
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_list_recipes_matches_sync_endpoint(self) -> None:
+        tag: Tag = await Tag.objects.acreate(user=self.user, name='Vegan')
+        recipe: Recipe = await Recipe.objects.acreate(user=self.user, title='Curry', price='5.49', time_minutes=30)
+        await recipe.tags.aadd(tag)
+        other_user: User = await User.objects.acreate(email='other@example.com')
+        await Recipe.objects.acreate(user=other_user, title='Other', price='1.00', time_minutes=5)
+
+        response = await self.async_client.get(RECIPES_URL, headers=self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['results'], [await serialize(RecipeSerializer, recipe.id)])
+
+    async def test_get_recipe_detail(self) -> None:
+        recipe: Recipe = await Recipe.objects.acreate(
+            user=self.user,
+            title='Curry',
+            description='Spicy',
+            price='5.49',
+            time_minutes=30,
+        )
+
+        response = await self.async_client.get(recipe_detail_url(recipe.id), headers=self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), await serialize(RecipeDetailSerializer, recipe.id))
+
+    async def test_other_users_recipe_not_found(self) -> None:
+        other_user: User = await User.objects.acreate(email='other@example.com')
+        recipe: Recipe = await Recipe.objects.acreate(user=other_user, title='Other', price='1.00', time_minutes=5)
+
+        response = await self.async_client.get(recipe_detail_url(recipe.id), headers=self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(API_PAGE_SIZE=2)
+    async def test_list_tags_paginated(self) -> None:
+        for name in ['Breakfast', 'Dessert', 'Lunch', 'Vegan', 'Dinner']:
+            await Tag.objects.acreate(user=self.user, name=name)
+
+        names: list[str] = []
+        url: str | None = TAGS_URL
+        while url:
+            response = await self.async_client.get(url, headers=self.headers)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            names.extend(tag['name'] for tag in response.json()['results'])
+            url = response.json()['next']
+
+        self.assertEqual(names, ['Vegan', 'Lunch', 'Dinner', 'Dessert', 'Breakfast'])
+
+    async def test_sparse_fields(self) -> None:
+        recipe: Recipe = await Recipe.objects.acreate(
+            user=self.user,
+            title='Curry',
+            description='Spicy',
+            price='5.49',
+            time_minutes=30,
+        )
+
+        list_response = await self.async_client.get(RECIPES_URL, {'fields': 'title'}, headers=self.headers)
+        detail_response = await self.async_client.get(
+            recipe_detail_url(recipe.id), {'fields': 'description,price'}, headers=self.headers,
+        )
+        invalid_response = await self.async_client.get(RECIPES_URL, {'fields': 'owner'}, headers=self.headers)
+
+        self.assertEqual(list_response.json()['results'], [{'title': 'Curry'}])
+        self.assertEqual(detail_response.json(), {'price': '5.49', 'description': 'Spicy'})
+        self.assertEqual(invalid_response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(API_COUNT_LIMIT=1)
+    async def test_list_with_count(self) -> None:
+        for name in ['Vegan', 'Dinner']:
+            await Tag.objects.acreate(user=self.user, name=name)
+
+        tags = await self.async_client.get(TAGS_URL, {'with_count': 'true'}, headers=self.headers)
+        recipes = await self.async_client.get(RECIPES_URL, {'with_count': '1'}, headers=self.headers)
+
+        self.assertGreaterEqual(tags.json()['count'], 1)
+        self.assertFalse(tags.json()['count_exact'])
+        self.assertEqual((recipes.json()['count'], recipes.json()['count_exact']), (0, True))
+
+
+class BenchmarkAsyncCommandTests(BaseTestCase):
+    @override_settings(DEBUG=False)
+    def test_refuses_to_write_without_debug(self) -> None:
+        with self.assertRaisesMessage(CommandError, '--allow-writes'):
+            call_command('benchmark_async')
+
+        self.assertFalse(get_user_model().objects.exists())
@@ -0,0 +1,91 @@
+from django.urls import reverse
+from django.http import HttpResponse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Recipe, User
+from recipe.tests.base import BaseTestCase
+
+
+RECIPES_URL = reverse('recipe:recipe-list')
+TAGS_URL = reverse('recipe:tag-list')
+
+
+def detail_url(recipe_id: int) -> str:
+    return reverse('recipe:recipe-detail', args=[recipe_id])
+
+
+class ConditionalRequestTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.client: APIClient = APIClient()
+        self.user: User = self.create_user()
+        self.client.force_authenticate(user=self.user)
+
+    def test_list_not_modified(self) -> None:
+        self.create_recipe(user=self.user)
+        etag: str = self.client.get(RECIPES_URL)['ETag']
+
+        with self.assertQueryBudget(0):
+            response: HttpResponse = self.client.get(RECIPES_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_list_modified_after_write(self) -> None:
+        etag: str = self.client.get(TAGS_URL)['ETag']
+        self.create_tag(name='Vegan', user=self.user)
+
+        response: HttpResponse = self.client.get(TAGS_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_etag_differs_per_resource(self) -> None:
+        first: Recipe = self.create_recipe(user=self.user)
+        second: Recipe = self.create_recipe(user=self.user)
+
+        first_etag: str = self.client.get(detail_url(first.id))['ETag']
+        second_etag: str = self.client.get(detail_url(second.id))['ETag']
+        list_etag: str = self.client.get(RECIPES_URL)['ETag']
+
+        self.assertEqual(len({first_etag, second_etag, list_etag}), 3)
+
+    def test_detail_not_modified(self) -> None:
+        recipe: Recipe = self.create_recipe(user=self.user)
+        etag: str = self.client.get(detail_url(recipe.id))['ETag']
+
+        response: HttpResponse = self.client.get(detail_url(recipe.id), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_update_with_matching_if_match(self) -> None:
+        recipe: Recipe = self.create_recipe(user=self.user)
+        etag: str = self.client.get(detail_url(recipe.id))['ETag']
+
+        response: HttpResponse = self.client.patch(
+            detail_url(recipe.id),
+            {'title': 'New title'},
+            HTTP_IF_MATCH=etag,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(self.client.get(detail_url(recipe.id))['ETag'], response['ETag'])
+
+    def test_update_with_stale_if_match(self) -> None:
+        recipe: Recipe = self.create_recipe(user=self.user, title='Original')
+        etag: str = self.client.get(detail_url(recipe.id))['ETag']
+        self.client.patch(detail_url(recipe.id), {'title': 'Concurrent edit'})
+
+        response: HttpResponse = self.client.put(
+            detail_url(recipe.id),
+            {'title': 'Lost update', 'price': '1.00', 'time_minutes': 5},
+            HTTP_IF_MATCH=etag,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        recipe.refresh_from_db()
+        self.assertEqual(recipe.title, 'Concurrent edit')
@@ -0,0 +1,61 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+
+from core.models import Recipe, Tag, User
+from recipe.tests.base import BaseTestCase
+
+
+class GenerateDatasetCommandTests(BaseTestCase):
+    def generate(self, *args) -> list[tuple]:
+        call_command(
+            'generate_dataset',
+            '--users', '2',
+            '--recipes-per-user', '5',
+            '--tags-per-user', '4',
+            '--tags-per-recipe', '2',
+            '--allow-writes',
+            *args,
+            stdout=StringIO(),
+        )
+
+        return list(
+            Recipe.objects
+            .order_by('user__email', 'id')
+            .values_list('user__email', 'title', 'time_minutes', 'price')
+        )
+
+    def test_creates_requested_dataset(self) -> None:
+        self.generate()
+
+        self.assertEqual(User.objects.filter(email__startswith='loadtest').count(), 2)
+        self.assertEqual(Recipe.objects.count(), 10)
+        self.assertEqual(Tag.objects.count(), 8)
+        self.assertEqual(Recipe.tags.through.objects.count(), 20)
+        self.assertTrue(User.objects.get(email='loadtest0@example.com').check_password('loadtest-password'))
+
+    def test_same_seed_reproduces_dataset(self) -> None:
+        first: list[tuple] = self.generate('--seed', '7')
+        second: list[tuple] = self.generate('--seed', '7')
+
+        self.assertEqual(first, second)
+        self.assertEqual(Recipe.objects.count(), 10)
+        self.assertNotEqual(first, self.generate('--seed', '8'))
+
+    def test_keeps_other_users(self) -> None:
+        user: User = self.create_user()
+        self.create_recipe(user=user)
+
+        self.generate()
+
+        self.assertEqual(Recipe.objects.filter(user=user).count(), 1)
+
+    @override_settings(DEBUG=False)
+    def test_refuses_to_write_without_debug(self) -> None:
+        user: User = self.create_user(email='loadtest0@example.com')
+
+        with self.assertRaisesMessage(CommandError, '--allow-writes'):
+            call_command('generate_dataset', stdout=StringIO())
+
+        self.assertTrue(User.objects.filter(id=user.id).exists())
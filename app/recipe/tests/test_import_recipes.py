@@ -0,0 +1,118 @@
+import json
+import tempfile
+from decimal import Decimal
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import CommandError, call_command
+
+from core.models import Recipe, Tag, User
+from recipe.export import CSV, export_recipes
+from recipe.serializers import RecipeDetailReadSerializer
+from recipe.tests.base import BaseTestCase
+
+
+class ImportRecipesCommandTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.user: User = self.create_user()
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, name: str, content: str) -> Path:
+        path: Path = Path(self.directory.name) / name
+        path.write_text(content)
+
+        return path
+
+    def ndjson(self, rows: list[dict]) -> Path:
+        return self.write('recipes.ndjson', ''.join(json.dumps(row) + '\n' for row in rows))
+
+    def run_import(self, path: Path, *args) -> str:
+        out: StringIO = StringIO()
+        call_command('import_recipes', str(path), *args, stdout=out)
+
+        return out.getvalue()
+
+    def test_import_ndjson(self) -> None:
+        other: User = self.create_user(email='other@example.com')
+        existing: Tag = self.create_tag(name='Vegan', user=self.user)
+        path: Path = self.ndjson([
+            {'title': 'Soup', 'time_minutes': 10, 'price': '2.50', 'tags': ['Vegan', 'Quick']},
+            {'title': 'Pie', 'time_minutes': 40, 'price': '4.00', 'tags': [{'name': 'Sweet'}], 'user': other.email},
+        ])
+
+        output: str = self.run_import(path, '--user', self.user.email)
+
+        self.assertIn('Imported 2 recipes.', output)
+        self.assertIn('rows/s', output)
+        soup: Recipe = Recipe.objects.get(title='Soup')
+        self.assertEqual(soup.user, self.user)
+        self.assertEqual(soup.price, Decimal('2.50'))
+        self.assertEqual(sorted(soup.tags.values_list('name', flat=True)), ['Quick', 'Vegan'])
+        self.assertIn(existing, soup.tags.all())
+        pie: Recipe = Recipe.objects.get(title='Pie')
+        self.assertEqual(pie.user, other)
+        self.assertEqual(list(pie.tags.values_list('user', flat=True)), [other.id])
+        self.assertFalse(path.with_name('recipes.ndjson.checkpoint').exists())
+
+    def test_import_csv_export_round_trip(self) -> None:
+        recipe: Recipe = self.create_recipe(user=self.user, title='Pie, apple')
+        recipe.tags.add(self.create_tag(name='Sweet', user=self.user))
+        exported = Recipe.objects.filter(user=self.user).values(*RecipeDetailReadSerializer.get_value_fields())
+        path: Path = self.write('recipes.csv', ''.join(export_recipes(exported, CSV, chunk_size=100)))
+
+        self.run_import(path, '--user', self.user.email)
+
+        imported: Recipe = Recipe.objects.exclude(id=recipe.id).get()
+        self.assertEqual(imported.title, 'Pie, apple')
+        self.assertEqual(imported.description, recipe.description)
+        self.assertEqual(list(imported.tags.all()), list(recipe.tags.all()))
+
+    def test_queries_do_not_grow_with_batch_size(self) -> None:
+        rows: list[dict] = [
+            {'title': f'Recipe {i}', 'time_minutes': 5, 'price': '1.00', 'tags': ['A', f'T{i}']}
+            for i in range(50)
+        ]
+        path: Path = self.ndjson(rows)
+
+        with self.assertQueryBudget(8):
+            self.run_import(path, '--user', self.user.email, '--batch-size', '50')
+
+        self.assertEqual(Recipe.tags.through.objects.count(), 100)
+
+    def test_invalid_row_stops_import_and_resumes(self) -> None:
+        rows: list[dict] = [
+            {'title': 'One', 'time_minutes': 5, 'price': '1.00'},
+            {'title': 'Two', 'time_minutes': 5, 'price': '1.00'},
+            {'title': 'Three', 'time_minutes': 'soon', 'price': '1.00'},
+            {'title': 'Four', 'time_minutes': 5, 'price': '1.00'},
+        ]
+        path: Path = self.ndjson(rows)
+
+        with self.assertRaisesMessage(CommandError, 'Line 3'):
+            self.run_import(path, '--user', self.user.email, '--batch-size', '2')
+
+        self.assertEqual(sorted(Recipe.objects.values_list('title', flat=True)), ['One', 'Two'])
+        self.assertTrue(path.with_name('recipes.ndjson.checkpoint').exists())
+
+        rows[2]['time_minutes'] = 15
+        self.ndjson(rows)
+        output: str = self.run_import(path, '--user', self.user.email, '--batch-size', '2')
+
+        self.assertIn('Resuming after 2 rows.', output)
+        self.assertEqual(sorted(Recipe.objects.values_list('title', flat=True)), ['Four', 'One', 'Three', 'Two'])
+
+    def test_unknown_user_rejected(self) -> None:
+        path: Path = self.ndjson([{'title': 'Soup', 'time_minutes': 10, 'price': '2.50', 'user': 'nobody@example.com'}])
+
+        with self.assertRaisesMessage(CommandError, 'nobody@example.com'):
+            self.run_import(path)
+
+        self.assertFalse(Recipe.objects.exists())
+
+    def test_row_without_user_rejected(self) -> None:
+        path: Path = self.ndjson([{'title': 'Soup', 'time_minutes': 10, 'price': '2.50'}])
+
+        with self.assertRaisesMessage(CommandError, 'No user given'):
+            self.run_import(path)
@@ -0,0 +1,144 @@
+from decimal import Decimal
+
+from django.urls import reverse
+from django.http import HttpResponse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Recipe, User
+from recipe.tests.base import BaseTestCase
+
+
+RECIPES_URL = reverse('recipe:recipe-list')
+TAGS_URL = reverse('recipe:tag-list')
+
+# Maximum number of queries each endpoint may run, regardless of how many
+# recipes and tags the user owns. Tag link inserts include the existing-link
+# check Django adds while m2m_changed has receivers.
+BUDGETS: dict[str, int] = {
+    'recipe-list': 2,
+    'recipe-retrieve': 2,
+    'recipe-create': 2,
+    'recipe-create-with-tags': 6,
+    'recipe-update': 4,
+    'recipe-update-tags': 9,
+    'tag-list': 1,
+}
+
+DATA_SIZES: list[int] = [1, 25]
+
+
+def detail_url(recipe_id: int) -> str:
+    return reverse('recipe:recipe-detail', args=[recipe_id])
+
+
+class QueryBudgetTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.client: APIClient = APIClient()
+        self.user: User = self.create_user()
+        self.client.force_authenticate(user=self.user)
+
+    def seed(self, recipes: int, tags_per_recipe: int = 3) -> list[Recipe]:
+        created: list[Recipe] = []
+        for i in range(recipes):
+            recipe: Recipe = self.create_recipe(user=self.user, title=f'Recipe {i}')
+            recipe.tags.add(*[
+                self.create_tag(name=f'Tag {recipe.id}-{j}', user=self.user)
+                for j in range(tags_per_recipe)
+            ])
+            created.append(recipe)
+
+        return created
+
+    def test_list_recipes_within_budget(self) -> None:
+        for size in DATA_SIZES:
+            with self.subTest(size=size):
+                self.seed(recipes=size)
+                with self.assertQueryBudget(BUDGETS['recipe-list']):
+                    response: HttpResponse = self.client.get(RECIPES_URL)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_retrieve_recipe_within_budget(self) -> None:
+        for size in DATA_SIZES:
+            with self.subTest(size=size):
+                recipe: Recipe = self.seed(recipes=1, tags_per_recipe=size)[0]
+                with self.assertQueryBudget(BUDGETS['recipe-retrieve']):
+                    response: HttpResponse = self.client.get(detail_url(recipe.id))
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(len(response.data['tags']), size)
+
+    def test_create_recipe_within_budget(self) -> None:
+        payload: dict = {
+            'title': 'Sample recipe title',
+            'price': Decimal('5.49'),
+            'time_minutes': 30,
+        }
+        for size in DATA_SIZES:
+            with self.subTest(size=size):
+                self.seed(recipes=size)
+                with self.assertQueryBudget(BUDGETS['recipe-create']):
+                    response: HttpResponse = self.client.post(RECIPES_URL, payload, format='json')
+
+                self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_update_recipe_within_budget(self) -> None:
+        payload: dict = {'title': 'New sample recipe title'}
+        for size in DATA_SIZES:
+            with self.subTest(size=size):
+                recipe: Recipe = self.seed(recipes=size, tags_per_recipe=size)[0]
+                with self.assertQueryBudget(BUDGETS['recipe-update']):
+                    response: HttpResponse = self.client.patch(detail_url(recipe.id), payload, format='json')
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_create_recipe_with_tags_within_budget(self) -> None:
+        self.create_tag(name='Tag 0', user=self.user)
+        for size in [1, 30]:
+            with self.subTest(size=size):
+                payload: dict = {
+                    'title': 'Sample recipe title',
+                    'price': Decimal('5.49'),
+                    'time_minutes': 30,
+                    'tags': [{'name': f'Tag {i}'} for i in range(size)],
+                }
+                with self.assertQueryBudget(BUDGETS['recipe-create-with-tags']):
+                    response: HttpResponse = self.client.post(RECIPES_URL, payload, format='json')
+
+                self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+                self.assertEqual(len(response.data['tags']), size)
+
+    def test_update_recipe_tags_within_budget(self) -> None:
+        for size in [1, 30]:
+            with self.subTest(size=size):
+                recipe: Recipe = self.create_recipe(user=self.user)
+                recipe.tags.add(*[
+                    self.create_tag(name=f'Old {size}-{i}', user=self.user)
+                    for i in range(size)
+                ])
+                payload: dict = {
+                    'tags': [{'name': f'New {size}-{i}'} for i in range(size)],
+                }
+                with self.assertQueryBudget(BUDGETS['recipe-update-tags']):
+                    response: HttpResponse = self.client.patch(detail_url(recipe.id), payload, format='json')
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(len(response.data['tags']), size)
+
+    def test_list_tags_within_budget(self) -> None:
+        for size in DATA_SIZES:
+            with self.subTest(size=size):
+                self.seed(recipes=size)
+                with self.assertQueryBudget(BUDGETS['tag-list']):
+                    response: HttpResponse = self.client.get(TAGS_URL)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_recipes_without_tags_single_query(self) -> None:
+        self.seed(recipes=25)
+        with self.assertQueryBudget(1):
+            response: HttpResponse = self.client.get(RECIPES_URL, {'fields': 'id,title,price'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
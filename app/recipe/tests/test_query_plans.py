@@ -0,0 +1,57 @@
+import re
+
+from django.db import connection
+from django.db.models import QuerySet
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core.models import Recipe, User
+from recipe.filters import RecipeFilterBackend
+from recipe.tests.base import BaseTestCase
+
+
+class RecipeQueryPlanTests(BaseTestCase):
+    """Filtered recipe lists must be answerable from indexes alone."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.user: User = self.create_user()
+        tag = self.create_tag(name='Vegan', user=self.user)
+        for i in range(20):
+            self.create_recipe(user=self.user, time_minutes=i).tags.add(tag)
+        self.tag = tag
+
+    def filtered(self, **params) -> QuerySet:
+        request: Request = Request(APIRequestFactory().get('/', params))
+        queryset: QuerySet = Recipe.objects.filter(user=self.user).order_by('-id')
+
+        return RecipeFilterBackend().filter_queryset(request, queryset, view=None)
+
+    def assertNoSequentialScan(self, queryset: QuerySet) -> None:
+        if connection.vendor == 'postgresql':
+            # Small test tables would make a scan the cheapest plan anyway;
+            # with scans disabled one only shows up when no index applies.
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+            plan: str = queryset.explain()
+            self.assertNotIn('Seq Scan', plan, plan)
+        elif connection.vendor == 'sqlite':
+            plan = queryset.explain()
+            self.assertIsNone(re.search(r'\bSCAN core_recipe', plan), plan)
+        else:
+            self.skipTest(f'No plan check for {connection.vendor}.')
+
+    def test_list_uses_index(self) -> None:
+        self.assertNoSequentialScan(self.filtered())
+
+    def test_price_range_uses_index(self) -> None:
+        self.assertNoSequentialScan(self.filtered(price_min='1.00', price_max='6.00'))
+
+    def test_time_range_uses_index(self) -> None:
+        self.assertNoSequentialScan(self.filtered(time_minutes_min=5, time_minutes_max=10))
+
+    def test_tags_any_uses_index(self) -> None:
+        self.assertNoSequentialScan(self.filtered(tags=str(self.tag.id)))
+
+    def test_tags_all_uses_index(self) -> None:
+        self.assertNoSequentialScan(self.filtered(tags=str(self.tag.id), tags_match='all'))
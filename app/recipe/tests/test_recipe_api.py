@@ -1,7 +1,9 @@
 from decimal import Decimal
+from unittest import mock
 
 from django.urls import reverse
 from django.http import HttpResponse
+from django.test import override_settings
 from rest_framework import status
 from rest_framework.test import APIClient
 
@@ -14,6 +16,7 @@ from recipe.serializers import (
     RecipeSerializer,
     RecipeDetailSerializer,
 )
+from recipe.pagination import RecipeCursorPagination
 from recipe.tests.base import BaseTestCase
 
 
@@ -26,6 +29,7 @@ def detail_url(recipe_id: int) -> str:
 
 class PublicRecipeAPItests(BaseTestCase):
     def setUp(self) -> None:
+        super().setUp()
         self.client: APIClient = APIClient()
 
     def test_auth_required(self) -> None:
@@ -36,6 +40,7 @@ class PublicRecipeAPItests(BaseTestCase):
 
 class PrivateRecipeAPITests(BaseTestCase):
     def setUp(self) -> None:
+        super().setUp()
         self.client: APIClient = APIClient()
         self.user: User = self.create_user()
         self.client.force_authenticate(user=self.user)
@@ -49,7 +54,7 @@ class PrivateRecipeAPITests(BaseTestCase):
         serializer: RecipeSerializer = RecipeSerializer(recipes, many=True)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(response.data['results'], serializer.data)
 
     def test_recipe_list_limited_to_user(self) -> None:
         other_user: User = self.create_user(
@@ -64,7 +69,54 @@ class PrivateRecipeAPITests(BaseTestCase):
         serializer: RecipeSerializer = RecipeSerializer(recipes, many=True)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(response.data['results'], serializer.data)
+
+    def test_list_and_detail_match_model_serializers(self) -> None:
+        tags: list[Tag] = [self.create_tag(name=name, user=self.user) for name in ['Vegan', 'Lunch']]
+        recipe: Recipe = self.create_recipe(user=self.user, price=Decimal('10.50'))
+        # Linked out of id order, so only an explicit order makes both paths agree.
+        recipe.tags.add(tags[1])
+        recipe.tags.add(tags[0])
+        self.create_recipe(user=self.user)
+
+        list_response: HttpResponse = self.client.get(RECIPES_URL)
+        detail_response: HttpResponse = self.client.get(detail_url(recipe.id))
+
+        recipes: list[Recipe] = Recipe.objects.filter(user=self.user).order_by('-id')
+        self.assertEqual(list_response.data['results'], RecipeSerializer(recipes, many=True).data)
+        self.assertEqual(detail_response.data, RecipeDetailSerializer(recipe).data)
+        self.assertEqual([tag['name'] for tag in detail_response.data['tags']], ['Vegan', 'Lunch'])
+        self.assertEqual(
+            RecipeSerializer().fields['tags'].to_representation(list(reversed(tags))),
+            [{'id': tag.id, 'name': tag.name} for tag in tags],
+        )
+
+    @override_settings(API_PAGE_SIZE=2)
+    def test_list_recipes_paginated_by_cursor(self) -> None:
+        recipes: list[Recipe] = [self.create_recipe(user=self.user) for _ in range(5)]
+        expected_ids: list[int] = [recipe.id for recipe in reversed(recipes)]
+
+        received_ids: list[int] = []
+        url: str | None = RECIPES_URL
+        while url:
+            response: HttpResponse = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', response.data)
+            received_ids.extend(recipe['id'] for recipe in response.data['results'])
+            url = response.data['next']
+
+        self.assertEqual(received_ids, expected_ids)
+
+    @override_settings(API_PAGE_SIZE=2, API_MAX_PAGE_SIZE=3)
+    def test_list_recipes_page_size_is_capped(self) -> None:
+        for _ in range(5):
+            self.create_recipe(user=self.user)
+
+        response: HttpResponse = self.client.get(RECIPES_URL, {'page_size': 4})
+        self.assertEqual(len(response.data['results']), 3)
+
+        response = self.client.get(RECIPES_URL, {'page_size': 1})
+        self.assertEqual(len(response.data['results']), 1)
 
     def test_get_recipe_detail(self) -> None:
         recipe: Recipe = self.create_recipe(user=self.user)
@@ -245,3 +297,228 @@ class PrivateRecipeAPITests(BaseTestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(recipe.tags.count(), 0)
+
+    def test_update_recipe_keeps_unchanged_tag_links(self) -> None:
+        tag_lunch: Tag = self.create_tag(name='Lunch', user=self.user)
+        tag_dinner: Tag = self.create_tag(name='Dinner', user=self.user)
+        recipe: Recipe = self.create_recipe(user=self.user)
+        recipe.tags.add(tag_lunch, tag_dinner)
+        through = Recipe.tags.through
+        kept_link_id: int = through.objects.get(recipe=recipe, tag=tag_lunch).id
+        payload: dict = {
+            'tags': [{'name': 'Lunch'}, {'name': 'Brunch'}],
+        }
+        url: str = detail_url(recipe.id)
+
+        response: HttpResponse = self.client.patch(url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(through.objects.filter(id=kept_link_id, tag=tag_lunch).exists())
+        self.assertEqual(
+            set(recipe.tags.values_list('name', flat=True)),
+            {'Lunch', 'Brunch'},
+        )
+
+    def test_create_recipe_with_duplicate_tag_names(self) -> None:
+        payload: dict = {
+            'title': 'Thai Prawn Curry',
+            'time_minutes': 30,
+            'price': Decimal('2.49'),
+            'tags': [{'name': 'Thai'}, {'name': 'Thai'}],
+        }
+        response: HttpResponse = self.client.post(RECIPES_URL, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Tag.objects.filter(user=self.user, name='Thai').count(), 1)
+        self.assertEqual(len(response.data['tags']), 1)
+
+    def test_filter_by_tags_any(self) -> None:
+        tag_vegan: Tag = self.create_tag(name='Vegan', user=self.user)
+        tag_lunch: Tag = self.create_tag(name='Lunch', user=self.user)
+        vegan: Recipe = self.create_recipe(user=self.user, title='Vegan')
+        vegan.tags.add(tag_vegan)
+        both: Recipe = self.create_recipe(user=self.user, title='Both')
+        both.tags.add(tag_vegan, tag_lunch)
+        self.create_recipe(user=self.user, title='Untagged')
+
+        response: HttpResponse = self.client.get(RECIPES_URL, {'tags': f'{tag_vegan.id},{tag_lunch.id}'})
+
+        self.assertEqual([recipe['id'] for recipe in response.data['results']], [both.id, vegan.id])
+
+    def test_filter_by_tags_all(self) -> None:
+        tag_vegan: Tag = self.create_tag(name='Vegan', user=self.user)
+        tag_lunch: Tag = self.create_tag(name='Lunch', user=self.user)
+        vegan: Recipe = self.create_recipe(user=self.user, title='Vegan')
+        vegan.tags.add(tag_vegan)
+        both: Recipe = self.create_recipe(user=self.user, title='Both')
+        both.tags.add(tag_vegan, tag_lunch)
+
+        response: HttpResponse = self.client.get(
+            RECIPES_URL,
+            {'tags': f'{tag_vegan.id},{tag_lunch.id}', 'tags_match': 'all'},
+        )
+
+        self.assertEqual([recipe['id'] for recipe in response.data['results']], [both.id])
+
+    def test_filter_by_price_and_time_ranges(self) -> None:
+        self.create_recipe(user=self.user, price=Decimal('2.00'), time_minutes=10)
+        match: Recipe = self.create_recipe(user=self.user, price=Decimal('5.00'), time_minutes=20)
+        self.create_recipe(user=self.user, price=Decimal('5.00'), time_minutes=90)
+        self.create_recipe(user=self.user, price=Decimal('9.00'), time_minutes=20)
+
+        response: HttpResponse = self.client.get(RECIPES_URL, {
+            'price_min': '3.00',
+            'price_max': '6.00',
+            'time_minutes_max': 30,
+        })
+
+        self.assertEqual([recipe['id'] for recipe in response.data['results']], [match.id])
+
+    def test_invalid_filter_error(self) -> None:
+        for params in [{'tags': 'a,b'}, {'price_min': 'cheap'}, {'tags_match': 'some'}]:
+            with self.subTest(params=params):
+                response: HttpResponse = self.client.get(RECIPES_URL, params)
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_search_ranks_title_matches_first(self) -> None:
+        in_description: Recipe = self.create_recipe(
+            user=self.user,
+            title='Weeknight dinner',
+            description='A quick curry with prawns',
+        )
+        in_title: Recipe = self.create_recipe(
+            user=self.user,
+            title='Prawn curry',
+            description='Spicy and quick',
+        )
+        self.create_recipe(user=self.user, title='Pancakes', description='Sweet breakfast')
+
+        response: HttpResponse = self.client.get(RECIPES_URL, {'search': 'curry'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [recipe['id'] for recipe in response.data['results']],
+            [in_title.id, in_description.id],
+        )
+
+    def test_search_limited_to_user(self) -> None:
+        other_user: User = self.create_user(email='other@example.com')
+        self.create_recipe(user=other_user, title='Prawn curry')
+        recipe: Recipe = self.create_recipe(user=self.user, title='Green curry')
+
+        response: HttpResponse = self.client.get(RECIPES_URL, {'search': 'curry'})
+
+        self.assertEqual([result['id'] for result in response.data['results']], [recipe.id])
+
+    @override_settings(API_PAGE_SIZE=2)
+    def test_search_results_paginated(self) -> None:
+        expected: list[int] = [
+            self.create_recipe(user=self.user, title=f'Curry {i}').id
+            for i in range(5)
+        ]
+
+        received: list[int] = []
+        url: str | None = RECIPES_URL + '?search=curry'
+        while url:
+            response: HttpResponse = self.client.get(url)
+            received.extend(recipe['id'] for recipe in response.data['results'])
+            url = response.data['next']
+
+        self.assertEqual(received, list(reversed(expected)))
+
+    @override_settings(API_PAGE_SIZE=2)
+    def test_search_pages_through_equal_ranks(self) -> None:
+        expected: list[int] = [
+            self.create_recipe(user=self.user, title='Curry').id
+            for _ in range(7)
+        ]
+
+        # Offsets past the cutoff would be clamped, repeating or skipping rows.
+        with mock.patch.object(RecipeCursorPagination, 'offset_cutoff', 1):
+            received: list[int] = []
+            url: str | None = RECIPES_URL + '?search=curry'
+            # Bounded, so a cursor that keeps repeating rows fails instead of looping.
+            while url and len(received) <= len(expected):
+                response: HttpResponse = self.client.get(url)
+                received.extend(recipe['id'] for recipe in response.data['results'])
+                previous: str | None = response.data['previous']
+                url = response.data['next']
+
+            received_back: list[int] = []
+            while previous and len(received_back) <= len(expected):
+                response = self.client.get(previous)
+                received_back[:0] = [recipe['id'] for recipe in response.data['results']]
+                previous = response.data['previous']
+
+        self.assertEqual(received, list(reversed(expected)))
+        self.assertEqual(received_back, received[:-1])
+
+    @override_settings(API_PAGE_SIZE=2)
+    def test_list_sparse_fields(self) -> None:
+        recipes: list[Recipe] = [self.create_recipe(user=self.user, title=f'Recipe {i}') for i in range(3)]
+
+        response: HttpResponse = self.client.get(RECIPES_URL, {'fields': 'title,price'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [
+            {'title': recipe.title, 'price': '5.49'}
+            for recipe in reversed(recipes[1:])
+        ])
+        next_page: HttpResponse = self.client.get(response.data['next'])
+        self.assertEqual(next_page.data['results'], [{'title': 'Recipe 0', 'price': '5.49'}])
+
+    def test_retrieve_sparse_fields(self) -> None:
+        recipe: Recipe = self.create_recipe(user=self.user)
+        recipe.tags.add(self.create_tag(name='Vegan', user=self.user))
+
+        response: HttpResponse = self.client.get(detail_url(recipe.id), {'fields': 'id, tags'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'id': recipe.id, 'tags': [{'id': recipe.tags.get().id, 'name': 'Vegan'}]})
+
+    def test_sparse_fields_select_only_requested_columns(self) -> None:
+        recipe: Recipe = self.create_recipe(user=self.user)
+
+        with self.assertQueryBudget(1) as context:
+            response: HttpResponse = self.client.get(detail_url(recipe.id), {'fields': 'title'})
+
+        self.assertEqual(response.data, {'title': recipe.title})
+        self.assertNotIn('description', context.captured_queries[0]['sql'])
+
+    def test_sparse_fields_invalid(self) -> None:
+        recipe: Recipe = self.create_recipe(user=self.user)
+        for url, fields in [(RECIPES_URL, 'title,description'), (RECIPES_URL, ','), (detail_url(recipe.id), 'owner')]:
+            with self.subTest(url=url, fields=fields):
+                response: HttpResponse = self.client.get(url, {'fields': fields})
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('fields', response.data)
+
+    def test_list_with_count(self) -> None:
+        for i in range(3):
+            self.create_recipe(user=self.user, title=f'Recipe {i}')
+        self.create_recipe(user=self.create_user(email='other@example.com'))
+
+        response: HttpResponse = self.client.get(RECIPES_URL, {'with_count': 'true', 'price_max': '10.00'})
+        without_count: HttpResponse = self.client.get(RECIPES_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data['count'], response.data['count_exact']), (3, True))
+        self.assertNotIn('count', without_count.data)
+
+    @override_settings(API_COUNT_LIMIT=2)
+    def test_list_with_count_above_limit_is_estimated(self) -> None:
+        for i in range(3):
+            self.create_recipe(user=self.user, title=f'Recipe {i}')
+
+        response: HttpResponse = self.client.get(RECIPES_URL, {'with_count': 'true'})
+
+        self.assertGreaterEqual(response.data['count'], 2)
+        self.assertFalse(response.data['count_exact'])
+        self.assertEqual(len(response.data['results']), 3)
+
+    def test_list_with_count_invalid(self) -> None:
+        response: HttpResponse = self.client.get(RECIPES_URL, {'with_count': 'sometimes'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,162 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.urls import reverse
+from django.http import HttpResponse
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import (
+    Recipe,
+    User,
+    Tag,
+)
+from recipe.tests.base import BaseTestCase
+
+
+BULK_URL = reverse('recipe:recipe-bulk')
+
+
+def recipe_payload(**params) -> dict:
+    defaults: dict = {
+        'title': 'Sample recipe title',
+        'price': '5.49',
+        'time_minutes': 30,
+    }
+    defaults.update(params)
+
+    return defaults
+
+
+class PrivateRecipeBulkAPITests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.client: APIClient = APIClient()
+        self.user: User = self.create_user()
+        self.client.force_authenticate(user=self.user)
+
+    def test_bulk_create_update_delete(self) -> None:
+        to_update: Recipe = self.create_recipe(user=self.user, title='Old title')
+        to_delete: Recipe = self.create_recipe(user=self.user)
+        payload: list[dict] = [
+            {'action': 'create', 'data': recipe_payload(title='Created', tags=[{'name': 'Vegan'}])},
+            {'action': 'update', 'id': to_update.id, 'data': {'title': 'New title'}},
+            {'action': 'delete', 'id': to_delete.id},
+        ]
+
+        response: HttpResponse = self.client.post(BULK_URL, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        created: Recipe = Recipe.objects.get(user=self.user, title='Created')
+        self.assertEqual(
+            response.data['results'],
+            [
+                {'action': 'create', 'id': created.id},
+                {'action': 'update', 'id': to_update.id},
+                {'action': 'delete', 'id': to_delete.id},
+            ],
+        )
+        self.assertEqual(list(created.tags.values_list('name', flat=True)), ['Vegan'])
+        to_update.refresh_from_db()
+        self.assertEqual(to_update.title, 'New title')
+        self.assertFalse(Recipe.objects.filter(id=to_delete.id).exists())
+
+    def test_bulk_update_writes_only_changed_fields(self) -> None:
+        first: Recipe = self.create_recipe(user=self.user, title='First')
+        second: Recipe = self.create_recipe(user=self.user, title='Second')
+        payload: list[dict] = [
+            {'action': 'update', 'id': first.id, 'data': {'title': 'First renamed'}},
+            {'action': 'update', 'id': second.id, 'data': {'price': '9.99'}},
+        ]
+        # Changed by someone else after the batch loaded the recipes.
+        original_bulk_update = Recipe.objects.bulk_update
+
+        def concurrent_bulk_update(objs, fields, **kwargs):
+            Recipe.objects.filter(id=first.id).update(price=Decimal('7.00'))
+            Recipe.objects.filter(id=second.id).update(title='Second renamed')
+            return original_bulk_update(objs, fields, **kwargs)
+
+        with mock.patch.object(Recipe.objects, 'bulk_update', side_effect=concurrent_bulk_update):
+            response: HttpResponse = self.client.post(BULK_URL, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual((first.title, first.price), ('First renamed', Decimal('7.00')))
+        self.assertEqual((second.title, second.price), ('Second renamed', Decimal('9.99')))
+
+    def test_bulk_update_replaces_changed_tags_only(self) -> None:
+        tag_lunch: Tag = self.create_tag(name='Lunch', user=self.user)
+        tag_dinner: Tag = self.create_tag(name='Dinner', user=self.user)
+        recipe: Recipe = self.create_recipe(user=self.user)
+        recipe.tags.add(tag_lunch, tag_dinner)
+        kept_link_id: int = Recipe.tags.through.objects.get(recipe=recipe, tag=tag_lunch).id
+        payload: list[dict] = [
+            {'action': 'update', 'id': recipe.id, 'data': {'tags': [{'name': 'Lunch'}, {'name': 'Brunch'}]}},
+        ]
+
+        response: HttpResponse = self.client.post(BULK_URL, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(recipe.tags.values_list('name', flat=True)), {'Lunch', 'Brunch'})
+        self.assertTrue(Recipe.tags.through.objects.filter(id=kept_link_id).exists())
+
+    def test_bulk_errors_reported_per_item_and_nothing_written(self) -> None:
+        other_user: User = self.create_user(email='other@example.com')
+        other_recipe: Recipe = self.create_recipe(user=other_user)
+        recipe: Recipe = self.create_recipe(user=self.user)
+        payload: list[dict] = [
+            {'action': 'create', 'data': recipe_payload(title='Valid')},
+            {'action': 'create', 'data': recipe_payload(price='not a price')},
+            {'action': 'update', 'id': other_recipe.id, 'data': {'title': 'Hijacked'}},
+            {'action': 'delete', 'id': recipe.id},
+            {'action': 'delete', 'id': recipe.id},
+            {'action': 'delete'},
+        ]
+
+        response: HttpResponse = self.client.post(BULK_URL, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors: list[dict] = response.data
+        self.assertEqual(len(errors), len(payload))
+        self.assertEqual(errors[0], {})
+        self.assertIn('price', errors[1]['data'])
+        self.assertIn('id', errors[2])
+        self.assertEqual(errors[3], {})
+        self.assertIn('id', errors[4])
+        self.assertIn('id', errors[5])
+        self.assertFalse(Recipe.objects.filter(title='Valid').exists())
+        self.assertTrue(Recipe.objects.filter(id=recipe.id).exists())
+        other_recipe.refresh_from_db()
+        self.assertNotEqual(other_recipe.title, 'Hijacked')
+
+    @override_settings(RECIPE_BULK_MAX_OPERATIONS=2)
+    def test_bulk_rejects_oversized_batch(self) -> None:
+        payload: list[dict] = [{'action': 'create', 'data': recipe_payload()} for _ in range(3)]
+
+        response: HttpResponse = self.client.post(BULK_URL, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Recipe.objects.exists())
+
+    def test_bulk_create_runs_constant_queries(self) -> None:
+        for size in [1, 200]:
+            with self.subTest(size=size):
+                payload: list[dict] = [
+                    {
+                        'action': 'create',
+                        'data': recipe_payload(
+                            title=f'Recipe {i}',
+                            price=Decimal('2.50'),
+                            tags=[{'name': 'Imported'}, {'name': f'Tag {i % 10}'}],
+                        ),
+                    }
+                    for i in range(size)
+                ]
+                # Lookup, tag upsert, recipe insert, link insert, savepoints.
+                with self.assertQueryBudget(8):
+                    response: HttpResponse = self.client.post(BULK_URL, payload, format='json')
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(len(response.data['results']), size)
@@ -0,0 +1,95 @@
+import csv
+import io
+import json
+from decimal import Decimal
+
+from django.urls import reverse
+from django.http import StreamingHttpResponse
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import User
+from recipe.tests.base import BaseTestCase
+
+
+EXPORT_URL = reverse('recipe:recipe-export')
+
+
+class PublicRecipeExportAPITests(BaseTestCase):
+    def test_auth_required(self) -> None:
+        response = APIClient().get(EXPORT_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class PrivateRecipeExportAPITests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.client: APIClient = APIClient()
+        self.user: User = self.create_user()
+        self.client.force_authenticate(user=self.user)
+
+    def export(self, **params) -> tuple[StreamingHttpResponse, str]:
+        response: StreamingHttpResponse = self.client.get(EXPORT_URL, params)
+
+        return response, b''.join(response.streaming_content).decode()
+
+    def test_export_ndjson(self) -> None:
+        recipe = self.create_recipe(user=self.user, title='Soup', price=Decimal('2.50'))
+        recipe.tags.add(self.create_tag(name='Vegan', user=self.user))
+        self.create_recipe(user=self.create_user(email='other@example.com'))
+
+        response, content = self.export()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertIn('recipes.ndjson', response['Content-Disposition'])
+        rows: list[dict] = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['id'], recipe.id)
+        self.assertEqual(rows[0]['title'], 'Soup')
+        self.assertEqual(rows[0]['price'], '2.50')
+        self.assertEqual(rows[0]['description'], recipe.description)
+        self.assertEqual([tag['name'] for tag in rows[0]['tags']], ['Vegan'])
+
+    def test_export_csv(self) -> None:
+        recipe = self.create_recipe(user=self.user, title='Pie, apple')
+        recipe.tags.add(self.create_tag(name='Sweet', user=self.user), self.create_tag(name='Baked', user=self.user))
+
+        response, content = self.export(export_format='csv')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/csv'))
+        rows: list[dict] = list(csv.DictReader(io.StringIO(content)))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['title'], 'Pie, apple')
+        self.assertEqual(rows[0]['price'], '5.49')
+        self.assertEqual(sorted(rows[0]['tags'].split(';')), ['Baked', 'Sweet'])
+
+    def test_export_applies_filters(self) -> None:
+        self.create_recipe(user=self.user, title='Cheap', price=Decimal('1.00'))
+        self.create_recipe(user=self.user, title='Pricey', price=Decimal('20.00'))
+
+        _, content = self.export(price_max='5')
+
+        self.assertEqual([json.loads(line)['title'] for line in content.splitlines()], ['Cheap'])
+
+    def test_invalid_format_rejected(self) -> None:
+        response = self.client.get(EXPORT_URL, {'export_format': 'xml'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(RECIPE_EXPORT_CHUNK_SIZE=2)
+    def test_tags_loaded_once_per_chunk(self) -> None:
+        recipes = [self.create_recipe(user=self.user, title=f'Recipe {i}') for i in range(5)]
+        for recipe in recipes:
+            recipe.tags.add(self.create_tag(name=f'Tag {recipe.id}', user=self.user))
+
+        with self.assertQueryBudget(4):
+            _, content = self.export()
+
+        rows: list[dict] = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual([row['id'] for row in rows], [recipe.id for recipe in reversed(recipes)])
+        for row in rows:
+            self.assertEqual([tag['name'] for tag in row['tags']], [f"Tag {row['id']}"])
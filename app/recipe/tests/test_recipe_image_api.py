@@ -0,0 +1,249 @@
+import os
+import tempfile
+from io import BytesIO, StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import DatabaseError, transaction
+from django.http import HttpResponse
+from django.test import override_settings
+from django.urls import reverse
+from PIL import Image
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Recipe, User
+from recipe.images import ThumbnailQueue, record_thumbnail, thumbnail_name
+from recipe.serializers import RecipeDetailSerializer
+from recipe.tests.base import BaseTestCase
+
+
+SIZES: dict[str, int] = {'small': 40, 'large': 120}
+
+
+def upload_url(recipe_id: int) -> str:
+    return reverse('recipe:recipe-upload-image', args=[recipe_id])
+
+
+def detail_url(recipe_id: int) -> str:
+    return reverse('recipe:recipe-detail', args=[recipe_id])
+
+
+def make_image(
+    size: tuple[int, int] = (300, 200),
+    image_format: str = 'JPEG',
+    noise: bool = False,
+) -> SimpleUploadedFile:
+    if noise:
+        image: Image.Image = Image.frombytes('RGB', size, os.urandom(size[0] * size[1] * 3))
+    else:
+        image = Image.new('RGB', size, color=(200, 80, 40))
+    content: BytesIO = BytesIO()
+    image.save(content, format=image_format)
+
+    return SimpleUploadedFile(f'photo.{image_format.lower()}', content.getvalue())
+
+
+class RecipeImageTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        media_root: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        media_settings = override_settings(
+            MEDIA_ROOT=media_root.name,
+            RECIPE_IMAGE_SIZES=SIZES,
+            RECIPE_THUMBNAIL_WORKERS=0,
+        )
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+
+        self.client: APIClient = APIClient()
+        self.user: User = self.create_user()
+        self.client.force_authenticate(user=self.user)
+        self.recipe: Recipe = self.create_recipe(user=self.user)
+
+    def upload(self, image: SimpleUploadedFile, recipe_id: int | None = None) -> HttpResponse:
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                upload_url(recipe_id or self.recipe.id),
+                {'image': image},
+                format='multipart',
+            )
+
+
+class RecipeImageUploadTests(RecipeImageTestCase):
+    def test_upload_image(self) -> None:
+        image: SimpleUploadedFile = make_image()
+        image.name = 'photo.png'
+
+        response: HttpResponse = self.upload(image)
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.recipe.refresh_from_db()
+        name: str = self.recipe.image.name
+        self.assertTrue(name.startswith('recipes/') and name.endswith('.jpg'))
+        self.assertEqual(response.data, {'id': self.recipe.id, 'images': {'original': f'/media/{name}'}})
+        self.assertTrue(default_storage.exists(name))
+
+    def test_thumbnails_listed_once_rendered(self) -> None:
+        self.upload(make_image(size=(300, 200)))
+        self.recipe.refresh_from_db()
+
+        response: HttpResponse = self.client.get(detail_url(self.recipe.id))
+
+        self.assertEqual(list(response.data['images']), ['original', 'small', 'large'])
+        for label, max_side in SIZES.items():
+            thumbnail: str = self.recipe.image_sizes[label]
+            self.assertEqual(response.data['images'][label], f'/media/{thumbnail}')
+            with Image.open(default_storage.path(thumbnail)) as image:
+                self.assertEqual(image.format, 'WEBP')
+                self.assertEqual(max(image.size), max_side)
+        self.assertEqual(response.data['images'], RecipeDetailSerializer(self.recipe).data['images'])
+
+    def test_list_includes_images(self) -> None:
+        self.upload(make_image())
+        self.recipe.refresh_from_db()
+
+        response: HttpResponse = self.client.get(reverse('recipe:recipe-list'), {'fields': 'images'})
+
+        self.assertEqual(response.data['results'], [
+            {'images': RecipeDetailSerializer(self.recipe).data['images']},
+        ])
+
+    def test_replacing_image_deletes_previous_files(self) -> None:
+        self.upload(make_image())
+        self.recipe.refresh_from_db()
+        previous: list[str] = [self.recipe.image.name, *self.recipe.image_sizes.values()]
+
+        self.upload(make_image(image_format='PNG'))
+
+        self.recipe.refresh_from_db()
+        self.assertTrue(self.recipe.image.name.endswith('.png'))
+        self.assertEqual(set(self.recipe.image_sizes), set(SIZES))
+        for name in previous:
+            self.assertFalse(default_storage.exists(name))
+
+    def test_deleting_recipe_deletes_files(self) -> None:
+        self.upload(make_image())
+        self.recipe.refresh_from_db()
+        names: list[str] = [self.recipe.image.name, *self.recipe.image_sizes.values()]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(detail_url(self.recipe.id))
+
+        for name in names:
+            self.assertFalse(default_storage.exists(name))
+
+    def test_saving_recipe_keeps_thumbnails(self) -> None:
+        stale: Recipe = Recipe.objects.get(id=self.recipe.id)
+        self.upload(make_image())
+
+        stale.title = 'Renamed'
+        stale.save()
+
+        self.recipe.refresh_from_db()
+        self.assertEqual(self.recipe.title, 'Renamed')
+        self.assertTrue(self.recipe.image)
+        self.assertEqual(set(self.recipe.image_sizes), set(SIZES))
+
+    def test_saving_deleted_recipe_not_reinserted(self) -> None:
+        stale: Recipe = Recipe.objects.get(id=self.recipe.id)
+        Recipe.objects.filter(id=self.recipe.id).delete()
+
+        with self.assertRaises(DatabaseError), transaction.atomic():
+            stale.save()
+        stale.save(force_insert=True)
+
+        self.assertTrue(Recipe.objects.filter(id=self.recipe.id).exists())
+
+    def test_stale_thumbnail_discarded(self) -> None:
+        thumbnail: str = default_storage.save('recipes/old_small.webp', BytesIO(b'stale'))
+
+        record_thumbnail(self.recipe.id, 'recipes/old.jpg', 'small', thumbnail)
+
+        self.recipe.refresh_from_db()
+        self.assertEqual(self.recipe.image_sizes, {})
+        self.assertFalse(default_storage.exists(thumbnail))
+
+    def test_upload_too_large(self) -> None:
+        with override_settings(RECIPE_IMAGE_MAX_BYTES=1000):
+            response: HttpResponse = self.upload(make_image())
+
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.recipe.refresh_from_db()
+        self.assertFalse(self.recipe.image)
+
+    def test_request_announcing_too_large_body_refused(self) -> None:
+        image: SimpleUploadedFile = make_image(size=(200, 200), image_format='PNG', noise=True)
+
+        with (
+            override_settings(RECIPE_IMAGE_MAX_BYTES=1000),
+            mock.patch('recipe.images.RecipeImageUploadHandler.receive_data_chunk') as receive_data_chunk,
+        ):
+            response: HttpResponse = self.upload(image)
+
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        receive_data_chunk.assert_not_called()
+
+    def test_upload_not_an_image(self) -> None:
+        response: HttpResponse = self.upload(SimpleUploadedFile('photo.jpg', b'not an image'))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('image', response.data)
+
+    def test_upload_unsupported_format(self) -> None:
+        response: HttpResponse = self.upload(make_image(image_format='BMP'))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_upload_too_many_pixels(self) -> None:
+        with override_settings(RECIPE_IMAGE_MAX_PIXELS=100 * 100):
+            response: HttpResponse = self.upload(make_image(size=(101, 100)))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_upload_other_users_recipe(self) -> None:
+        other: Recipe = self.create_recipe(user=self.create_user(email='other@example.com'))
+
+        response: HttpResponse = self.upload(make_image(), recipe_id=other.id)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ThumbnailQueueTests(RecipeImageTestCase):
+    @override_settings(RECIPE_THUMBNAIL_WORKERS=1)
+    def test_rendered_in_worker_process(self) -> None:
+        name: str = default_storage.save('recipes/photo.jpg', make_image())
+        queue: ThumbnailQueue = ThumbnailQueue()
+
+        with mock.patch('recipe.images.record_thumbnail') as record:
+            queue.submit(self.recipe.id, name)
+            queue.shutdown()
+
+        self.assertEqual(
+            [call.args for call in record.call_args_list],
+            [(self.recipe.id, name, label, thumbnail_name(name, label)) for label in SIZES],
+        )
+        for label in SIZES:
+            self.assertTrue(Path(default_storage.path(thumbnail_name(name, label))).exists())
+
+
+class RequeueThumbnailsCommandTests(RecipeImageTestCase):
+    def test_missing_thumbnails_rendered(self) -> None:
+        self.upload(make_image())
+        self.recipe.refresh_from_db()
+        # As if the worker had restarted before rendering the large size.
+        Recipe.objects.filter(id=self.recipe.id).update(image_sizes={'small': self.recipe.image_sizes['small']})
+        complete: Recipe = self.create_recipe(user=self.user)
+        self.upload(make_image(), recipe_id=complete.id)
+        self.create_recipe(user=self.user)
+
+        with mock.patch('recipe.images.record_thumbnail', wraps=record_thumbnail) as record:
+            call_command('requeue_thumbnails', stdout=StringIO())
+
+        self.assertEqual({call.args[0] for call in record.call_args_list}, {self.recipe.id})
+        self.recipe.refresh_from_db()
+        self.assertEqual(set(self.recipe.image_sizes), set(SIZES))
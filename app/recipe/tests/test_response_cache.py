@@ -0,0 +1,103 @@
+from django.urls import reverse
+from django.http import HttpResponse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Recipe, Tag, User
+from recipe.cache import stats
+from recipe.tests.base import BaseTestCase
+
+
+RECIPES_URL = reverse('recipe:recipe-list')
+TAGS_URL = reverse('recipe:tag-list')
+BULK_URL = reverse('recipe:recipe-bulk')
+CACHE_STATS_URL = reverse('recipe:cache-stats')
+
+
+def detail_url(recipe_id: int) -> str:
+    return reverse('recipe:recipe-detail', args=[recipe_id])
+
+
+class ResponseCacheTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.client: APIClient = APIClient()
+        self.user: User = self.create_user()
+        self.client.force_authenticate(user=self.user)
+        stats.reset()
+
+    def test_repeated_list_served_from_cache(self) -> None:
+        self.create_recipe(user=self.user)
+
+        first: HttpResponse = self.client.get(RECIPES_URL)
+        with self.assertQueryBudget(0):
+            second: HttpResponse = self.client.get(RECIPES_URL)
+
+        self.assertEqual(first['X-Cache'], 'MISS')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(stats.as_dict(), {'hits': 1, 'misses': 1})
+
+    def test_recipe_write_invalidates_cached_list(self) -> None:
+        recipe: Recipe = self.create_recipe(user=self.user, title='Old title')
+        self.client.get(RECIPES_URL)
+
+        self.client.patch(detail_url(recipe.id), {'title': 'New title'})
+        response: HttpResponse = self.client.get(RECIPES_URL)
+
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['results'][0]['title'], 'New title')
+
+    def test_tag_link_change_invalidates_cached_detail(self) -> None:
+        recipe: Recipe = self.create_recipe(user=self.user)
+        self.client.get(detail_url(recipe.id))
+
+        recipe.tags.add(self.create_tag(name='Vegan', user=self.user))
+        response: HttpResponse = self.client.get(detail_url(recipe.id))
+
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual([tag['name'] for tag in response.data['tags']], ['Vegan'])
+
+    def test_tag_rename_invalidates_cached_tags(self) -> None:
+        tag: Tag = self.create_tag(name='Vegan', user=self.user)
+        self.client.get(TAGS_URL)
+
+        tag.name = 'Vegetarian'
+        tag.save()
+        response: HttpResponse = self.client.get(TAGS_URL)
+
+        self.assertEqual(response.data['results'][0]['name'], 'Vegetarian')
+
+    def test_bulk_write_invalidates_cached_list(self) -> None:
+        self.client.get(RECIPES_URL)
+
+        self.client.post(
+            BULK_URL,
+            [{'action': 'create', 'data': {'title': 'Bulk', 'price': '1.00', 'time_minutes': 5}}],
+            format='json',
+        )
+        response: HttpResponse = self.client.get(RECIPES_URL)
+
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_cache_is_per_user(self) -> None:
+        self.create_recipe(user=self.user)
+        self.client.get(RECIPES_URL)
+        other_user: User = self.create_user(email='other@example.com')
+        self.client.force_authenticate(user=other_user)
+
+        response: HttpResponse = self.client.get(RECIPES_URL)
+
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['results'], [])
+
+    def test_cache_stats_admin_only(self) -> None:
+        response: HttpResponse = self.client.get(CACHE_STATS_URL)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.user.is_staff = True
+        self.client.get(RECIPES_URL)
+        response = self.client.get(CACHE_STATS_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'hits': 0, 'misses': 1})
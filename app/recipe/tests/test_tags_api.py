@@ -1,11 +1,12 @@
 from django.urls import reverse
 from django.http import HttpResponse
+from django.test import override_settings
 
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from core.models import Tag, User
-from recipe.serializers import TagSerializer
+from recipe.serializers import TagDetailSerializer
 from recipe.tests.base import BaseTestCase
 
 
@@ -18,6 +19,7 @@ def detail_url(tag_id: int) -> str:
 
 class PublicTagAPITests(BaseTestCase):
     def setUp(self) -> None:
+        super().setUp()
         self.client: APIClient = APIClient()
 
     def test_auth_required(self) -> None:
@@ -28,6 +30,7 @@ class PublicTagAPITests(BaseTestCase):
 
 class PrivateTagAPITest(BaseTestCase):
     def setUp(self) -> None:
+        super().setUp()
         self.client: APIClient = APIClient()
         self.user: User = self.create_user()
         self.client.force_authenticate(user=self.user)
@@ -38,10 +41,10 @@ class PrivateTagAPITest(BaseTestCase):
 
         response: HttpResponse = self.client.get(TAGS_URL)
         tags: list[Tag] = Tag.objects.all().order_by('-name')
-        serializer: TagSerializer = TagSerializer(tags, many=True)
+        serializer: TagDetailSerializer = TagDetailSerializer(tags, many=True)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(response.data['results'], serializer.data)
 
     def test_tags_limited_to_user(self) -> None:
         other_user: User = self.create_user(email='other.user@example.com')
@@ -50,21 +53,46 @@ class PrivateTagAPITest(BaseTestCase):
         response: HttpResponse = self.client.get(TAGS_URL)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['id'], tag.id)
-        self.assertEqual(response.data[0]['name'], tag.name)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['id'], tag.id)
+        self.assertEqual(response.data['results'][0]['name'], tag.name)
+
+    @override_settings(API_PAGE_SIZE=2)
+    def test_list_tags_paginated_by_cursor(self) -> None:
+        for name in ['Breakfast', 'Dessert', 'Lunch', 'Vegan', 'Dinner']:
+            self.create_tag(name=name, user=self.user)
+
+        names: list[str] = []
+        url: str | None = TAGS_URL
+        while url:
+            response: HttpResponse = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            names.extend(tag['name'] for tag in response.data['results'])
+            url = response.data['next']
+
+        self.assertEqual(names, ['Vegan', 'Lunch', 'Dinner', 'Dessert', 'Breakfast'])
 
     def test_update_tag(self) -> None:
         tag: Tag = self.create_tag(name='After Dinner', user=self.user)
         payload: dict = {'name': 'Dessert'}
         url: str = detail_url(tag.id)
         response: HttpResponse = self.client.patch(url, payload)
-        serializer: TagSerializer = TagSerializer(tag)
+        serializer: TagDetailSerializer = TagDetailSerializer(tag)
         tag.refresh_from_db()
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data, serializer.data)
 
+    def test_rename_tag_to_existing_name_error(self) -> None:
+        self.create_tag(name='Dessert', user=self.user)
+        tag: Tag = self.create_tag(name='After Dinner', user=self.user)
+        url: str = detail_url(tag.id)
+        response: HttpResponse = self.client.patch(url, {'name': 'Dessert'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        tag.refresh_from_db()
+        self.assertEqual(tag.name, 'After Dinner')
+
     def test_delete_tag(self) -> None:
         tag: Tag = self.create_tag(name='After Dinner', user=self.user)
         url: str = detail_url(tag.id)
@@ -72,3 +100,60 @@ class PrivateTagAPITest(BaseTestCase):
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(Tag.objects.filter(user=self.user).exists())
+
+    def test_recipe_count_follows_recipe_changes(self) -> None:
+        recipes_url: str = reverse('recipe:recipe-list')
+        response: HttpResponse = self.client.post(
+            recipes_url,
+            {'title': 'Soup', 'time_minutes': 5, 'price': '1.00', 'tags': [{'name': 'Vegan'}, {'name': 'Dinner'}]},
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        recipe_url: str = reverse('recipe:recipe-detail', args=[response.data['id']])
+
+        counts: dict[str, int] = {tag['name']: tag['recipe_count'] for tag in self.client.get(TAGS_URL).data['results']}
+        self.assertEqual(counts, {'Vegan': 1, 'Dinner': 1})
+
+        self.client.patch(recipe_url, {'tags': [{'name': 'Vegan'}]}, format='json')
+        counts = {tag['name']: tag['recipe_count'] for tag in self.client.get(TAGS_URL).data['results']}
+        self.assertEqual(counts, {'Vegan': 1, 'Dinner': 0})
+
+        self.client.delete(recipe_url)
+        counts = {tag['name']: tag['recipe_count'] for tag in self.client.get(TAGS_URL).data['results']}
+        self.assertEqual(counts, {'Vegan': 0, 'Dinner': 0})
+
+    def test_filter_assigned_only(self) -> None:
+        assigned: Tag = self.create_tag(name='Vegan', user=self.user)
+        self.create_tag(name='Dinner', user=self.user)
+        recipe = self.create_recipe(user=self.user)
+        recipe.tags.add(assigned)
+
+        response: HttpResponse = self.client.get(TAGS_URL, {'assigned_only': '1'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([tag['id'] for tag in response.data['results']], [assigned.id])
+        self.assertEqual(response.data['results'][0]['recipe_count'], 1)
+
+    def test_filter_assigned_only_invalid(self) -> None:
+        response: HttpResponse = self.client.get(TAGS_URL, {'assigned_only': 'maybe'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_recipe_count_read_only(self) -> None:
+        tag: Tag = self.create_tag(name='Vegan', user=self.user)
+
+        response: HttpResponse = self.client.patch(detail_url(tag.id), {'recipe_count': 10})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        tag.refresh_from_db()
+        self.assertEqual(tag.recipe_count, 0)
+
+    @override_settings(API_PAGE_SIZE=1)
+    def test_list_with_count(self) -> None:
+        self.create_tag(name='Vegan', user=self.user)
+        self.create_tag(name='Dinner', user=self.user)
+
+        response: HttpResponse = self.client.get(TAGS_URL, {'with_count': 'true'})
+
+        self.assertEqual((response.data['count'], response.data['count_exact']), (2, True))
+        self.assertEqual(len(response.data['results']), 1)
@@ -0,0 +1,27 @@
+"""
+Thumbnail rendering, run in worker processes by `recipe.images.ThumbnailQueue`.
+
+Only depends on Pillow, so spawned workers start without loading Django.
+"""
+import os
+
+from PIL import Image, ImageOps
+
+
+THUMBNAIL_FORMAT: str = 'WEBP'
+THUMBNAIL_QUALITY: int = 80
+
+
+def make_thumbnail(source: str, max_side: int, target: str) -> None:
+    """Write `source` scaled to fit within `max_side` pixels to `target`."""
+    with Image.open(source) as image:
+        # Lets the JPEG decoder skip straight to a reduced scale.
+        image.draft('RGB', (max_side, max_side))
+        thumbnail: Image.Image = ImageOps.exif_transpose(image)
+        thumbnail.thumbnail((max_side, max_side))
+        thumbnail = thumbnail.convert('RGBA' if thumbnail.has_transparency_data else 'RGB')
+
+    # Write then rename, so the file is never served half written.
+    temporary: str = f'{target}.tmp'
+    thumbnail.save(temporary, format=THUMBNAIL_FORMAT, quality=THUMBNAIL_QUALITY)
+    os.replace(temporary, target)
@@ -2,7 +2,7 @@ from django.urls import path, include
 
 from rest_framework.routers import DefaultRouter
 
-from recipe import views
+from recipe import async_views, views
 
 
 router: DefaultRouter = DefaultRouter()
@@ -13,4 +13,9 @@ app_name: str = 'recipe'
 
 urlpatterns: list = [
     path(route='', view=include(router.urls)),
+    path(route='cache-stats/', view=views.ResponseCacheStatsView.as_view(), name='cache-stats'),
+    path(route='async/recipes/', view=async_views.recipe_list, name='async-recipe-list'),
+    path(route='async/recipes/<int:pk>/', view=async_views.recipe_detail, name='async-recipe-detail'),
+    path(route='async/tags/', view=async_views.tag_list, name='async-tag-list'),
+    path(route='async/tags/<int:pk>/', view=async_views.tag_detail, name='async-tag-detail'),
 ]
@@ -1,45 +1,197 @@
+from django.conf import settings
 from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
 
 from rest_framework import (
     viewsets,
     mixins,
+    status,
 )
-from rest_framework.authentication import TokenAuthentication
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from rest_framework.views import APIView
 
+from core.authentication import CachedTokenAuthentication
 from core.models import Recipe, Tag
+from core.openapi import OpenApiTypes, extend_schema, extend_schema_view
 from recipe import serializers
+from recipe.cache import stats as response_cache_stats
+from recipe.export import CONTENT_TYPES, EXPORT_FIELDS, RecipeExportSerializer, export_recipes
+from recipe.fieldsets import SparseFieldsSerializer
+from recipe.filters import (
+    RecipeFilterBackend,
+    RecipeFilterSerializer,
+    TagFilterBackend,
+    TagFilterSerializer,
+)
+from recipe.images import RecipeImageUploadHandler
+from recipe.mixins import (
+    CachedResponseMixin,
+    ConditionalResponseMixin,
+)
+from recipe.pagination import (
+    RecipeCursorPagination,
+    TagCursorPagination,
+)
+from recipe.search import RecipeSearchFilter, RecipeSearchSerializer
 
 
-class RecipeViewSet(viewsets.ModelViewSet):
+@extend_schema_view(
+    list=extend_schema(
+        parameters=[RecipeFilterSerializer, RecipeSearchSerializer, SparseFieldsSerializer],
+        responses=serializers.RecipeSerializer,
+    ),
+    retrieve=extend_schema(
+        parameters=[SparseFieldsSerializer],
+        responses=serializers.RecipeDetailSerializer,
+    ),
+)
+class RecipeViewSet(
+    ConditionalResponseMixin,
+    CachedResponseMixin,
+    viewsets.ModelViewSet,
+):
     serializer_class = serializers.RecipeDetailSerializer
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
+    pagination_class = RecipeCursorPagination
+    filter_backends = [RecipeFilterBackend, RecipeSearchFilter]
     queryset = Recipe.objects.all()
 
     def get_queryset(self) -> QuerySet:
-        return self.queryset.filter(user=self.request.user).order_by('-id')
+        queryset: QuerySet = self.queryset.filter(user=self.request.user).order_by('-id')
+        if self.action in ('list', 'retrieve'):
+            return queryset.values(*self.get_serializer_class().get_value_fields(self.get_selected_fields()))
+        if self.action == 'export':
+            return queryset.values(*self.get_serializer_class().get_value_fields(EXPORT_FIELDS))
+        if self.action == 'upload_image':
+            return queryset.only('id', 'user', 'image', 'image_sizes')
+
+        return queryset.defer('search_vector').prefetch_related('tags')
+
+    def get_selected_fields(self) -> list[str] | None:
+        """Fields requested with `?fields=` on list and retrieve, if any."""
+        if not hasattr(self, '_selected_fields'):
+            params = SparseFieldsSerializer(
+                data=self.request.query_params,
+                context={'allowed_fields': self.get_serializer_class().Meta.fields},
+            )
+            params.is_valid(raise_exception=True)
+            self._selected_fields: list[str] | None = params.validated_data.get('fields')
+
+        return self._selected_fields
+
+    def get_serializer(self, *args, **kwargs):
+        if self.action in ('list', 'retrieve'):
+            kwargs['fields'] = self.get_selected_fields()
+
+        return super().get_serializer(*args, **kwargs)
 
     def get_serializer_class(self):
         if self.action == 'list':
-            return serializers.RecipeSerializer
+            return serializers.RecipeReadSerializer
+        if self.action in ('retrieve', 'export'):
+            return serializers.RecipeDetailReadSerializer
+        if self.action == 'bulk':
+            return serializers.RecipeBulkOperationSerializer
+        if self.action == 'upload_image':
+            return serializers.RecipeImageSerializer
 
         return self.serializer_class
 
     def perform_create(self, serializer) -> None:
         serializer.save(user=self.request.user)
 
+    @action(detail=False, methods=['post'])
+    def bulk(self, request: Request) -> Response:
+        """Apply a batch of create, update and delete operations atomically."""
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=settings.RECIPE_BULK_MAX_OPERATIONS,
+        )
+        serializer.is_valid(raise_exception=True)
+        results: list[dict] = serializer.save()
+
+        return Response({'results': results}, status=status.HTTP_200_OK)
 
+    @extend_schema(
+        request={'multipart/form-data': serializers.RecipeImageSerializer},
+        responses={status.HTTP_202_ACCEPTED: serializers.RecipeImageSerializer},
+    )
+    @action(detail=True, methods=['post'], url_path='upload-image', parser_classes=[MultiPartParser])
+    def upload_image(self, request: Request, pk: str | None = None) -> Response:
+        """
+        Replace the recipe's image.
+
+        The upload is streamed to disk and thumbnails are rendered in the
+        background; `images` gains a URL for each size once it is ready.
+        """
+        recipe: Recipe = self.get_object()
+        # Must be set before the body is parsed, i.e. before request.data.
+        request._request.upload_handlers = [RecipeImageUploadHandler(request._request)]
+        serializer = self.get_serializer(recipe, data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+    @extend_schema(
+        parameters=[RecipeExportSerializer, RecipeFilterSerializer, RecipeSearchSerializer],
+        responses={(200, content_type): OpenApiTypes.STR for content_type in CONTENT_TYPES.values()},
+    )
+    @action(detail=False, methods=['get'], pagination_class=None)
+    def export(self, request: Request) -> StreamingHttpResponse:
+        """Stream every matching recipe as NDJSON or CSV."""
+        params = RecipeExportSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        export_format: str = params.validated_data['export_format']
+
+        response: StreamingHttpResponse = StreamingHttpResponse(
+            export_recipes(
+                queryset=self.filter_queryset(self.get_queryset()),
+                export_format=export_format,
+                chunk_size=settings.RECIPE_EXPORT_CHUNK_SIZE,
+            ),
+            content_type=CONTENT_TYPES[export_format],
+        )
+        response['Content-Disposition'] = f'attachment; filename="recipes.{export_format}"'
+
+        return response
+
+
+@extend_schema_view(
+    list=extend_schema(parameters=[TagFilterSerializer]),
+)
 class TagViewSet(
+    ConditionalResponseMixin,
+    CachedResponseMixin,
     mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
     mixins.UpdateModelMixin,
     mixins.DestroyModelMixin,
     viewsets.GenericViewSet,
 ):
-    serializer_class = serializers.TagSerializer
-    authentication_classes = [TokenAuthentication]
+    serializer_class = serializers.TagDetailSerializer
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
+    pagination_class = TagCursorPagination
+    filter_backends = [TagFilterBackend]
     queryset = Tag.objects.all()
 
     def get_queryset(self) -> QuerySet:
         return self.queryset.filter(user=self.request.user).order_by('-name')
+
+
+class ResponseCacheStatsView(APIView):
+    """Hit and miss counters of this worker's recipe/tag response cache."""
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(responses=serializers.ResponseCacheStatsSerializer)
+    def get(self, request: Request) -> Response:
+        return Response(response_cache_stats.as_dict())
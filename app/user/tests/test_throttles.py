@@ -0,0 +1,92 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+CREATE_USER_URL = reverse('user:create')
+TOKEN_URL = reverse('user:token')
+
+THROTTLE_RATES: dict[str, str] = {
+    'login_ip': '5/minute',
+    'login_email': '2/minute',
+    'signup_ip': '3/minute',
+    'signup_email': '1/minute',
+}
+
+
+@override_settings(REST_FRAMEWORK={'DEFAULT_THROTTLE_RATES': THROTTLE_RATES, 'NUM_PROXIES': 0})
+class CredentialThrottleTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.client: APIClient = APIClient()
+        get_user_model().objects.create_user(email='test@example.com', password='testpass123')
+
+    def login(self, email: str = 'test@example.com', ip: str = '10.0.0.1', **extra) -> int:
+        response = self.client.post(
+            TOKEN_URL,
+            {'email': email, 'password': 'wrong-password'},
+            REMOTE_ADDR=ip,
+            **extra,
+        )
+
+        return response.status_code
+
+    def test_login_throttled_per_email(self) -> None:
+        statuses: list[int] = [self.login(ip=f'10.0.0.{i}') for i in range(3)]
+
+        self.assertEqual(statuses, [400, 400, 429])
+        self.assertEqual(self.login(email='other@example.com'), status.HTTP_400_BAD_REQUEST)
+
+    def test_login_email_key_ignores_case(self) -> None:
+        self.login(email='test@example.com')
+        self.login(email='TEST@example.com')
+
+        self.assertEqual(self.login(email='Test@Example.com'), status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_login_throttled_per_ip(self) -> None:
+        statuses: list[int] = [self.login(email=f'user{i}@example.com') for i in range(6)]
+
+        self.assertEqual(statuses, [400] * 5 + [429])
+        self.assertEqual(self.login(email='fresh@example.com', ip='10.0.0.2'), status.HTTP_400_BAD_REQUEST)
+
+    def test_forwarded_for_header_ignored_without_proxies(self) -> None:
+        statuses: list[int] = [
+            self.login(email=f'user{i}@example.com', HTTP_X_FORWARDED_FOR=f'192.168.0.{i}')
+            for i in range(6)
+        ]
+
+        self.assertEqual(statuses[-1], status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_throttled_login_skips_password_check(self) -> None:
+        self.login()
+        self.login()
+
+        with mock.patch('user.serializers.authenticate') as authenticate:
+            self.assertEqual(self.login(), status.HTTP_429_TOO_MANY_REQUESTS)
+
+        authenticate.assert_not_called()
+
+    def test_throttled_response_has_retry_after(self) -> None:
+        self.login()
+        self.login()
+
+        response = self.client.post(TOKEN_URL, {'email': 'test@example.com', 'password': 'x'}, REMOTE_ADDR='10.0.0.1')
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn('Retry-After', response)
+
+    def test_signup_throttled_per_email_and_ip(self) -> None:
+        payload: dict = {'email': 'new@example.com', 'password': 'short'}
+
+        self.assertEqual(self.client.post(CREATE_USER_URL, payload).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.post(CREATE_USER_URL, payload).status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+        self.client.post(CREATE_USER_URL, {'email': 'a@example.com', 'password': 'short'})
+        response = self.client.post(CREATE_USER_URL, {'email': 'b@example.com', 'password': 'short'})
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
@@ -0,0 +1,59 @@
+from hashlib import sha256
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.http import HttpRequest
+
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
+from rest_framework.views import APIView
+
+
+class CredentialRateThrottle(SimpleRateThrottle):
+    """
+    Sliding-window throttle for endpoints that hash passwords.
+
+    DRF runs throttles in `APIView.initial()`, before the serializer is
+    validated, so rejected requests never reach the password hasher. Rates are
+    read per request so they follow settings overrides.
+    """
+
+    @property
+    def cache(self) -> BaseCache:
+        return caches[settings.THROTTLE_CACHE_ALIAS]
+
+    def get_rate(self) -> str | None:
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+
+class IPRateThrottle(CredentialRateThrottle):
+    def get_cache_key(self, request: HttpRequest, view: APIView) -> str:
+        return self.cache_format % {'scope': self.scope, 'ident': self.get_ident(request)}
+
+
+class EmailRateThrottle(CredentialRateThrottle):
+    def get_cache_key(self, request: HttpRequest, view: APIView) -> str | None:
+        email: object = request.data.get('email') if hasattr(request.data, 'get') else None
+        if not isinstance(email, str) or not email.strip():
+            return None
+
+        # Hash the address so the cache never holds user emails.
+        ident: str = sha256(email.strip().lower().encode()).hexdigest()
+
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
+
+
+class LoginIPThrottle(IPRateThrottle):
+    scope = 'login_ip'
+
+
+class LoginEmailThrottle(EmailRateThrottle):
+    scope = 'login_email'
+
+
+class SignupIPThrottle(IPRateThrottle):
+    scope = 'signup_ip'
+
+
+class SignupEmailThrottle(EmailRateThrottle):
+    scope = 'signup_email'
@@ -1,6 +1,5 @@
 from rest_framework import (
     generics,
-    authentication,
     permissions,
 )
 from rest_framework.authtoken.views import ObtainAuthToken
@@ -10,23 +9,33 @@ from user.serializers import (
     UserSerializer,
     AuthTokenSerializer,
 )
+from user.throttles import (
+    LoginEmailThrottle,
+    LoginIPThrottle,
+    SignupEmailThrottle,
+    SignupIPThrottle,
+)
 
+from core.authentication import CachedTokenAuthentication
 from core.models import User
 
 
 class CreateUserView(generics.CreateAPIView):
     serializer_class = UserSerializer
+    throttle_classes = [SignupIPThrottle, SignupEmailThrottle]
 
 
 class CreateTokenView(ObtainAuthToken):
     serializer_class = AuthTokenSerializer
     renderer_classes = api_settings.DEFAULT_RENDERER_CLASSES
+    throttle_classes = [LoginIPThrottle, LoginEmailThrottle]
 
 
 class ManagerUserView(generics.RetrieveUpdateAPIView):
     serializer_class = UserSerializer
-    authentication_classes = [authentication.TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
 
     def get_object(self) -> User:
-        return self.request.user
+        # Cached token lookups only carry the user's id and flags.
+        return User.objects.get(pk=self.request.user.pk)